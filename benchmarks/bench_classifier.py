@@ -0,0 +1,91 @@
+"""
+🎀 Microbenchmark for the PokéMeow message classifier.
+
+Replays a recorded JSONL corpus (one message/edit per line) through the
+single-pass classifier and the old inline regex/substring checks, then
+prints messages/sec for both.
+
+    python -m benchmarks.bench_classifier [corpus.jsonl] [--rounds N]
+"""
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+
+from config.straymons.constants import FISH_COLOR
+from utils.pokemeow_classifier import classify_content, classify_embed_parts
+
+DEFAULT_CORPUS = Path(__file__).parent / "corpus" / "pokemeow_sample.jsonl"
+
+
+def load_corpus(path: Path):
+    samples = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            row = json.loads(line)
+            embed = row.get("embed") or {}
+            samples.append(
+                (row.get("content") or "", embed.get("description"), embed.get("color"))
+            )
+    return samples
+
+
+# 🧸 The pre-classifier code path, kept here only as the comparison baseline
+def legacy_classify(content, description, color):
+    username_match = re.search(r":\S+:\s\*\*(.+?)\*\*\swon the battle", content)
+    username = username_match.group(1).lower() if username_match else None
+    pokecoin_match = re.search(r"([\d,]+) PokeCoins", content)
+    pokecoins = (
+        int(pokecoin_match.group(1).replace(",", "")) if pokecoin_match else None
+    )
+
+    desc = description.lower() if description else ""
+    is_mew = "**mew**" in desc or "**shiny mew**" in desc
+    desc = description.lower() if description else ""
+    drop_type = None
+    if "you caught a" in desc:
+        drop_type = "fish" if color == FISH_COLOR else "catch"
+    return username, pokecoins, is_mew, drop_type
+
+
+def new_classify(content, description, color):
+    if description:
+        event = classify_embed_parts(description, color)
+        if event.is_drop_candidate:
+            return event
+    return classify_content(content)
+
+
+def run(fn, samples, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for content, description, color in samples:
+            fn(content, description, color)
+    elapsed = time.perf_counter() - start
+    return (len(samples) * rounds) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("corpus", nargs="?", default=DEFAULT_CORPUS, type=Path)
+    parser.add_argument("--rounds", type=int, default=20_000)
+    args = parser.parse_args()
+
+    samples = load_corpus(args.corpus)
+    print(f"[🎀 BENCH] {len(samples)} messages × {args.rounds} rounds")
+
+    legacy_rate = run(legacy_classify, samples, args.rounds)
+    new_rate = run(new_classify, samples, args.rounds)
+
+    print(f"[🍓 legacy]     {legacy_rate:>12,.0f} msgs/sec")
+    print(f"[🌸 classifier] {new_rate:>12,.0f} msgs/sec")
+    print(f"[💖 speedup]    {new_rate / legacy_rate:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
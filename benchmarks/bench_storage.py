@@ -0,0 +1,265 @@
+"""
+🗄️ Promo lifecycle benchmark: MemoryStorage vs PostgresStorage.
+
+Runs drops → leaderboard → noon announcement for every day of a promo, then
+the final top-3 announcement, through the real record_drop / daily_winner_db /
+set_promo_db functions and announce_daily_winner, and reports the cost per
+operation for each backend.
+
+    python -m benchmarks.bench_storage [--days 12] [--members 50] [--drops 400]
+
+Postgres only runs when --dsn is given, and it DELETES every row from
+clan_promo_events, member_item_drops and daily_item_winners and resets
+current_day, so point it at a scratch database and pass --wipe to confirm:
+
+    python -m benchmarks.bench_storage --dsn postgres://... --wipe
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import utils.announce_daily_winner as announce_module
+from cogs.straymons.promo_refresher import promo_cache
+from config.straymons.constants import (
+    EVENT_NEWS_ID,
+    HUNT_CHANNEL_ID,
+    REPORTS_CHANNEL_ID,
+)
+from utils.bulk_dispatcher import bulk_dispatcher
+from utils.current_day_cache import current_day_cache
+from utils.daily_winner_db import (
+    get_all_winners,
+    get_top_daily_drops,
+    get_top_drops_in_range,
+)
+from utils.drop_counters import drop_counters
+from utils.drop_writer import drop_writer
+from utils.record_drop import get_daily_drops, get_total_drops, record_item_drop
+from utils.set_promo_db import get_promo, set_promo_data
+from utils.storage.memory import MemoryStorage
+from utils.storage.postgres import PostgresStorage
+from utils.storage.queries import PreparedConnection, queries
+from utils.token_bucket import TokenBucket
+
+ASIA_MANILA = announce_module.ASIA_MANILA
+METHODS = ("catch", "battle", "fish")
+
+
+# ————————————————————————————————
+# 🧸 Just enough Discord for announce_daily_winner
+# ————————————————————————————————
+class StubMember:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.roles = []
+
+    async def add_roles(self, *roles):
+        pass
+
+    async def send(self, content=None, **kwargs):
+        pass
+
+
+class StubGuild:
+    def get_role(self, role_id: int):
+        return SimpleNamespace(id=role_id)
+
+    def get_member(self, user_id: int):
+        return StubMember(user_id)
+
+    async def fetch_member(self, user_id: int):
+        return StubMember(user_id)
+
+
+class StubChannel:
+    def __init__(self, channel_id: int, guild: StubGuild):
+        self.id = channel_id
+        self.guild = guild
+
+    async def send(self, content=None, **kwargs):
+        return SimpleNamespace(content=content)
+
+
+class StubBot:
+    def __init__(self, storage, pg_pool=None):
+        self.storage = storage
+        self.pg_pool = pg_pool
+        guild = StubGuild()
+        self.channels = {
+            channel_id: StubChannel(channel_id, guild)
+            for channel_id in (EVENT_NEWS_ID, HUNT_CHANNEL_ID, REPORTS_CHANNEL_ID)
+        }
+
+    def get_channel(self, channel_id: int):
+        return self.channels.get(channel_id)
+
+
+# ————————————————————————————————
+# ⏱️ Per-operation timing
+# ————————————————————————————————
+class Timings:
+    def __init__(self):
+        self.total = defaultdict(float)
+        self.count = defaultdict(int)
+
+    @contextlib.contextmanager
+    def measure(self, op: str, count: int = 1):
+        start = time.perf_counter()
+        yield
+        self.total[op] += time.perf_counter() - start
+        self.count[op] += count
+
+
+def reset_caches(bot):
+    current_day_cache.invalidate()
+    drop_counters.warmed = False
+    drop_writer.max_latency = 0.01
+    drop_writer.start(bot)
+
+
+async def run_lifecycle(bot, args) -> Timings:
+    rng = random.Random(args.seed)
+    timings = Timings()
+    members = [10**17 + i for i in range(args.members)]
+    source_ids = iter(range(10**18, 10**19))
+    reset_caches(bot)
+
+    with timings.measure("set_promo"):
+        await set_promo_data(
+            bot,
+            "Bench Promo",
+            "<:plushie:1>",
+            "a plushie",
+            "https://example.invalid/promo.png",
+            10,
+            10,
+            10,
+            None,
+            0,
+            "Plushie",
+        )
+    with timings.measure("get_promo"):
+        promo_cache.promo = await get_promo(bot)
+
+    for day in range(1, args.days + 2):
+        final = day > args.days
+        if not final:
+            # 💖 A day of drops, skewed so some members clearly lead
+            weights = [rng.paretovariate(1.2) for _ in members]
+            users = rng.choices(members, weights=weights, k=args.drops)
+            with timings.measure("record_item_drop", args.drops):
+                await asyncio.gather(
+                    *(
+                        record_item_drop(
+                            bot, user_id, rng.choice(METHODS), None, next(source_ids)
+                        )
+                        for user_id in users
+                    )
+                )
+
+            # 📊 Drop-track embed lookups and the leaderboard
+            with timings.measure("get_total_drops", len(members)):
+                for user_id in members:
+                    await get_total_drops(bot, user_id)
+            with timings.measure("get_daily_drops", len(members)):
+                for user_id in members:
+                    await get_daily_drops(bot, user_id)
+            with timings.measure("get_top_daily_drops"):
+                await get_top_daily_drops(bot)
+            with timings.measure("get_top_drops_in_range"):
+                await get_top_drops_in_range(bot, days=12)
+
+        # 🕛 Noon: announce_daily_winner works out the day from START_DATE
+        midnight = datetime.now(tz=ASIA_MANILA).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        announce_module.START_DATE = midnight - timedelta(days=day - 1)
+        label = "announce_final" if final else "announce_daily"
+        with timings.measure(label):
+            await announce_module.announce_daily_winner(bot)
+
+    with timings.measure("get_all_winners"):
+        await get_all_winners(bot)
+    await drop_writer.close()
+    return timings
+
+
+async def setup_postgres(args):
+    import asyncpg
+
+    from utils.schema import ensure_schema
+
+    pool = await asyncpg.create_pool(
+        dsn=args.dsn, init=queries.prepare_all, connection_class=PreparedConnection
+    )
+    bot = StubBot(PostgresStorage(pool), pg_pool=pool)
+    await ensure_schema(bot)
+    await bot.storage.reset_promo_data()
+    async with pool.acquire() as conn:
+        await conn.execute("UPDATE current_day SET day_number = 1")
+    return bot, pool
+
+
+async def main_async(args):
+    if args.dsn and not args.wipe:
+        raise SystemExit("--dsn wipes the promo tables; pass --wipe to confirm.")
+    results = {}
+    original_start = announce_module.START_DATE
+    # 🪣 Stub Discord calls cost nothing, so lift the role/DM pacing
+    for kind in bulk_dispatcher.buckets:
+        bulk_dispatcher.buckets[kind] = TokenBucket(1e9, 1e9)
+
+    bot = StubBot(MemoryStorage())
+    with contextlib.redirect_stdout(io.StringIO()):
+        results["memory"] = await run_lifecycle(bot, args)
+
+    if args.dsn:
+        bot, pool = await setup_postgres(args)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                results["postgres"] = await run_lifecycle(bot, args)
+        finally:
+            await pool.close()
+    announce_module.START_DATE = original_start
+
+    backends = list(results)
+    print(f"[🗄️ STORAGE] {args.days} days × {args.drops} drops, {args.members} members")
+    header = f"{'operation':<24}{'ops':>8}" + "".join(
+        f"{name + ' µs/op':>18}" for name in backends
+    )
+    print(header)
+    print("—" * len(header))
+    for op in results["memory"].total:
+        count = results["memory"].count[op]
+        row = f"{op:<24}{count:>8}"
+        for name in backends:
+            timings = results[name]
+            row += f"{timings.total[op] / timings.count[op] * 1e6:>18,.1f}"
+        print(row)
+    for name in backends:
+        total = sum(results[name].total.values())
+        print(f"[⏱️ {name}] lifecycle total {total:.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=12)
+    parser.add_argument("--members", type=int, default=50)
+    parser.add_argument("--drops", type=int, default=400, help="drops per day")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dsn", help="scratch Postgres database to benchmark")
+    parser.add_argument(
+        "--wipe", action="store_true", help="confirm --dsn may be wiped"
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+🗂️ EXPLAIN the hot drop/winner queries with and without the version-3 indexes.
+
+Connects to a scratch Postgres database that has the bot's tables, applies
+pending migrations, then inside ONE transaction that is always rolled back:
+seeds synthetic drops and winners, ANALYZEs, EXPLAINs each registered query
+with the indexes, drops the indexes and EXPLAINs again.
+
+    python -m benchmarks.explain_plans --dsn postgres://... [--drops 200000]
+        [--members 500] [--days 12] [--winners 20000] [--verbose]
+
+DROP INDEX holds an exclusive lock on the tables until the rollback, so don't
+point this at the live database while the bot is running.
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+import asyncpg
+
+from utils.schema import MIGRATIONS, ensure_schema
+from utils.storage.queries import queries
+
+INDEXED_VERSION = 3
+
+# (query name, sample arguments) — the DELETE is only EXPLAINed, never run
+PLANS = [
+    ("delete_latest_drops", lambda args: (10**17 + 7, args.days // 2, 1)),
+    ("top_daily_drops", lambda args: (args.days // 2,)),
+    ("top_drops_in_days", lambda args: (1, args.days, 3)),
+    ("daily_winner_count", lambda args: (10**17 + 7,)),
+    ("get_daily_winner", lambda args: (date(2025, 8, 1),)),
+    ("daily_winner_exists", lambda args: (date(2025, 8, 1),)),
+]
+
+SEED_PARTITIONS = """
+    SELECT ensure_member_item_drops_partition(d) FROM generate_series(1, $1) AS d
+"""
+
+SEED_DROPS = """
+    INSERT INTO member_item_drops (user_id, method, drop_time, day, source_message_id)
+    SELECT
+        (10^17)::bigint + (random() * random() * $2)::int,
+        (ARRAY['catch', 'battle', 'fish'])[1 + (i % 3)],
+        NOW() - make_interval(secs => i),
+        1 + (i % $3),
+        (10^18)::bigint + i
+    FROM generate_series(1, $1) AS i
+"""
+
+SEED_WINNERS = """
+    INSERT INTO daily_item_winners (winner_date, user_id, total_drops, recorded_at)
+    SELECT DATE '2025-08-01' - (i / 5), (10^17)::bigint + i, 5 + i % 20, NOW()
+    FROM generate_series(1, $1) AS i
+    ON CONFLICT DO NOTHING
+"""
+
+
+class Bot:
+    def __init__(self, pool):
+        self.pg_pool = pool
+
+
+def plan_summary(lines):
+    scans = [
+        line.strip().split("  (")[0].lstrip("-> ") for line in lines if "Scan" in line
+    ]
+    return ", ".join(scans) or lines[0].strip()
+
+
+async def explain_all(conn, args):
+    plans = {}
+    for name, make_args in PLANS:
+        sql = queries.sql[name]
+        analyze = "" if sql.lstrip().upper().startswith("DELETE") else "ANALYZE, "
+        rows = await conn.fetch(f"EXPLAIN ({analyze}COSTS OFF) {sql}", *make_args(args))
+        plans[name] = [row[0] for row in rows]
+    return plans
+
+
+async def main_async(args):
+    pool = await asyncpg.create_pool(dsn=args.dsn, min_size=1, max_size=1)
+    try:
+        await ensure_schema(Bot(pool))
+        indexed = next(m for m in MIGRATIONS if m.version == INDEXED_VERSION)
+        index_names = [
+            statement.split("IF NOT EXISTS")[1].split()[0]
+            for statement in indexed.statements
+        ]
+
+        async with pool.acquire() as conn:
+            tx = conn.transaction()
+            await tx.start()
+            try:
+                await conn.execute(SEED_PARTITIONS, args.days)
+                await conn.execute(SEED_DROPS, args.drops, args.members, args.days)
+                await conn.execute(SEED_WINNERS, args.winners)
+                await conn.execute(
+                    "ANALYZE member_item_drops, member_item_daily_counts, daily_item_winners"
+                )
+                with_indexes = await explain_all(conn, args)
+                for index in index_names:
+                    await conn.execute(f"DROP INDEX {index}")
+                without_indexes = await explain_all(conn, args)
+            finally:
+                await tx.rollback()
+    finally:
+        await pool.close()
+
+    print(
+        f"[🗂️ EXPLAIN] {args.drops} drops, {args.members} members, "
+        f"{args.days} days, {args.winners} winner rows (rolled back)"
+    )
+    for name, _ in PLANS:
+        print(f"\n{name}")
+        print(f"  without indexes: {plan_summary(without_indexes[name])}")
+        print(f"  with indexes:    {plan_summary(with_indexes[name])}")
+        if args.verbose:
+            for label, plans in (("without", without_indexes), ("with", with_indexes)):
+                print(f"  —— {label} ——")
+                for line in plans[name]:
+                    print(f"    {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dsn", required=True, help="scratch Postgres database")
+    parser.add_argument("--drops", type=int, default=200_000)
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--days", type=int, default=12)
+    parser.add_argument("--winners", type=int, default=20_000)
+    parser.add_argument("--verbose", action="store_true", help="print full plans")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+🎥 Offline replayer for EventWatcher throughput testing.
+
+Feeds a capture log (written with IGGLY_CAPTURE_PATH, see
+utils/event_capture.py) through EventWatcher.on_message / on_message_edit
+against stub guild/channel/member objects and MemoryStorage, then
+reports events/sec, p50/p99 handler latency and allocations.
+
+    python -m benchmarks.replay_event_watcher capture.jsonl [--loops N]
+        [--force-drops] [--no-cooldown] [--real-pacing] [--seed S]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+import discord
+
+import cogs.straymons.event_watcher as event_watcher_module
+import utils.send_scheduler as send_scheduler_module
+from cogs.straymons.promo_refresher import promo_cache
+from config.straymons.constants import (
+    DONATED_ROLE_ID,
+    HERSHEY_ROLE_ID,
+    HUNT_CHANNEL_ID,
+    POKEMEOW_ID,
+    STRAYMONS_GUILD_ID,
+)
+from utils.current_day_cache import current_day_cache
+from utils.drop_counters import drop_counters
+from utils.drop_writer import MAX_LATENCY, drop_writer
+from utils.hunt_feed import hunt_feed
+from utils.pokemeow_classifier import BATTLE_WIN_RE
+from utils.storage.memory import MemoryStorage
+from utils.token_bucket import TokenBucket
+
+DEFAULT_CAPTURE = Path(__file__).parent / "corpus" / "pokemeow_sample.jsonl"
+
+BENCH_PROMO = {
+    "name": "Replay Promo",
+    "emoji": "<:plushie:1>",
+    "emoji_name": "Plushie",
+    "prize": "nothing, it's a benchmark",
+    "image_url": "https://example.invalid/promo.png",
+    "catch_rate": 10,
+    "battle_rate": 10,
+    "fish_rate": 10,
+}
+
+
+# ————————————————————————————————
+# 🧸 Stubs – just the attributes EventWatcher and the embed builders touch
+# ————————————————————————————————
+message_ids = itertools.count(10**17)
+
+
+class StubMember:
+    def __init__(self, user_id: int, name: str):
+        self.id = user_id
+        self.name = name
+        self.display_name = name
+        self.mention = f"<@{user_id}>"
+        self.display_avatar = SimpleNamespace(url="https://example.invalid/a.png")
+        self.roles = [
+            SimpleNamespace(id=HERSHEY_ROLE_ID),
+            SimpleNamespace(id=DONATED_ROLE_ID),
+        ]
+
+
+class StubChannel:
+    def __init__(self, channel_id: int, guild):
+        self.id = channel_id
+        self.guild = guild
+        self.sent = 0
+        self.authors = {}  # message_id -> author, for fetch_message
+
+    async def send(self, content=None, **kwargs):
+        self.sent += 1
+        return SimpleNamespace(id=next(message_ids), content=content)
+
+    async def fetch_message(self, message_id: int):
+        author = self.authors.get(message_id)
+        if author is None:
+            raise discord.NotFound(SimpleNamespace(status=404, reason="stub"), "stub")
+        return SimpleNamespace(id=message_id, author=author)
+
+
+class StubGuild:
+    def __init__(self):
+        self.id = STRAYMONS_GUILD_ID
+        self.members = {}
+        self.channels = {}
+
+    def get_member(self, user_id: int):
+        return self.members.get(user_id)
+
+    def get_channel(self, channel_id: int):
+        return self.channels.get(channel_id)
+
+    def channel(self, channel_id: int) -> StubChannel:
+        if channel_id not in self.channels:
+            self.channels[channel_id] = StubChannel(channel_id, self)
+        return self.channels[channel_id]
+
+
+# ————————————————————————————————
+# 🎬 Building the replay world from a capture
+# ————————————————————————————————
+def load_events(path: Path):
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                events.append(json.loads(line))
+    return events
+
+
+def build_world(events):
+    guild = StubGuild()
+    guild.channel(HUNT_CHANNEL_ID)
+    pokemeow = SimpleNamespace(id=POKEMEOW_ID, name="PokéMeow")
+    default_channel_id = 1
+
+    owners = {}  # channel_id -> user_id
+    synthetic_ids = itertools.count(10**15)
+
+    def member_for(user_id, name=None):
+        if user_id not in guild.members:
+            guild.members[user_id] = StubMember(user_id, name or f"member{user_id}")
+        return guild.members[user_id]
+
+    for event in events:
+        channel_id = event.get("channel_id") or default_channel_id
+        author_id = event.get("reference_author_id")
+        match = BATTLE_WIN_RE.search(event.get("content") or "")
+        if match:
+            name = match.group(1)
+            existing = next(
+                (m for m in guild.members.values() if m.name.lower() == name.lower()),
+                None,
+            )
+            author_id = existing.id if existing else next(synthetic_ids)
+            member_for(author_id, name)
+        elif author_id is not None:
+            member_for(author_id)
+        if author_id is not None:
+            owners.setdefault(channel_id, author_id)
+
+    # Channels whose events never named an author still need an owner
+    for event in events:
+        channel_id = event.get("channel_id") or default_channel_id
+        if channel_id not in owners:
+            owners[channel_id] = member_for(next(synthetic_ids)).id
+
+    messages = []
+    for event in events:
+        channel = guild.channel(event.get("channel_id") or default_channel_id)
+        embed = event.get("embed")
+        embeds = []
+        if embed:
+            embeds.append(
+                discord.Embed(
+                    description=embed.get("description"), color=embed.get("color")
+                )
+            )
+        reference = None
+        if event.get("kind") == "edit":
+            reference_id = event.get("reference_id") or next(message_ids)
+            author = guild.members[
+                event.get("reference_author_id") or owners[channel.id]
+            ]
+            channel.authors[reference_id] = author
+            reference = SimpleNamespace(message_id=reference_id, resolved=None)
+        messages.append(
+            (
+                event.get("kind", "message"),
+                SimpleNamespace(
+                    id=event.get("message_id") or next(message_ids),
+                    guild=guild,
+                    channel=channel,
+                    author=pokemeow,
+                    content=event.get("content") or "",
+                    embeds=embeds,
+                    reference=reference,
+                ),
+            )
+        )
+    return guild, owners, messages
+
+
+def prepare_watcher(bot, guild, owners, cooldown: bool = True):
+    watcher = event_watcher_module.EventWatcher(bot)
+    if not cooldown:
+        watcher.drop_cooldowns.cooldown = 0  # every stamp has already expired
+    for member in guild.members.values():
+        watcher.whitelisted_members.add(member.id)
+        watcher.usernames.set(member.id, member.name)
+    watcher.member_channels = {
+        user_id: channel_id for channel_id, user_id in owners.items()
+    }
+    for user_id in watcher.member_channels:
+        watcher.index_personal_channel(user_id)
+    return watcher
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def replay(watcher, messages, loops: int):
+    latencies = []
+    for loop_index in range(loops):
+        # Fresh message ids and cooldowns each loop so idempotency and the
+        # previous loop's stamps don't swallow the replay
+        offset = loop_index * 10**12
+        watcher.drop_cooldowns.entries.clear()
+        for kind, message in messages:
+            message = SimpleNamespace(**{**vars(message), "id": message.id + offset})
+            start = time.perf_counter()
+            if kind == "edit":
+                await watcher.on_message_edit(message, message)
+                await watcher.edit_dispatcher.close()
+            else:
+                await watcher.on_message(message)
+            latencies.append(time.perf_counter() - start)
+    await hunt_feed.close()
+    return latencies
+
+
+async def main_async(args):
+    random.seed(args.seed)
+    events = load_events(args.capture)
+    guild, owners, messages = build_world(events)
+
+    if not args.real_pacing:
+        # bucket_for() reads these at call time; the singleton is shared by import
+        send_scheduler_module.CHANNEL_RATE = send_scheduler_module.CHANNEL_BURST = 1e9
+        send_scheduler_module.send_scheduler.buckets.clear()
+        send_scheduler_module.send_scheduler.global_bucket = TokenBucket(1e9, 1e9)
+    hunt_feed.enabled = args.real_pacing
+
+    promo = dict(BENCH_PROMO)
+    if args.force_drops:
+        promo.update(catch_rate=1, battle_rate=1, fish_rate=1)
+    promo_cache.promo = promo
+    current_day_cache.set(1)
+    drop_counters.clear()
+
+    # 🧸 Drops go through the real record_item_drop → DropWriter → MemoryStorage
+    storage = MemoryStorage()
+    bot = SimpleNamespace(guilds=[guild], storage=storage)
+    drop_writer.max_latency = MAX_LATENCY if args.real_pacing else 0
+
+    watcher = prepare_watcher(bot, guild, owners, cooldown=not args.no_cooldown)
+    quiet = contextlib.redirect_stdout(io.StringIO())
+
+    # ⏱️ Timing pass
+    with quiet:
+        start = time.perf_counter()
+        latencies = await replay(watcher, messages, args.loops)
+        elapsed = time.perf_counter() - start
+
+    # 🧠 Allocation pass (tracemalloc slows things down, so it runs separately)
+    dropped = len(storage.drops)
+    watcher = prepare_watcher(bot, guild, owners, cooldown=not args.no_cooldown)
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        await replay(watcher, messages, 1)
+        await drop_writer.close()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = len(latencies)
+    print(f"[🎥 REPLAY] {len(events)} captured events × {args.loops} loops")
+    print(
+        f"[🌸 throughput] {total / elapsed:,.0f} events/sec, "
+        f"{dropped} drops recorded ({dropped / elapsed:,.0f}/sec) in {elapsed:.2f}s"
+    )
+    print(f"[⏱️ p50]        {percentile(latencies, 50) * 1e6:,.1f} µs")
+    print(f"[⏱️ p99]        {percentile(latencies, 99) * 1e6:,.1f} µs")
+    print(f"[⏱️ mean]       {statistics.fmean(latencies) * 1e6:,.1f} µs")
+    print(
+        f"[🧠 memory]     peak {peak / 1024:,.1f} KiB, retained {current / 1024:,.1f} KiB "
+        f"over {len(messages)} events"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("capture", nargs="?", default=DEFAULT_CAPTURE, type=Path)
+    parser.add_argument("--loops", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--force-drops", action="store_true", help="set every rate to 1 (always drop)"
+    )
+    parser.add_argument(
+        "--no-cooldown",
+        action="store_true",
+        help="disable the per-user drop cooldown (pair with --force-drops)",
+    )
+    parser.add_argument(
+        "--real-pacing",
+        action="store_true",
+        help="keep Discord rate-limit pacing and hunt-feed batching",
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
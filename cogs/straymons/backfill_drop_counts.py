@@ -0,0 +1,35 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from config.straymons.constants import *
+from utils.drop_counters import drop_counters
+from utils.storage.get_storage import get_storage
+
+
+class BackfillDropCountsCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.guilds(discord.Object(id=STRAYMONS_GUILD_ID))
+    @app_commands.command(
+        name="backfill-drop-counts",
+        description="Rebuild the per-day plushie leaderboard counts from member_item_drops",
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def backfill_drop_counts(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+
+        # 📊 Recount member_item_daily_counts, then resync the in-memory counters
+        rows = await get_storage(self.bot).rebuild_daily_counts()
+        drifted = await drop_counters.reconcile(self.bot)
+
+        await interaction.followup.send(
+            f"Rebuilt {rows} (day, member) leaderboard counts "
+            f"({drifted} in-memory counters corrected).",
+            ephemeral=True,
+        )
+
+
+async def setup(bot):
+    await bot.add_cog(BackfillDropCountsCog(bot))
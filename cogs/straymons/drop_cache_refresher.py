@@ -0,0 +1,71 @@
+from discord.ext import commands, tasks
+
+from utils.current_day_cache import current_day_cache
+from utils.drop_counters import drop_counters
+from utils.storage.get_storage import get_storage
+from utils.storage.queries import queries
+from utils.visuals.iggly_log_helpers import iggly_log
+
+
+# ————————————————————————————————
+# 📅 Drop Cache Refresher Cog – Loads and safety-polls drop-path caches
+# ————————————————————————————————
+class DropCacheRefresher(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.poll_current_day.start()
+        self.reconcile_drop_counters.start()
+
+    def cog_unload(self):
+        self.poll_current_day.cancel()
+        self.reconcile_drop_counters.cancel()
+
+    # 🐢 Slow safety poll; increment_day_number already updates the cache directly.
+    # Also keeps today's and tomorrow's drop partitions in place.
+    @tasks.loop(minutes=15)
+    async def poll_current_day(self):
+        # 🛟 One failed run (DB hiccup) mustn't stop the loop for good
+        try:
+            day_number = await current_day_cache.refresh(self.bot)
+            if day_number is not None:
+                await get_storage(self.bot).prepare_day(day_number)
+        except Exception as e:
+            iggly_log(
+                "error",
+                f"current_day poll failed: {e}",
+                label="DropCacheRefresher",
+                include_trace=True,
+            )
+
+    @poll_current_day.before_loop
+    async def before_poll_current_day(self):
+        await self.bot.wait_until_ready()
+        print("[📅 DAY CACHE] Starting current_day safety poll...")
+
+    # 🧮 First run warms the drop counters, later runs reconcile them with Postgres
+    # (and log per-query and pool stats alongside)
+    @tasks.loop(minutes=30)
+    async def reconcile_drop_counters(self):
+        try:
+            await drop_counters.reconcile(self.bot)
+            queries.summary()
+            self.bot.pg_pool.summary()
+        except Exception as e:
+            iggly_log(
+                "error",
+                f"Drop counter reconciliation failed: {e}",
+                label="DropCacheRefresher",
+                include_trace=True,
+            )
+
+    @reconcile_drop_counters.before_loop
+    async def before_reconcile_drop_counters(self):
+        await self.bot.wait_until_ready()
+        print("[🧮 DROP COUNTERS] Starting drop counter reconciliation loop...")
+
+
+# ————————————————————————————————
+# 🎀 Cog Setup – Adds DropCacheRefresher cog to the bot
+# ————————————————————————————————
+async def setup(bot):
+    await bot.add_cog(DropCacheRefresher(bot))
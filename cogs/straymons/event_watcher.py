@@ -1,7 +1,5 @@
-import asyncio
 import random
-import re
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from zoneinfo import ZoneInfo
 
 import discord
@@ -11,12 +9,30 @@ from cogs.straymons.promo_refresher import promo_cache  # 🎀 Import existing p
 from config.guild_ids import *
 from config.straymons.constants import *
 from config.straymons.emojis import Emojis
+from utils.cooldowns import CooldownCache
+from utils.drop_writer import drop_writer
+from utils.edit_dispatcher import EditDispatcher
+from utils.event_capture import event_capture
+from utils.hunt_feed import hunt_feed
+from utils.message_author_cache import MessageAuthorCache
+from utils.pokemeow_classifier import (
+    PokeMeowEvent,
+    PokeMeowEventKind,
+    classify_content,
+    classify_embed,
+)
+from utils.processed_messages import ProcessedMessageSet
 from utils.record_drop import record_item_drop
+from utils.send_scheduler import send_scheduler
+from utils.storage.queries import queries
+from utils.username_index import UsernameIndex
 from utils.visuals.clan_promo_embeds import build_drop_track_embed
 
 # 💗 Asia Manila timezone for any date/time operations
 ASIA_MANILA = ZoneInfo("Asia/Manila")
 
+DROP_COOLDOWN_SECONDS = 1.0  # ⏳ Minimum gap between rolls for the same member
+
 
 # ————————————————————————————————
 # 🎀 EventWatcher Cog – Listens for PokéMeow messages & handles plushie drops
@@ -27,18 +43,58 @@ class EventWatcher(commands.Cog):
         self.whitelisted_members = set()  # 🧂 Your whitelist cache
         self.personal_channel_cache: Dict[int, int] = {}  # member_id -> channel_id
         self.personal_channels: Dict[int, int] = {}  # user_id -> channel_id
-        self.usernames: Dict[int, str] = {}  # user_id -> display_name
-        self.reverse_usernames: Dict[str, int] = {}  # display_name -> user_id
-
-    # Build or rebuild reverse username cache from current usernames
+        self.channel_owners: Dict[int, int] = {}  # channel_id -> user_id
+        self.member_channels: Dict[int, int] = {}  # all straymons_members rows
+        self.usernames = UsernameIndex()  # user_id <-> casefolded username
+        # ⏳ Shared per-user cooldowns for the hershey and NPC paths
+        self.drop_cooldowns = CooldownCache(cooldown=DROP_COOLDOWN_SECONDS)
+        # 🎐 Replaces the old random jitter sleep on every edit
+        self.edit_dispatcher = EditDispatcher(self.dispatch_hershey_edit)
+        # 💬 Recent message authors in watched channels (avoids fetch_message)
+        self.message_authors = MessageAuthorCache()
+        # 🔁 Source message ids that already had their roll
+        self.processed_messages = ProcessedMessageSet()
+
+    async def cog_load(self):
+        # 🧺 Start the batched drop writer alongside the watcher
+        drop_writer.start(self.bot)
+
+    async def cog_unload(self):
+        # 🌙 Make sure queued edits and drops land before shutdown/reload
+        await self.edit_dispatcher.close()
+        await drop_writer.close()
+        await hunt_feed.close()
+        event_capture.close()
 
     def is_straymons_guild(self, guild: discord.Guild | None):
         return guild and guild.id == STRAYMONS_GUILD_ID
 
-    def build_reverse_username_cache(self):
-        self.reverse_usernames = {
-            username.lower(): user_id for user_id, username in self.usernames.items()
-        }
+    # 🧭 Keep personal_channels and its channel -> owner index in sync
+    def index_personal_channel(self, user_id: int):
+        channel_id = self.member_channels.get(user_id)
+        if channel_id is None or user_id not in self.whitelisted_members:
+            return
+        old_channel_id = self.personal_channels.get(user_id)
+        if old_channel_id is not None and old_channel_id != channel_id:
+            self.channel_owners.pop(old_channel_id, None)
+        self.personal_channels[user_id] = channel_id
+        self.channel_owners[channel_id] = user_id
+
+    def unindex_personal_channel(self, user_id: int):
+        channel_id = self.personal_channels.pop(user_id, None)
+        if channel_id is not None and self.channel_owners.get(channel_id) == user_id:
+            self.channel_owners.pop(channel_id)
+
+    # 🔄 Reload straymons_members and rebuild the channel index for whitelisted members
+    async def reload_personal_channels(self):
+        async with self.bot.pg_pool.acquire() as conn:
+            rows = await queries.fetch(conn, "member_channels")
+
+        self.member_channels = {row["user_id"]: row["channel_id"] for row in rows}
+        self.personal_channels = {}
+        self.channel_owners = {}
+        for user_id in self.whitelisted_members:
+            self.index_personal_channel(user_id)
 
     # 💌 Handle new messages, only from PokéMeow bot
     async def handle_new_message(self, message: discord.Message):
@@ -63,37 +119,39 @@ class EventWatcher(commands.Cog):
         if not promo_cache.is_promo_active():
             return
 
-        promo = promo_cache.promo
-        await self.process_hershey_drops(message, promo)
+        if not message.reference or not message.embeds:
+            return
 
-    async def process_npc_drops(self, message: discord.Message, promo: Dict[str, Any]):
-        def extract_username_and_pokecoins(content: str):
-            # Extract username inside ** **
-            username_match = re.search(r":\S+:\s\*\*(.+?)\*\*\swon the battle", content)
-            username = username_match.group(1).lower() if username_match else None
-
-            # Check for PokéCoins amount like "1,180 PokeCoins"
-            pokecoin_match = re.search(r"([\d,]+) PokeCoins", content)
-            pokecoin_amount = (
-                int(pokecoin_match.group(1).replace(",", ""))
-                if pokecoin_match
-                else None
-            )
-            pokecoin_present = pokecoin_amount is not None
+        # 🍬 Parse the embed once; only catch/fish results reach the dispatcher
+        event = classify_embed(message.embeds[0])
+        if not event.is_drop_candidate:
+            return
 
-            return username, pokecoin_present, pokecoin_amount
+        # 🎐 Coalesce repeated edits of this message and pace per channel
+        self.edit_dispatcher.submit(message, event)
 
-        username, has_pokecoin, pokecoin_amount = extract_username_and_pokecoins(
-            message.content
-        )
-        if not username:
+    async def dispatch_hershey_edit(
+        self, message: discord.Message, event: PokeMeowEvent
+    ):
+        if not promo_cache.is_promo_active():
+            return
+
+        promo = promo_cache.promo
+        await self.process_hershey_drops(message, promo, event)
+
+    async def process_npc_drops(self, message: discord.Message, promo: Dict[str, Any]):
+        event = classify_content(message.content)
+        if event.kind is not PokeMeowEventKind.BATTLE_WIN:
             # Could log message content once or twice here for inspection
             return
 
-        user_id = self.reverse_usernames.get(username)
-        # print(f"[DEBUG] Cached username map: {self.reverse_usernames}")
+        username = event.username
+        user_id = self.usernames.lookup(username)
 
         if not user_id:
+            if self.usernames.is_ambiguous(username):
+                print(f"⚠️ [WARN] Username '{username}' matches several members.")
+                return
             print(f"⚠️ [WARN] Username '{username}' not in cached usernames.")
             return
 
@@ -105,12 +163,27 @@ class EventWatcher(commands.Cog):
         if member.id not in self.whitelisted_members:
             return
 
-        # If PokéCoins mentioned, you can do something here
+        # 🔁 A message already rolled must not re-stamp the cooldown
+        if self.processed_messages.seen(message.id):
+            return
+
+        if not self.drop_cooldowns.check_and_set(("npc", member.id)):
+            print(
+                f"[COOLDOWN] Skipping battle drop for user {member.id} due to cooldown."
+            )
+            return
+
+        # If PokéCoins mentioned, you can do something here (event.pokecoins)
 
         promo_emoji = promo["emoji"]
         promo_name = promo["name"]
         promo_emoji_name = promo["emoji_name"]
         drop_type = "npc"
+
+        # 🔁 One roll per PokéMeow message, however often it is edited/re-sent
+        if not self.processed_messages.claim(message.id):
+            return
+
         roll = random.randint(1, promo["battle_rate"])
         rate = promo["battle_rate"]
 
@@ -120,11 +193,17 @@ class EventWatcher(commands.Cog):
             drop_msg = f"{member.mention} has discovered a **{promo_emoji_name}** {promo_emoji} from battle! {Emojis.pink_heart_movin}"
             drop_msg_logs = f"{member.display_name} has discovered a **{promo_emoji_name}** while {drop_type}ing!"
 
+            # 🧺 Record first; a duplicate source message is never announced twice
+            if not await record_item_drop(
+                self.bot, member.id, drop_type, source_message_id=message.id
+            ):
+                print(f"[DUPLICATE] Drop for message {message.id} already recorded.")
+                return
+
             print(f"🎉 {drop_msg_logs}")
-            drop_message = await message.channel.send(drop_msg)
+            drop_message = await send_scheduler.send(message.channel, drop_msg)
             drop_message_id = drop_message.id
             msg_link = f"[{Emojis.pink_link} Message Link](https://discord.com/channels/{message.guild.id}/{message.channel.id}/{drop_message_id})"
-            await record_item_drop(self.bot, member.id, drop_type)
             hunt_channel = message.guild.get_channel(HUNT_CHANNEL_ID)
 
             drop_track_embed = await build_drop_track_embed(
@@ -136,150 +215,113 @@ class EventWatcher(commands.Cog):
                 promo_name=promo_name,
                 msg_link=msg_link,
             )
-            await hunt_channel.send(embed=drop_track_embed)
+            await hunt_feed.post(hunt_channel, drop_track_embed)
+
+    # 🧭 Who ran the command PokéMeow replied to: resolved reference, then the
+    # local author cache, then one deduplicated fetch, then the channel owner
+    async def resolve_reply_author(self, message: discord.Message) -> Optional[int]:
+        reference = message.reference
+        if isinstance(reference.resolved, discord.Message):
+            return reference.resolved.author.id
+
+        author_id = await self.message_authors.resolve(
+            message.channel, reference.message_id
+        )
+        if author_id is not None:
+            return author_id
+        return self.channel_owners.get(message.channel.id)
 
     # 🎯 Process hershey reply messages to check for fish or catch plushie drops
 
     async def process_hershey_drops(
-        self, message: discord.Message, promo: Dict[str, Any]
+        self,
+        message: discord.Message,
+        promo: Dict[str, Any],
+        event: Optional[PokeMeowEvent] = None,
     ):
         if not message.guild or message.guild.id != STRAYMONS_GUILD_ID:
             return
         if not message.reference:
             return
 
-        # 🌸 Add jitter to reduce burst API calls
-        await asyncio.sleep(random.uniform(0.6, 1.2))
+        if event is None:
+            if not message.embeds:
+                return
+            event = classify_embed(message.embeds[0])
+        if not event.is_drop_candidate:
+            return
 
-        now = asyncio.get_event_loop().time()
+        # Mew catches bypass the cooldown
+        is_mew = event.is_mew
 
-        # Check if embed description contains Mew for bypass
-        description = ""
-        if message.embeds:
-            embed = message.embeds[0]
-            description = embed.description.lower() if embed.description else ""
+        member_id = await self.resolve_reply_author(message)
+        if member_id is None:
+            return
 
-        is_mew = "**mew**" in description or "**shiny mew**" in description
+        # 🔁 A message already rolled must not re-stamp the cooldown
+        if self.processed_messages.seen(message.id):
+            return
 
         # Soft cooldown: per-user instead of global
-        if not hasattr(self, "last_fetch_per_user"):
-            self.last_fetch_per_user = {}
-
-        member_id_for_cooldown = None
-        if message.reference and message.reference.resolved:
-            member_id_for_cooldown = message.reference.resolved.author.id
-        elif message.reference:
-            try:
-                ref_msg = await message.channel.fetch_message(
-                    message.reference.message_id
-                )
-                member_id_for_cooldown = ref_msg.author.id
-            except:
-                pass
-
-        if member_id_for_cooldown is not None:
-            last_ts = self.last_fetch_per_user.get(member_id_for_cooldown, 0.0)
-            if not is_mew and now - last_ts < 1.0:
-                print(
-                    f"[COOLDOWN] Skipping drop for user {member_id_for_cooldown} due to cooldown."
-                )
-                return  # cooldown for this user only
-            self.last_fetch_per_user[member_id_for_cooldown] = now
-
-        try:
-            replied_to = message.reference.resolved
-            if not replied_to:
-                replied_to = await message.channel.fetch_message(
-                    message.reference.message_id
-                )
-        except discord.HTTPException as e:
-            if e.status == 429:
-                print(
-                    f"⏳ [WAIT] [HERSHEY] Rate limited when fetching reply! Backing off... (429)"
-                )
-                await asyncio.sleep(2.5)
-            else:
-                print(f"❌ [ERROR] [HERSHEY] Failed to fetch referenced message: {e}")
-            return
-        except Exception as e:
-            print(f"❌ [ERROR] [HERSHEY] Unexpected error: {e}")
-            return
+        if not self.drop_cooldowns.check_and_set(("hershey", member_id), bypass=is_mew):
+            print(f"[COOLDOWN] Skipping drop for user {member_id} due to cooldown.")
+            return  # cooldown for this user only
 
-        member = message.guild.get_member(replied_to.author.id)
+        member = message.guild.get_member(member_id)
         if not member:
             return
 
         if member.id not in self.whitelisted_members:
             return
 
-        if message.embeds:
-            embed = message.embeds[0]
-            description = embed.description.lower() if embed.description else ""
-            embed_color = embed.color.value if embed.color else None
-
-            drop_type = None
-            caught_pokemon = ""  # Initialize safely outside conditionals
-
-            if "you caught a" in description:
-                promo_emoji = promo["emoji"]
-                promo_name = promo["name"]
-                promo_emoji_name = promo["emoji_name"]
-                if embed_color == FISH_COLOR:
-                    drop_type = "fish"
-                    rate = promo["fish_rate"]
-                else:
-                    drop_type = "catch"
-                    rate = promo["catch_rate"]
-                print(
-                    f"[ROLL] Rolling for drop for {member.display_name} with rate {rate}."
-                )
-
-            # 🔥 Force drop if it's Mew
-            if caught_pokemon == "mew":
-                roll = 1
-                drop_type = "mew"
-                promo_emoji = promo["emoji"]
-                promo_name = promo["name"]
-                promo_emoji_name = promo["emoji_name"]
-                drop_msg = (
-                    f"{Emojis.pink_sparkle} {member.mention} has caught a Mew! "
-                    f"Oh? It looks like it dropped a **{promo_emoji_name}** {promo_emoji} {Emojis.pink_heart_movin}"
-                )
-                drop_msg_logs = (
-                    f"{member.display_name} caught a Mew and got a forced drop!"
-                )
-                print(f"🌟 [FORCE DROP] {drop_msg_logs}")
-            else:
-                roll = random.randint(1, rate)
-                print(
-                    f"[ROLL RESULT] Rolled {roll} for {member.display_name} (1 means drop)."
-                )
-
-            if roll == 1:
-                if caught_pokemon != "mew":
-                    drop_msg = f"{member.mention} has discovered a **{promo_emoji_name}** {promo_emoji} while {drop_type}ing! {Emojis.pink_heart_movin}"
-                    drop_msg_logs = f"{member.display_name} has discovered a **{promo_emoji_name}** while {drop_type}ing!"
-                    print(f"🎉 {drop_msg_logs}")
-
-                drop_message = await message.channel.send(drop_msg)
-                drop_message_id = drop_message.id
-                msg_link = f"[{Emojis.pink_link} Message Link](https://discord.com/channels/{message.guild.id}/{message.channel.id}/{drop_message_id})"
-
-                await record_item_drop(self.bot, member.id, drop_type)
-                hunt_channel = message.guild.get_channel(HUNT_CHANNEL_ID)
-
-                drop_track_embed = await build_drop_track_embed(
-                    bot=self.bot,
-                    member=member,
-                    method=drop_type,
-                    promo_emoji=promo_emoji,
-                    promo_emoji_name=promo_emoji_name,
-                    promo_name=promo_name,
-                    msg_link=msg_link,
-                )
-                await hunt_channel.send(embed=drop_track_embed)
-            else:
-                print(f"[NO DROP] No drop this roll for {member.display_name}.")
+        promo_emoji = promo["emoji"]
+        promo_name = promo["name"]
+        promo_emoji_name = promo["emoji_name"]
+        drop_type = event.kind.value  # "catch" or "fish"
+        rate = (
+            promo["fish_rate"]
+            if event.kind is PokeMeowEventKind.FISH
+            else promo["catch_rate"]
+        )
+        print(f"[ROLL] Rolling for drop for {member.display_name} with rate {rate}.")
+
+        # 🔁 One roll per PokéMeow message, however often it is edited
+        if not self.processed_messages.claim(message.id):
+            return
+
+        roll = random.randint(1, rate)
+        print(f"[ROLL RESULT] Rolled {roll} for {member.display_name} (1 means drop).")
+
+        if roll == 1:
+            drop_msg = f"{member.mention} has discovered a **{promo_emoji_name}** {promo_emoji} while {drop_type}ing! {Emojis.pink_heart_movin}"
+            drop_msg_logs = f"{member.display_name} has discovered a **{promo_emoji_name}** while {drop_type}ing!"
+
+            # 🧺 Record first; a duplicate source message is never announced twice
+            if not await record_item_drop(
+                self.bot, member.id, drop_type, source_message_id=message.id
+            ):
+                print(f"[DUPLICATE] Drop for message {message.id} already recorded.")
+                return
+
+            print(f"🎉 {drop_msg_logs}")
+            drop_message = await send_scheduler.send(message.channel, drop_msg)
+            drop_message_id = drop_message.id
+            msg_link = f"[{Emojis.pink_link} Message Link](https://discord.com/channels/{message.guild.id}/{message.channel.id}/{drop_message_id})"
+
+            hunt_channel = message.guild.get_channel(HUNT_CHANNEL_ID)
+
+            drop_track_embed = await build_drop_track_embed(
+                bot=self.bot,
+                member=member,
+                method=drop_type,
+                promo_emoji=promo_emoji,
+                promo_emoji_name=promo_emoji_name,
+                promo_name=promo_name,
+                msg_link=msg_link,
+            )
+            await hunt_feed.post(hunt_channel, drop_track_embed)
+        else:
+            print(f"[NO DROP] No drop this roll for {member.display_name}.")
 
     # ————————————————————————————————
     # 🎀 Discord event listener for new messages
@@ -288,9 +330,14 @@ class EventWatcher(commands.Cog):
     async def on_message(self, message: discord.Message):
         if not message.guild or message.guild.id != STRAYMONS_GUILD_ID:
             return
-        if message.channel.id not in self.personal_channels.values():
+        if message.channel.id not in self.channel_owners:
             return
 
+        # 💬 Remember who sent what so PokéMeow replies resolve locally
+        self.message_authors.remember(message.id, message.author.id)
+        if message.author.id == POKEMEOW_ID:
+            self.capture("message", message)
+
         await self.handle_new_message(message)
 
     # 🎀 Discord event listener for edited messages
@@ -299,19 +346,28 @@ class EventWatcher(commands.Cog):
 
         if not after.guild or after.guild.id != STRAYMONS_GUILD_ID:
             return
-        if after.channel.id not in self.personal_channels.values():
+        if after.channel.id not in self.channel_owners:
             return
         if after.author.id != POKEMEOW_ID:
             return
+        self.capture("edit", after)
         await self.handle_edit_message(after)
 
+    # 🎥 Record PokéMeow traffic for offline replay (IGGLY_CAPTURE_PATH)
+    def capture(self, kind: str, message: discord.Message):
+        if not event_capture.enabled:
+            return
+        reference_author_id = None
+        if message.reference:
+            reference_author_id = self.message_authors.get(message.reference.message_id)
+        event_capture.record(kind, message, reference_author_id)
+
     @commands.Cog.listener()
     async def on_ready(self):
         print("🔄 Rebuilding whitelist and personal channel caches...")
 
         self.whitelisted_members.clear()
-        self.usernames = {}
-        self.personal_channels = {}
+        self.usernames.clear()
 
         for guild in self.bot.guilds:
             if not self.is_straymons_guild(guild):
@@ -325,16 +381,10 @@ class EventWatcher(commands.Cog):
                     and NON_WEEKLY_ROLE_ID not in role_ids
                 ):
                     self.whitelisted_members.add(member.id)
-                    self.usernames[member.id] = member.name.lower()
-        # After loop:
-        self.build_reverse_username_cache()
+                    self.usernames.set(member.id, member.name)
 
         # Load personal channels ONLY for whitelisted members
-        async with self.bot.pg_pool.acquire() as conn:
-            rows = await conn.fetch("SELECT user_id, channel_id FROM straymons_members")
-            for row in rows:
-                if row["user_id"] in self.whitelisted_members:
-                    self.personal_channels[row["user_id"]] = row["channel_id"]
+        await self.reload_personal_channels()
 
         print(
             f"✅ Whitelist: {len(self.whitelisted_members)}, Channels: {len(self.personal_channels)}"
@@ -354,16 +404,14 @@ class EventWatcher(commands.Cog):
             and NON_WEEKLY_ROLE_ID not in role_ids
         ):
             self.whitelisted_members.add(after.id)
-            # Update username if changed
-            if self.usernames.get(after.id) != after.name.lower():
-                self.usernames[after.id] = after.name.lower()
-                self.build_reverse_username_cache()
+            self.index_personal_channel(after.id)
+            # Update username if changed (O(1), no full rebuild)
+            self.usernames.set(after.id, after.name)
         else:
             self.whitelisted_members.discard(after.id)
+            self.unindex_personal_channel(after.id)
             # Remove username if present
-            if after.id in self.usernames:
-                self.usernames.pop(after.id)
-                self.build_reverse_username_cache()
+            self.usernames.discard(after.id)
 
 
 # ————————————————————————————————
@@ -1,4 +1,5 @@
 from datetime import timedelta  # Added for date range calculation
+from typing import Dict, List
 
 import discord
 from discord import app_commands
@@ -6,7 +7,8 @@ from discord.ext import commands
 
 from config.straymons.constants import *
 from config.straymons.emojis import Emojis
-from utils.daily_winner_db import get_all_winners
+from utils.daily_winner_db import get_winner_days
+from utils.member_resolver import member_resolver
 from utils.misc.role_checks import *
 from utils.visuals.random_pink import get_random_pink
 
@@ -14,6 +16,135 @@ divider_url = "https://media.discordapp.net/attachments/1393740397905313912/1399
 thumbnail_url = "https://media.discordapp.net/attachments/1298966164072038450/1402129883785855046/8f6ba31c50d12f822589cf8a7147b8e6-removebg-preview.png?ex=6892cab6&is=68917936&hm=6b166addb71d6e7cff5e02a79727e5bd9ab52a9be588784b5b59a360f51dd123&=&format=webp&quality=lossless&width=596&height=530"
 
 
+PAGE_DAYS = 7  # 📄 Days per embed page (Discord allows 25 fields)
+
+
+# 🩷 One embed page: one field per day with all winners that day
+def build_winners_embed(
+    days: List[Dict], names: Dict[int, str], page: int, has_more: bool
+) -> discord.Embed:
+    # 💌 Prepare embed with pink vibes 💌
+    embed = discord.Embed(
+        # title=f"{Emojis.pink_party} Daily Winners Timeline",
+        description=(
+            f"## {Emojis.pink_party} Daily Winners Timeline\n"
+            f"### Winners by day with total drops:\n"
+        ),
+        color=get_random_pink(),
+    )
+    embed.set_image(url=divider_url)
+    embed.set_thumbnail(url=thumbnail_url)
+
+    for day in days:
+        day_start = day["winner_date"]
+        day_end = day_start + timedelta(days=1)
+        field_name = f"🌺 Day {day['day_number']} | {day_start.strftime('%Y-%m-%d')} to {day_end.strftime('%Y-%m-%d')}"
+        winners = day["winners"]
+
+        # If there's more than one winner, format with "Winners:" and list
+        if len(winners) > 1:
+            if day["tied"]:
+                winners_lines = [f"> - - 🎀 {names[uid]}" for uid, _ in winners]
+                footer = f"\n> - ✨ Total Drops: {winners[0][1]} each"
+            else:
+                winners_lines = [
+                    f"> - - 🎀 {names[uid]} ({drops} drops)" for uid, drops in winners
+                ]
+                footer = ""
+            field_value = "> - 🦄 Winners:\n" + "\n".join(winners_lines) + footer
+        else:
+            # Only one winner: show normally
+            user_id, total_drops = winners[0]
+            field_value = (
+                f"> - 🦄 Winner: {names[user_id]}\n"
+                f"> - ✨ Total Drops: {total_drops}"
+            )
+
+        embed.add_field(name=field_name, value=field_value, inline=False)
+
+    more = " • more ▶" if has_more else ""
+    embed.set_footer(text=f"Page {page + 1}{more}")
+    return embed
+
+
+# 📄 Prev/Next through winner days; each page is fetched once, then cached
+class DailyWinnersView(discord.ui.View):
+    def __init__(self, bot, guild: discord.Guild, author_id: int):
+        super().__init__(timeout=300)
+        self.bot = bot
+        self.guild = guild
+        self.author_id = author_id
+        self.pages: List[discord.Embed] = []
+        self.cursors: List[int] = []  # keyset cursor: last day_number on each page
+        self.has_more: List[bool] = []
+        self.index = 0
+
+    # 🔍 Fetch page `index` (pages are only ever fetched in order)
+    async def load(self, index: int) -> bool:
+        if index < len(self.pages):
+            return True
+        if self.pages and not self.has_more[-1]:
+            return False
+
+        days = await get_winner_days(
+            self.bot,
+            after_day_number=self.cursors[-1] if self.cursors else 0,
+            limit=PAGE_DAYS + 1,
+        )
+        if not days:
+            return False
+        has_more = len(days) > PAGE_DAYS
+        days = days[:PAGE_DAYS]
+
+        # 🧭 Resolve every winner on the page in one batched lookup
+        user_ids = [uid for day in days for uid, _ in day["winners"]]
+        resolved = await member_resolver.resolve_many(
+            self.guild, user_ids, bot=self.bot
+        )
+        names = {
+            uid: found.display_name or f"User ID {uid}"
+            for uid, found in resolved.items()
+        }
+
+        self.pages.append(build_winners_embed(days, names, len(self.pages), has_more))
+        self.cursors.append(days[-1]["day_number"])
+        self.has_more.append(has_more)
+        return True
+
+    def refresh_buttons(self):
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = not (
+            self.index + 1 < len(self.pages) or self.has_more[self.index]
+        )
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message(
+                "Only the person who ran this command can flip pages.", ephemeral=True
+            )
+            return False
+        return True
+
+    async def show(self, interaction: discord.Interaction, index: int):
+        if not await self.load(index):
+            return await interaction.response.defer()
+        self.index = index
+        self.refresh_buttons()
+        await interaction.response.edit_message(embed=self.pages[index], view=self)
+
+    @discord.ui.button(label="◀ Prev", style=discord.ButtonStyle.secondary)
+    async def previous_page(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await self.show(interaction, self.index - 1)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await self.show(interaction, self.index + 1)
+
+
 class DailyWinnersCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -28,94 +159,16 @@ class DailyWinnersCog(commands.Cog):
         # 🌸✨ Defer response for dreamy embed build ✨🌸
         await interaction.response.defer()
 
-        # 🎀 Fetch all winners from DB 🎀
-        winners = await get_all_winners(self.bot)
-        if not winners:
+        # 🎀 Fetch the first page of winner days from DB 🎀
+        view = DailyWinnersView(self.bot, interaction.guild, interaction.user.id)
+        if not await view.load(0):
             return await interaction.followup.send(
                 "No daily winners found.", ephemeral=True
             )
-
-        # 🌷 Sort winners by winner_date ascending (day 1 first) 🌷
-        winners.sort(key=lambda x: x["winner_date"])
-
-        # 💖 Group winners by day for single field per day 💖
-        winners_by_day = {}
-        for win in winners:
-            day = win["winner_date"]
-            if day not in winners_by_day:
-                winners_by_day[day] = []
-            winners_by_day[day].append(win)
-
-        # 💌 Prepare embed with pink vibes 💌
-        embed = discord.Embed(
-            # title=f"{Emojis.pink_party} Daily Winners Timeline",
-            description=(
-                f"## {Emojis.pink_party} Daily Winners Timeline\n"
-                f"### Winners by day with total drops:\n"
-            ),
-            color=get_random_pink(),
-        )
-        embed.set_image(url=divider_url)
-        embed.set_thumbnail(url=thumbnail_url)
-        # 🩷 Add fields: one field per day with all winners that day 🩷
-        day_number = 1
-        for day, winners_list in winners_by_day.items():
-            day_start = day
-            day_end = day_start + timedelta(days=1)
-            field_name = f"🌺 Day {day_number} | {day_start.strftime('%Y-%m-%d')} to {day_end.strftime('%Y-%m-%d')}"
-
-            # If there's more than one winner, format with "Winners:" and list
-            if len(winners_list) > 1:
-                winners_lines = []
-                total_drops = winners_list[0][
-                    "total_drops"
-                ]  # assume same drops for all ties
-
-                for win in winners_list:
-                    user_id = win["user_id"]
-                    try:
-                        member = interaction.guild.get_member(user_id)
-                        display_name = member.display_name if member else None
-                        if not display_name:
-                            user = await self.bot.fetch_user(user_id)
-                            display_name = user.name
-                    except Exception:
-                        display_name = f"User ID {user_id}"
-                    winners_lines.append(f"> - - 🎀 {display_name}")
-
-                field_value = (
-                    "> - 🦄 Winners:\n"
-                    + "\n".join(winners_lines)
-                    + f"\n> - ✨ Total Drops: {total_drops} each"
-                )
-            else:
-                # Only one winner: show normally
-                win = winners_list[0]
-                user_id = win["user_id"]
-                total_drops = win["total_drops"]
-
-                try:
-                    member = interaction.guild.get_member(user_id)
-                    display_name = member.display_name if member else None
-                    if not display_name:
-                        user = await self.bot.fetch_user(user_id)
-                        display_name = user.name
-                except Exception:
-                    display_name = f"User ID {user_id}"
-
-                field_value = (
-                    f"> - 🦄 Winner: {display_name}\n"
-                    f"> - ✨ Total Drops: {total_drops}"
-                )
-
-            embed.add_field(name=field_name, value=field_value, inline=False)
-            day_number += 1
-
-            if day_number > 25:  # Discord max fields safety check
-                break
+        view.refresh_buttons()
 
         # 🌸✨ Send embed to channel ✨🌸
-        await interaction.followup.send(embed=embed)
+        await interaction.followup.send(embed=view.pages[0], view=view)
 
 
 async def setup(bot):
@@ -10,6 +10,7 @@ from config.guild_ids import STRAYMONS_GUILD_ID
 from config.straymons.constants import STAFF_ROLE_ID
 from config.straymons.emojis import Emojis
 from utils.daily_winner_db import get_top_daily_drops, get_top_drops_in_range
+from utils.member_resolver import member_resolver
 
 ASIA_MANILA = ZoneInfo("Asia/Manila")
 STAFF_ROLE_ID = STAFF_ROLE_ID  # 🔐 Replace with your actual staff role ID
@@ -92,10 +93,11 @@ class PlushieLeaderboard(commands.Cog):
         )
         embed.set_thumbnail(url=interaction.guild.icon.url)
 
+        resolved = await member_resolver.resolve_many(
+            interaction.guild, [user_id for user_id, _ in top_drops]
+        )
         for idx, (user_id, count) in enumerate(top_drops, start=1):
-            user = interaction.guild.get_member(user_id)
-            display_name = user.display_name if user else f"<User {user_id}>"
-            name = user.mention if user else f"<User {user_id}>"
+            display_name = resolved[user_id].display_name or f"<User {user_id}>"
             embed.add_field(
                 name=f"#{idx} {display_name}",
                 value=f"> - **{count} {emoji_name}** {emoji}",
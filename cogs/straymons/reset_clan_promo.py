@@ -5,7 +5,8 @@ from discord import app_commands
 from discord.ext import commands
 
 from config.guild_ids import STRAYMONS_GUILD_ID
-from utils.get_pg_pool import get_pg_pool
+from utils.drop_counters import drop_counters
+from utils.storage.get_storage import get_storage
 
 
 class ResetClanPromo(commands.Cog):
@@ -25,7 +26,8 @@ class ResetClanPromo(commands.Cog):
         await interaction.followup.send(
             "**⚠️ Are you sure you want to reset all clan promo data?**\n"
             "This will delete all rows from:\n"
-            "`clan_promo_events`, `member_item_drops`, and `daily_item_winners`.",
+            "`clan_promo_events`, `member_item_drops`, `daily_item_winners` "
+            "and `bulk_dispatch_items`.",
             view=confirm_view,
             ephemeral=True,
         )
@@ -41,11 +43,8 @@ class ResetClanPromo(commands.Cog):
             )
 
         # Proceed with deletion
-        pool = await get_pg_pool(self.bot)
-        async with pool.acquire() as conn:
-            await conn.execute("DELETE FROM clan_promo_events;")
-            await conn.execute("DELETE FROM member_item_drops;")
-            await conn.execute("DELETE FROM daily_item_winners;")
+        await get_storage(self.bot).reset_promo_data()
+        drop_counters.clear()
 
         await interaction.followup.send(
             "✅ All clan promo data has been reset.", ephemeral=True
@@ -6,7 +6,11 @@ from apscheduler.triggers.cron import CronTrigger
 from discord.ext import commands
 
 from config.straymons.constants import STRAYMONS_GUILD_ID
-from utils.announce_daily_winner import announce_daily_winner
+from utils.announce_daily_winner import (
+    announce_daily_winner,
+    prepare_daily_winner,
+    resend_daily_winner,
+)
 from utils.visuals.iggly_log_helpers import IgglyContext, iggly_log
 
 ASIA_MANILA = ZoneInfo("Asia/Manila")
@@ -32,6 +36,22 @@ class SchedulerCog(commands.Cog):
             replace_existing=True,
         )
 
+        # 🌅 Two minutes early: reconcile standings and resolve likely winners
+        self.scheduler.add_job(
+            self.run_day_close,
+            CronTrigger(hour=11, minute=58, timezone=ASIA_MANILA),
+            id="daily_winner_day_close",
+            replace_existing=True,
+        )
+
+        # 🔁 Ten minutes later: resend the settled winners if noon's send failed
+        self.scheduler.add_job(
+            self.run_resend,
+            CronTrigger(hour=12, minute=10, timezone=ASIA_MANILA),
+            id="daily_winner_resend",
+            replace_existing=True,
+        )
+
         """# 🕑 Add a test tick job every minute to verify scheduler is running
         self.scheduler.add_job(
             self.test_tick,
@@ -82,6 +102,30 @@ class SchedulerCog(commands.Cog):
         now = datetime.now(ASIA_MANILA).strftime("%Y-%m-%d %H:%M:%S %Z")
         self.log("info", f"Test tick fired at {now}")"""
 
+    # 🌅 Pre-noon snapshot; noon still works (just slower) if this fails
+    async def run_day_close(self):
+        try:
+            await prepare_daily_winner(self.bot)
+        except Exception as e:
+            self.log(
+                "error",
+                f"Exception in run_day_close: {e}",
+                bot=self.bot,
+                include_trace=True,
+            )
+
+    # 🔁 No-op unless noon settled the day but its announcement never went out
+    async def run_resend(self):
+        try:
+            await resend_daily_winner(self.bot)
+        except Exception as e:
+            self.log(
+                "critical",
+                f"Exception in run_resend: {e}",
+                bot=self.bot,
+                include_trace=True,
+            )
+
     # 💗 The heart of the cog: run the announcement if we're still in the right guild
     async def run_announcement(self):
         now_str = datetime.now(ASIA_MANILA).strftime("%Y-%m-%d %I:%M:%S %p %Z")
@@ -3,6 +3,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from config.straymons.constants import *
+from utils.storage.queries import queries
 
 
 class SyncChannelsCog(commands.Cog):
@@ -18,9 +19,7 @@ class SyncChannelsCog(commands.Cog):
     async def sync_channels(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
         async with self.bot.pg_pool.acquire() as conn:
-            channels_rows = await conn.fetch(
-                "SELECT user_id, channel_id FROM straymons_channels"
-            )
+            channels_rows = await queries.fetch(conn, "straymons_channels")
 
             if not channels_rows:
                 await interaction.followup.send(
@@ -28,19 +27,22 @@ class SyncChannelsCog(commands.Cog):
                 )
                 return
 
-            await conn.executemany(
-                """
-                INSERT INTO straymons_members (user_id, channel_id)
-                VALUES ($1, $2)
-                ON CONFLICT (user_id) DO UPDATE SET channel_id = EXCLUDED.channel_id
-                """,
+            await queries.executemany(
+                conn,
+                "upsert_member_channel",
                 [(row["user_id"], row["channel_id"]) for row in channels_rows],
             )
 
-            await interaction.followup.send(
-                f"Synced {len(channels_rows)} entries from straymons_channels to straymons_members.",
-                ephemeral=True,
-            )
+        # 🧭 Refresh EventWatcher's channel index so new channels are watched
+        # (after releasing our connection; the reload acquires its own)
+        event_watcher = self.bot.get_cog("EventWatcher")
+        if event_watcher:
+            await event_watcher.reload_personal_channels()
+
+        await interaction.followup.send(
+            f"Synced {len(channels_rows)} entries from straymons_channels to straymons_members.",
+            ephemeral=True,
+        )
 
 
 async def setup(bot):
@@ -19,3 +19,8 @@ REPORTS_CHANNEL_ID = 1299823993011961866
 
 
 POKECOIN_EMOJI = "<:PokeCoin:1166253401546436648>"
+
+# 🧺 Hunt-channel feed: group drop-track embeds (up to 10 per message) at peak.
+# Off by default: on, a drop-track embed can share a post and wait up to the window
+HUNT_FEED_BATCHING = False
+HUNT_FEED_WINDOW = 2.0  # seconds a batched embed may wait before it is posted
@@ -30,7 +30,9 @@ from cogs.straymons.promo_refresher import get_active_promo_cache, promo_cache
 from config.guild_ids import *
 from utils.get_pg_pool import get_pg_pool
 from utils.rate_limit_logger import setup_rate_limit_logging
+from utils.schema import ensure_schema
 from utils.set_promo_db import get_promo
+from utils.storage.postgres import PostgresStorage
 
 intents = discord.Intents.default()
 intents.messages = True
@@ -150,6 +152,8 @@ async def setup_hook():
             version = await conn.fetchval("SELECT version();")
             print(f"[🩷  Postgres] Connected! Version: {version}")
         bot.pg_pool = pg_pool
+        bot.storage = PostgresStorage(pg_pool)
+        await ensure_schema(bot)
     except Exception as e:
         print(f"[❌ Postgres] Connection failed: {e}")
 
@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from zoneinfo import ZoneInfo
 
 import discord
@@ -8,7 +9,11 @@ from cogs.straymons.promo_refresher import get_active_promo_cache
 from config.straymons.constants import HUNT_CHANNEL_ID, POKECOIN_EMOJI
 from config.straymons.dividers import DividerImages
 from config.straymons.emojis import Emojis
+from utils.bulk_dispatcher import ADD_ROLE, DM, DispatchItem, bulk_dispatcher
+from utils.current_day_cache import current_day_cache
 from utils.daily_winner_db import *
+from utils.day_close import day_close
+from utils.storage.get_storage import get_storage
 from utils.time import *
 from utils.visuals.iggly_log_helpers import iggly_log  # 💖 Logging for Iggly
 
@@ -25,6 +30,159 @@ prize_1 = f"{Emojis.golden} Gardevoir + 10M {Emojis.pokecoin}"
 prize_2 = f"{Emojis.golden} Diancie + 5M {Emojis.pokecoin}"
 prize_3 = f"{Emojis.golden} Keldeo + 2.5M {Emojis.pokecoin}"
 
+PLUSHIE_WINNER_MIN = 5  # 🧸 Plushies needed in a day to be a daily winner
+
+
+# 📣 Post the announcement while the rewards go out. A failed dispatch is
+# logged on its own so the posts after the announcement still happen;
+# items that didn't go out are retried when the same job is run again.
+async def send_with_rewards(
+    bot: discord.Client,
+    channel: discord.TextChannel,
+    embed: discord.Embed,
+    job: str,
+    rewards: List[DispatchItem],
+    members: Dict[int, discord.Member],
+):
+    sent, dispatched = await asyncio.gather(
+        channel.send(embed=embed),
+        bulk_dispatcher.run(bot, job, channel.guild, rewards, members),
+        return_exceptions=True,
+    )
+    if isinstance(dispatched, BaseException):
+        iggly_log(
+            "critical",
+            f"Reward dispatch for {job} failed: {dispatched}",
+            label="BulkDispatch",
+            bot=bot,
+        )
+    if isinstance(sent, BaseException):
+        raise sent
+
+
+# 📣 Announce a settled day and post the next day's header. Built only from
+# what settle_day stored, so a run that failed here can be sent again
+# (resend_daily_winner, or a rerun of the noon job) without settling twice.
+async def publish_settled_day(
+    bot: discord.Client,
+    promo_data: Dict,
+    current_day_number: int,
+    settled: Dict,
+    members: Dict[int, discord.Member],
+):
+    winners = settled["winners"]
+    if winners:
+        channel = bot.get_channel(EVENT_NEWS_ID)
+        if not channel:
+            iggly_log(
+                "critical",
+                "Announcement channel not found. Exiting.",
+                label="DailyWinner",
+                bot=bot,
+            )
+            return
+
+        sga_winner_role = channel.guild.get_role(SGA_WINNER_ROLE_ID)
+        prize = promo_data["prize"]
+
+        plushie_rewards = []
+        for user_id, count in winners:
+            wins = settled["previous_wins"].get(user_id, 0)
+            reward = f"{POKECOIN_EMOJI} 100K" if wins >= 2 else prize
+            plushie_rewards.append((user_id, count, wins, reward))
+
+        announcement_lines = []
+        for user_id, count, wins, reward in plushie_rewards:
+            announcement_lines.append(
+                f"<@{user_id}> with **{count}** plushies {promo_data['emoji']} (Wins: {wins})"
+            )
+
+        # Send combined announcement for all winners
+        desc = f"""## {Emojis.pink_party} Winner(s) for Day {current_day_number}!
+{Emojis.pink_bullet} Event Name: {promo_data['name']}
+{Emojis.pink_bullet} Prize: {promo_data['prize']}
+
+{Emojis.pink_bullet} Congratulations to:
+"""
+        desc += "\n".join(f"- {line}" for line in announcement_lines)
+
+        if plushie_rewards:
+            desc += f"\n\n{Emojis.pink_gift} **Daily Plushie Rewards:**\n"
+            for uid, count, wins, reward in plushie_rewards:
+                desc += (
+                    f"- <@{uid}> got **{count} plushies** (Wins: {wins}) → {reward}\n"
+                )
+
+        desc += f"""
+
+{Emojis.pink_paper} Notes:
+- \"Please make a ticket in <#{1297255751353372825}> to claim your prize.\"
+"""
+        embed = discord.Embed(
+            title=f"🎉 Daily {promo_data['name']} Winner(s) for Day {current_day_number}!",
+            description=desc,
+            color=get_random_pink(),
+        )
+        embed.set_image(url=promo_data["image_url"])
+
+        # 🎀 Role grants run alongside the announcement instead of before it
+        role_grants = [
+            DispatchItem(uid, ADD_ROLE, sga_winner_role)
+            for uid, _, _, reward in plushie_rewards
+            if sga_winner_role and reward != f"{POKECOIN_EMOJI} 100K"
+        ]
+        await send_with_rewards(
+            bot,
+            channel,
+            embed,
+            f"daily-winners:{promo_data['name']}:day-{current_day_number}",
+            role_grants,
+            members,
+        )
+        iggly_log("sent", "Announcement sent successfully.", label="DailyWinner")
+
+    # ✅ Marked before the Day N post, so a retry never announces winners twice
+    await mark_day_announced(bot, settled["winner_date"])
+
+    new_day = settled["new_day"]
+    iggly_log("db", f"Rolled over to Day {new_day}.", label="DailyWinner")
+    hunt_channel = bot.get_channel(HUNT_CHANNEL_ID)
+    content = f"# ˗ˏˋ ୨💖୧ ˎˊ˗ ⊹🌸⊹ ୨ Day {new_day} ୧ ⊹🌸⊹ ˗ˏˋ ୨💖୧ ˎˊ˗"
+    await hunt_channel.send(content=content)
+
+
+# 🔁 Follow-up job: send today's settled announcement if it never went out
+async def resend_daily_winner(bot: discord.Client):
+    now = datetime.now(tz=ASIA_MANILA)
+    current_day_number = (now - START_DATE).days + 1
+    if current_day_number > 12:
+        return  # 🏁 Final winners aren't settled, so there's nothing to resend
+    day_start, _ = get_day_range_by_index(START_DATE, current_day_number)
+    settled = await get_settled_day(bot, day_start.date())
+    if settled is None or settled["announced"]:
+        return
+    iggly_log(
+        "warn",
+        f"Resending the Day {current_day_number} announcement.",
+        label="DailyWinner",
+        bot=bot,
+    )
+    await publish_settled_day(
+        bot, get_active_promo_cache(), current_day_number, settled, {}
+    )
+
+
+# 🌅 11:58 job: reconcile standings and resolve likely winners ahead of noon
+async def prepare_daily_winner(bot: discord.Client):
+    channel = bot.get_channel(EVENT_NEWS_ID)
+    if not channel:
+        iggly_log("skip", "Announcement channel not found.", label="DayClose")
+        return
+    # 🏁 Same day arithmetic as the noon job, so this matches the branch it takes
+    now = datetime.now(tz=ASIA_MANILA)
+    final = (now - START_DATE).days + 1 > 12
+    await day_close.prepare(bot, channel.guild, PLUSHIE_WINNER_MIN, final)
+
 
 async def announce_daily_winner(bot: discord.Client):
     announcement_channel_id = EVENT_NEWS_ID
@@ -40,6 +198,11 @@ async def announce_daily_winner(bot: discord.Client):
     promo_data = get_active_promo_cache()
 
     try:
+        # ⏳ Land drops queued before the cutoff; members come from the 11:58 snapshot
+        await day_close.finalize()
+        day_number = await current_day_cache.get(bot)
+        members = day_close.members(day_number)
+
         #
         if current_day_number > 12:
             top_finalists = await get_top_drops_in_range(bot=bot, days=12)
@@ -67,6 +230,7 @@ async def announce_daily_winner(bot: discord.Client):
 {Emojis.pink_bullet} Total range: Last 12 days
 {Emojis.pink_bullet} Top 3 plushie droppers:
 """
+            rewards = []
 
             for idx, (user_id, total) in enumerate(top_finalists, start=1):
                 prize = {
@@ -75,31 +239,18 @@ async def announce_daily_winner(bot: discord.Client):
                     3: f"🥉 3rd Prize: {prize_3}",
                 }.get(idx, "🎁 Participation Prize")
 
-                member = guild.get_member(user_id) or await guild.fetch_member(user_id)
-                if member and sga_winner_role:
-                    await member.add_roles(sga_winner_role)
-                    iggly_log(
-                        "sent",
-                        f"SGA Winner role given to {user_id}",
-                        label="FinalWinners",
-                    )
-
-                    try:
-                        await member.send(
+                if sga_winner_role:
+                    rewards.append(DispatchItem(user_id, ADD_ROLE, sga_winner_role))
+                rewards.append(
+                    DispatchItem(
+                        user_id,
+                        DM,
+                        content=(
                             f"🎉 Congrats! You placed **#{idx}** in the **{promo_data['name']}** event!\n"
                             f"You won: {prize}\n\nPlease make a ticket in <#{1297255751353372825}> to claim your reward!"
-                        )
-                        iggly_log(
-                            "dm",
-                            f"Sent DM to {user_id} (Rank {idx})",
-                            label="FinalWinners",
-                        )
-                    except Exception as e:
-                        iggly_log(
-                            "error",
-                            f"Failed to DM user {user_id}: {e}",
-                            label="FinalWinners",
-                        )
+                        ),
+                    )
+                )
 
                 final_announcement += (
                     f"- <@{user_id}> with **{total} plushies** → {prize}\n"
@@ -111,7 +262,16 @@ async def announce_daily_winner(bot: discord.Client):
                 color=get_random_pink(),
             )
             embed.set_image(url=DividerImages.Pink_Clouds)
-            await channel.send(embed=embed)
+
+            # 📬 Roles and DMs are paced and resumable; a re-run skips what went out
+            await send_with_rewards(
+                bot,
+                channel,
+                embed,
+                f"final-winners:{promo_data['name']}",
+                rewards,
+                members,
+            )
             iggly_log("sent", "Final winners announcement sent.", label="FinalWinners")
 
             return
@@ -124,7 +284,25 @@ async def announce_daily_winner(bot: discord.Client):
             label="DailyWinner",
         )
 
-        top_drops = await get_top_daily_drops(bot)
+        # 🔁 Already settled (a rerun): never settle twice, but send the stored
+        # result if its announcement never went out
+        settled = await get_settled_day(bot, day_start.date())
+        if settled is not None:
+            if settled["announced"]:
+                iggly_log(
+                    "skip",
+                    f"Day {current_day_number} was already announced.",
+                    label="DailyWinner",
+                )
+                return
+            await publish_settled_day(
+                bot, promo_data, current_day_number, settled, members
+            )
+            return
+
+        # 🧾 Settle from storage: every drop before the cutoff has landed by now
+        storage = get_storage(bot)
+        top_drops = await storage.top_daily_drops(day_number) if day_number else []
         if not top_drops:
             iggly_log(
                 "skip", "No drops recorded for this day. Exiting.", label="DailyWinner"
@@ -133,10 +311,11 @@ async def announce_daily_winner(bot: discord.Client):
 
         iggly_log("db", f"Top drops fetched: {top_drops}", label="DailyWinner")
         iggly_log("db", f"Promo data fetched: {promo_data}", label="DailyWinner")
-        prize = promo_data["prize"]
 
         # ✨ Plushie earners block
-        plushie_earners = [(uid, count) for uid, count in top_drops if count >= 5]
+        plushie_earners = [
+            (uid, count) for uid, count in top_drops if count >= PLUSHIE_WINNER_MIN
+        ]
 
         if not plushie_earners:
             # Send full drop list since no one qualified
@@ -158,26 +337,7 @@ async def announce_daily_winner(bot: discord.Client):
                         color=get_random_pink(),
                     ),
                 )
-            await increment_day_number(bot)
-            new_day = await get_current_day_number(bot=bot)
-            iggly_log("db", f"Rolled over to Day {new_day}.", label="DailyWinner")
-
-            hunt_channel = bot.get_channel(HUNT_CHANNEL_ID)
-            content = f"# ˗ˏˋ ୨💖୧ ˎˊ˗ ⊹🌸⊹ ୨ Day {new_day} ୧ ⊹🌸⊹ ˗ˏˋ ୨💖୧ ˎˊ˗"
-            await hunt_channel.send(content=content)
-
-            return  # Exit early because no winners to process
-
-        plushie_rewards = []
-        for user_id, count in plushie_earners:
-            if user_id in BLOCKED_WINNER_IDS:
-                continue
-            wins = await get_daily_winner_count(bot, user_id)
-            reward = f"{POKECOIN_EMOJI} 100K" if wins >= 2 else prize
-            plushie_rewards.append((user_id, count, wins, reward))
-
-        channel = bot.get_channel(announcement_channel_id)
-        if not channel:
+        elif not bot.get_channel(announcement_channel_id):
             iggly_log(
                 "critical",
                 "Announcement channel not found. Exiting.",
@@ -186,70 +346,18 @@ async def announce_daily_winner(bot: discord.Client):
             )
             return
 
-        sga_winner_role = channel.guild.get_role(SGA_WINNER_ROLE_ID)
-
-        announcement_lines = []
-        for user_id, count, wins, reward in plushie_rewards:
-            await set_daily_winner(bot, user_id, count, winner_date=day_start.date())
-            iggly_log(
-                "db",
-                f"Plushie earner {user_id} logged as daily winner",
-                label="DailyWinner",
-            )
-
-            if reward != f"{POKECOIN_EMOJI} 100K":
-                member = channel.guild.get_member(
-                    user_id
-                ) or await channel.guild.fetch_member(user_id)
-                if sga_winner_role and member:
-                    await member.add_roles(sga_winner_role)
-                    iggly_log(
-                        "sent",
-                        f"SGA Winner role given to {user_id}",
-                        label="DailyWinner",
-                    )
-
-            announcement_lines.append(
-                f"<@{user_id}> with **{count}** plushies {promo_data['emoji']} (Wins: {wins})"
-            )
-
-        # Send combined announcement for all winners
-        desc = f"""## {Emojis.pink_party} Winner(s) for Day {current_day_number}!
-{Emojis.pink_bullet} Event Name: {promo_data['name']}
-{Emojis.pink_bullet} Prize: {promo_data['prize']}
-
-{Emojis.pink_bullet} Congratulations to:
-"""
-        desc += "\n".join(f"- {line}" for line in announcement_lines)
-
-        if plushie_rewards:
-            desc += f"\n\n{Emojis.pink_gift} **Daily Plushie Rewards:**\n"
-            for uid, count, wins, reward in plushie_rewards:
-                desc += (
-                    f"- <@{uid}> got **{count} plushies** (Wins: {wins}) → {reward}\n"
-                )
-
-        desc += f"""
-
-{Emojis.pink_paper} Notes:
-- \"Please make a ticket in <#{1297255751353372825}> to claim your prize.\"
-"""
-        embed = discord.Embed(
-            title=f"🎉 Daily {promo_data['name']} Winner(s) for Day {current_day_number}!",
-            description=desc,
-            color=get_random_pink(),
-        )
-        embed.set_image(url=promo_data["image_url"])
-        await channel.send(embed=embed)
-        iggly_log("sent", "Announcement sent successfully.", label="DailyWinner")
-
-        await increment_day_number(bot)
-        new_day = await get_current_day_number(bot=bot)
-        iggly_log("db", f"Rolled over to Day {new_day}.", label="DailyWinner")
+        # 🕛 Win counts, winner rows and the day rollover in one transaction
+        winners = [
+            (uid, count)
+            for uid, count in plushie_earners
+            if uid not in BLOCKED_WINNER_IDS
+        ]
+        _, new_day = await settle_day(bot, day_number, day_start.date(), winners)
+        if new_day is None:
+            return
 
-        hunt_channel = bot.get_channel(HUNT_CHANNEL_ID)
-        content = f"# ˗ˏˋ ୨💖୧ ˎˊ˗ ⊹🌸⊹ ୨ Day {new_day} ୧ ⊹🌸⊹ ˗ˏˋ ୨💖୧ ˎˊ˗"
-        await hunt_channel.send(content=content)
+        settled = await get_settled_day(bot, day_start.date())
+        await publish_settled_day(bot, promo_data, current_day_number, settled, members)
 
     except Exception as e:
         iggly_log(
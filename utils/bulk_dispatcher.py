@@ -0,0 +1,167 @@
+import asyncio
+import random
+import time
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional
+
+import discord
+
+from utils.member_resolver import member_resolver
+from utils.storage.get_storage import get_storage
+from utils.token_bucket import TokenBucket
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 📬 Bulk Dispatcher – Paced, resumable role changes and DMs for many members
+# ————————————————————————————————
+# Role edits and DMs each get a token bucket sized under Discord's limits, and
+# the number of calls in flight is the bucket's burst. 429s pause the bucket
+# for Retry-After, 5xx/network errors back off exponentially, 403/404 give up
+# on that member. Every item of a named job is recorded in storage
+# (bulk_dispatch_items), so re-running the same job skips what already went
+# out instead of granting or DMing twice.
+
+ROLE_RATE = 1.0  # 🎀 Role edits per second per guild (Discord: about 10 / 10s)
+ROLE_BURST = 10
+DM_RATE = 0.5  # 💌 DMs per second; opening many DMs quickly looks like spam
+DM_BURST = 5
+
+MAX_ATTEMPTS = 5  # 🔁 Tries per item before it's recorded as failed
+BASE_BACKOFF = 1.0  # ⏱️ Seconds before the first retry; doubles each time
+MAX_BACKOFF = 30.0
+
+ADD_ROLE = "add_role"
+REMOVE_ROLE = "remove_role"
+DM = "dm"
+
+
+class DispatchItem(NamedTuple):
+    user_id: int
+    action: str  # ADD_ROLE, REMOVE_ROLE or DM
+    role: Optional[discord.abc.Snowflake] = None
+    content: Optional[str] = None
+
+    # 🏷️ Progress key; one row per member, action and role
+    @property
+    def key(self) -> str:
+        return f"{self.action}:{self.role.id}" if self.role else self.action
+
+
+class BulkDispatcher:
+    def __init__(self):
+        self.buckets: Dict[str, TokenBucket] = {
+            "role": TokenBucket(ROLE_RATE, ROLE_BURST),
+            DM: TokenBucket(DM_RATE, DM_BURST),
+        }
+        self.limits: Dict[str, asyncio.Semaphore] = {}
+
+    def limit_for(self, kind: str) -> asyncio.Semaphore:
+        if kind not in self.limits:
+            self.limits[kind] = asyncio.Semaphore(int(self.buckets[kind].capacity))
+        return self.limits[kind]
+
+    # 🚀 Run (or resume) `job`; returns how many items ended in each status
+    async def run(
+        self,
+        bot,
+        job: str,
+        guild: discord.Guild,
+        items: List[DispatchItem],
+        members: Optional[Dict[int, discord.Member]] = None,
+    ) -> Counter:
+        start = time.perf_counter()
+        storage = get_storage(bot)
+        done = await storage.plan_dispatch(
+            job, [(item.user_id, item.key) for item in items]
+        )
+        todo = [item for item in items if (item.user_id, item.key) not in done]
+
+        members = {} if members is None else members
+        statuses = await asyncio.gather(
+            *(self.dispatch(storage, job, guild, item, members) for item in todo)
+        )
+        results = Counter(statuses)
+        results["resumed"] = len(items) - len(todo)
+        iggly_log(
+            "sent",
+            f"{job}: {results['done']} done, {results['failed']} failed, "
+            f"{results['resumed']} already done in "
+            f"{time.perf_counter() - start:.1f}s.",
+            label="BulkDispatch",
+        )
+        return results
+
+    async def dispatch(
+        self,
+        storage,
+        job: str,
+        guild: discord.Guild,
+        item: DispatchItem,
+        members: Dict[int, discord.Member],
+    ) -> str:
+        kind = DM if item.action == DM else "role"
+        bucket = self.buckets[kind]
+        error = None
+        attempts = 0
+        async with self.limit_for(kind):
+            while attempts < MAX_ATTEMPTS:
+                attempts += 1
+                await bucket.acquire()
+                try:
+                    member = members.get(item.user_id)
+                    if member is None:
+                        resolved = await member_resolver.resolve(guild, item.user_id)
+                        if resolved.member is None:
+                            error = "not in the server"
+                            break
+                        member = members[item.user_id] = resolved.member
+                    await self.apply(member, item)
+                except discord.HTTPException as e:
+                    error = f"{e.status} {e.text or e}"
+                    if e.status == 429:
+                        bucket.pause(getattr(e, "retry_after", None) or 1.0)
+                        continue
+                    if e.status >= 500:
+                        await asyncio.sleep(self.backoff(attempts))
+                        continue
+                    break  # 🚫 403 (DMs closed, missing perms) / 404 (left the server)
+                except (OSError, asyncio.TimeoutError) as e:
+                    error = str(e)
+                    await asyncio.sleep(self.backoff(attempts))
+                    continue
+
+                await storage.mark_dispatch(
+                    job, item.user_id, item.key, "done", attempts
+                )
+                return "done"
+
+        iggly_log(
+            "error",
+            f"{job}: {item.key} for {item.user_id} failed after {attempts} tries: {error}",
+            label="BulkDispatch",
+        )
+        await storage.mark_dispatch(
+            job, item.user_id, item.key, "failed", attempts, error
+        )
+        return "failed"
+
+    @staticmethod
+    async def apply(member: discord.Member, item: DispatchItem):
+        if item.action == ADD_ROLE:
+            if item.role not in member.roles:
+                await member.add_roles(item.role)
+        elif item.action == REMOVE_ROLE:
+            if item.role in member.roles:
+                await member.remove_roles(item.role)
+        elif item.action == DM:
+            await member.send(item.content)
+        else:
+            raise ValueError(f"Unknown dispatch action {item.action!r}")
+
+    @staticmethod
+    def backoff(attempt: int) -> float:
+        delay = min(BASE_BACKOFF * 2 ** (attempt - 1), MAX_BACKOFF)
+        return delay * random.uniform(0.5, 1.0)
+
+
+bulk_dispatcher = BulkDispatcher()  # 🏷️ Singleton dispatcher
@@ -0,0 +1,71 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+# ————————————————————————————————
+# ⏳ Cooldown Cache – Bounded per-key cooldowns with O(1) check-and-set
+# ————————————————————————————————
+# Every key shares the same cooldown length, so keeping entries in the order
+# they were stamped also keeps them in expiry order. Expired entries are popped
+# from the front as we go, and max_size caps memory even under a burst.
+
+DEFAULT_MAX_SIZE = 2048  # 🧂 Comfortably above the whitelisted member count
+
+
+class CooldownCache:
+    def __init__(self, cooldown: float, max_size: int = DEFAULT_MAX_SIZE):
+        self.cooldown = cooldown
+        self.max_size = max_size
+        self.entries: "OrderedDict[Hashable, float]" = OrderedDict()  # key -> expiry
+
+        # 📊 Counters for sizing the cache
+        self.hits = 0  # key was still cooling down → blocked
+        self.misses = 0  # key was free → allowed and stamped
+        self.bypasses = 0  # allowed despite an active cooldown (e.g. Mew)
+        self.expirations = 0  # entries dropped because they ran out
+        self.evictions = 0  # live entries dropped because the cache was full
+
+    def expire(self, now: float):
+        entries = self.entries
+        while entries:
+            key, expiry = next(iter(entries.items()))
+            if expiry > now:
+                break
+            entries.popitem(last=False)
+            self.expirations += 1
+
+    # ✅ True if the key may proceed (and stamps it); False while cooling down
+    def check_and_set(
+        self, key: Hashable, now: Optional[float] = None, bypass: bool = False
+    ) -> bool:
+        now = time.monotonic() if now is None else now
+        self.expire(now)
+
+        if key in self.entries:
+            if not bypass:
+                self.hits += 1
+                return False
+            self.bypasses += 1
+            del self.entries[key]
+        else:
+            self.misses += 1
+
+        self.entries[key] = now + self.cooldown
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self.entries)
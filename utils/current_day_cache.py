@@ -0,0 +1,56 @@
+import asyncio
+import time
+from typing import Optional
+
+from utils.storage.get_storage import get_storage
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 📅 Current Day Cache – Process-wide copy of current_day.day_number
+# ————————————————————————————————
+# The value only changes in increment_day_number, which writes the new number
+# straight into this cache. DropCacheRefresher re-reads it on a slow safety poll
+# in case someone edits the table by hand.
+
+
+class CurrentDayCache:
+    def __init__(self):
+        self.day_number: Optional[int] = None  # 📦 None = table empty / not loaded
+        self.loaded = False
+        self.loaded_at: Optional[float] = None
+        self.lock: Optional[asyncio.Lock] = None
+
+    # 🔄 Read current_day from storage into the cache
+    async def refresh(self, bot) -> Optional[int]:
+        day_number = await get_storage(bot).get_current_day()
+        if self.loaded and day_number != self.day_number:
+            iggly_log(
+                "warn",
+                f"current_day drifted from {self.day_number} to {day_number}.",
+                label="CurrentDay",
+            )
+        self.set(day_number)
+        return day_number
+
+    # ✅ Cached day number, loading it once on first use
+    async def get(self, bot) -> Optional[int]:
+        if self.loaded:
+            return self.day_number
+
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            if not self.loaded:
+                await self.refresh(bot)
+        return self.day_number
+
+    def set(self, day_number: Optional[int]):
+        self.day_number = day_number
+        self.loaded = True
+        self.loaded_at = time.monotonic()
+
+    def invalidate(self):
+        self.loaded = False
+
+
+current_day_cache = CurrentDayCache()  # 🏷️ Singleton cache instance
@@ -4,6 +4,9 @@ from zoneinfo import ZoneInfo
 
 import discord
 
+from utils.current_day_cache import current_day_cache
+from utils.drop_counters import drop_counters
+from utils.storage.get_storage import get_storage
 from utils.visuals.iggly_log_helpers import iggly_log  # 💖 Logging for Iggly
 
 # 💖 Asia Manila timezone for all date/time operations
@@ -24,24 +27,12 @@ async def set_daily_winner(
     if winner_date is None:
         winner_date = date.today()
 
-    async with bot.pg_pool.acquire() as conn:
-        await conn.execute(
-            """
-            INSERT INTO daily_item_winners (winner_date, user_id, total_drops, recorded_at)
-            VALUES ($1, $2, $3, NOW())
-            ON CONFLICT (winner_date, user_id) DO UPDATE SET
-                total_drops = EXCLUDED.total_drops,
-                recorded_at = NOW()
-            """,
-            winner_date,
-            user_id,
-            total_drops,
-        )
-        iggly_log(
-            "db",
-            f"Set daily winner {user_id} with {total_drops} drops for {winner_date}",
-            bot=bot,
-        )
+    await get_storage(bot).set_daily_winner(winner_date, user_id, total_drops)
+    iggly_log(
+        "db",
+        f"Set daily winner {user_id} with {total_drops} drops for {winner_date}",
+        bot=bot,
+    )
 
 
 # 💖 Retrieve daily winner info for a specific date (default: today)
@@ -49,30 +40,31 @@ async def get_daily_winner(bot, winner_date: Optional[date] = None) -> Optional[
     if winner_date is None:
         winner_date = date.today()
 
-    async with bot.pg_pool.acquire() as conn:
-        row = await conn.fetchrow(
-            "SELECT * FROM daily_item_winners WHERE winner_date = $1",
-            winner_date,
-        )
-        iggly_log("db", f"Fetched winner for {winner_date}: {row}", bot=bot)
-        return dict(row) if row else None
+    row = await get_storage(bot).get_daily_winner(winner_date)
+    iggly_log("db", f"Fetched winner for {winner_date}: {row}", bot=bot)
+    return row
 
 
 # 💖 Fetch all daily winners ordered by most recent first
 async def get_all_winners(bot) -> List[Dict]:
-    async with bot.pg_pool.acquire() as conn:
-        rows = await conn.fetch(
-            "SELECT * FROM daily_item_winners ORDER BY winner_date DESC"
-        )
-        iggly_log("db", f"Fetched {len(rows)} total winner records.", bot=bot)
-        return [dict(row) for row in rows]
+    rows = await get_storage(bot).get_all_winners()
+    iggly_log("db", f"Fetched {len(rows)} total winner records.", bot=bot)
+    return rows
+
+
+# 📄 One page of winner days (oldest first) after day `after_day_number`
+async def get_winner_days(bot, after_day_number: int = 0, limit: int = 7) -> List[Dict]:
+    days = await get_storage(bot).winner_days(after_day_number, limit)
+    iggly_log(
+        "db", f"Fetched {len(days)} winner days after day {after_day_number}.", bot=bot
+    )
+    return days
 
 
 # 💖 Clear all daily winner records from the table
 async def clear_daily_winners(bot):
-    async with bot.pg_pool.acquire() as conn:
-        await conn.execute("DELETE FROM daily_item_winners")
-        iggly_log("db", "Cleared all records from daily_item_winners table.", bot=bot)
+    await get_storage(bot).clear_daily_winners()
+    iggly_log("db", "Cleared all records from daily_item_winners table.", bot=bot)
 
 
 # ╭──────────────────────────────────────────────╮
@@ -99,53 +91,36 @@ def get_12pm_day_ranges(
 
 # 💖 Get top daily drops for a specific day in Asia/Manila timezone
 async def get_top_daily_drops(bot) -> List[Tuple[int, int]]:
-    async with bot.pg_pool.acquire() as conn:
-        current_day_row = await conn.fetchrow(
-            "SELECT day_number FROM current_day LIMIT 1;"
-        )
-        if not current_day_row:
-            return []
-
-        day_number = current_day_row["day_number"]
-
-        rows = await conn.fetch(
-            """
-            SELECT user_id, COUNT(*) AS drops_count
-            FROM member_item_drops
-            WHERE day = $1
-            GROUP BY user_id
-            ORDER BY drops_count DESC;
-            """,
-            day_number,
-        )
-        iggly_log("db", f"Fetched top daily drops for day {day_number}.", bot=bot)
-        return [(r["user_id"], r["drops_count"]) for r in rows]
+    day_number = await current_day_cache.get(bot)
+    if day_number is None:
+        return []
+
+    rows = await get_storage(bot).top_daily_drops(day_number)
+    iggly_log("db", f"Fetched top daily drops for day {day_number}.", bot=bot)
+    return rows
 
 
 # 💖 Get top 3 users with most drops over the last `days` days
+# (the current day label and the days - 1 before it; at the final noon
+# announcement that is exactly days 1..12 of the promo). The 12-day range is
+# served from the in-memory rolling window; anything else goes to storage.
 async def get_top_drops_in_range(bot, days: int = 12) -> List[Tuple[int, int]]:
-    now = datetime.now(tz=ASIA_MANILA)
-    start = now - timedelta(days=days)
-
-    async with bot.pg_pool.acquire() as conn:
-        rows = await conn.fetch(
-            """
-            SELECT user_id, COUNT(*) AS total_drops
-            FROM member_item_drops
-            WHERE drop_time >= $1 AND drop_time <= $2
-            GROUP BY user_id
-            ORDER BY total_drops DESC
-            LIMIT 3;
-            """,
-            start,
-            now,
-        )
-        iggly_log(
-            "db",
-            f"Fetched top 3 drops in range {start.date()} to {now.date()}.",
-            bot=bot,
-        )
-        return [(r["user_id"], r["total_drops"]) for r in rows]
+    last_day = await current_day_cache.get(bot)
+    if last_day is None:
+        return []
+    first_day = last_day - days + 1
+
+    rows = await drop_counters.top_in_window(bot, last_day, days, 3)
+    if rows is not None:
+        return rows
+
+    rows = await get_storage(bot).top_drops_in_days(first_day, last_day, 3)
+    iggly_log(
+        "db",
+        f"Fetched top 3 drops for days {first_day} to {last_day}.",
+        bot=bot,
+    )
+    return rows
 
 
 # ╭──────────────────────────────────────────────╮
@@ -154,42 +129,78 @@ async def get_top_drops_in_range(bot, days: int = 12) -> List[Tuple[int, int]]:
 
 
 async def get_daily_winner_count(bot: discord.Client, user_id: int) -> int:
-    query = "SELECT COUNT(*) FROM daily_item_winners WHERE user_id = $1"
-    async with bot.pg_pool.acquire() as conn:
-        count = await conn.fetchval(query, user_id)
+    count = await get_storage(bot).daily_winner_count(user_id)
     iggly_log("db", f"Winner count for user {user_id}: {count}", bot=bot)
     return count or 0
 
 
 async def get_current_day_number(bot) -> int:
-    async with bot.pg_pool.acquire() as conn:
-        row = await conn.fetchrow("SELECT day_number FROM current_day LIMIT 1;")
-        num = row["day_number"] if row else 1
-        iggly_log("db", f"Fetched current day number: {num}", bot=bot)
-        return num
+    day_number = await current_day_cache.get(bot)
+    return day_number if day_number is not None else 1
 
 
 async def increment_day_number(bot):
-    async with bot.pg_pool.acquire() as conn:
-        await conn.execute(
-            "UPDATE current_day SET day_number = day_number + 1, last_updated = now();"
-        )
-        iggly_log("db", "Incremented day number in current_day.", bot=bot)
+    day_number = await get_storage(bot).increment_day()
+    # 📅 Keep the process-wide cache in step with the table
+    current_day_cache.set(day_number)
+    drop_counters.advance_day(day_number)
+    iggly_log("db", f"Incremented day number in current_day to {day_number}.", bot=bot)
+
+
+# 🕛 Record the day's winners and roll the day over in one transaction.
+# `day_number` is the day the standings were computed for; nothing is written
+# unless it is still the current day in storage. Returns (user_id -> wins
+# before today, new day number); the new day is None when nothing was settled.
+async def settle_day(
+    bot, day_number: Optional[int], winner_date: date, winners: List[Tuple[int, int]]
+) -> Tuple[Dict[int, int], Optional[int]]:
+    storage = get_storage(bot)
+    wins, new_day = await storage.settle_day(day_number, winner_date, winners)
+    if new_day is None:
+        current = await storage.get_current_day()
+        if await storage.daily_winner_exists(winner_date):
+            iggly_log(
+                "warn",
+                f"Winners for {winner_date} were already settled; nothing recorded.",
+                bot=bot,
+            )
+        else:
+            iggly_log(
+                "critical",
+                f"Nothing settled for {winner_date}: standings are for day "
+                f"{day_number} but the current day is {current}.",
+                bot=bot,
+            )
+        current_day_cache.set(current)
+        return wins, None
+
+    current_day_cache.set(new_day)
+    drop_counters.advance_day(new_day)
+    iggly_log(
+        "db",
+        f"Settled day {day_number}: {len(winners)} winners for {winner_date}, "
+        f"rolled over to day {new_day}.",
+        bot=bot,
+    )
+    return wins, new_day
+
+
+# 🧾 What noon settled for winner_date (None if it hasn't been settled)
+async def get_settled_day(bot, winner_date: date) -> Optional[Dict]:
+    return await get_storage(bot).get_settled_day(winner_date)
+
+
+# 📣 winner_date's announcement went out; reruns won't send it again
+async def mark_day_announced(bot, winner_date: date):
+    await get_storage(bot).mark_announced(winner_date)
+    iggly_log("db", f"Marked winners for {winner_date} as announced.", bot=bot)
 
 
 async def check_daily_winner_exists_for_day(bot, winner_date: date) -> bool:
-    async with bot.pg_pool.acquire() as conn:
-        result = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT 1 FROM daily_item_winners WHERE winner_date = $1
-            )
-            """,
-            winner_date,
-        )
-        iggly_log(
-            "db",
-            f"Checked existence of daily winner for {winner_date}: {result}",
-            bot=bot,
-        )
-        return result
+    result = await get_storage(bot).daily_winner_exists(winner_date)
+    iggly_log(
+        "db",
+        f"Checked existence of daily winner for {winner_date}: {result}",
+        bot=bot,
+    )
+    return result
@@ -0,0 +1,95 @@
+import time
+from typing import Dict, Iterable, NamedTuple, Optional
+
+import discord
+
+from utils.current_day_cache import current_day_cache
+from utils.daily_winner_db import get_top_drops_in_range
+from utils.drop_counters import drop_counters
+from utils.drop_writer import drop_writer
+from utils.member_resolver import member_resolver
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 🌅 Day Close – Get the noon announcement ready before noon
+# ————————————————————————————————
+# The day's standings live in drop_counters all day (updated on every drop).
+# A couple of minutes before the reset, prepare() reconciles the day's
+# counters with storage and resolves the members who are likely to win
+# (through utils/member_resolver.py): today's qualifiers, or the 12-day top 3
+# before the final announcement. The embeds themselves are still built at noon
+# from storage, since the last two minutes of drops can change them. At 12:00
+# announce_daily_winner only has to wait for drops still in the DropWriter,
+# read the settled standings from storage, settle and publish.
+
+DRAIN_TIMEOUT = 2.0  # ⏳ Seconds noon waits for drops queued before the cutoff
+
+
+class DayCloseSnapshot(NamedTuple):
+    day_number: Optional[int]
+    members: Dict[int, discord.Member]
+    taken_at: float
+
+
+class DayClose:
+    def __init__(self):
+        self.snapshot: Optional[DayCloseSnapshot] = None
+
+    # 🌅 Reconcile today's counters and pre-resolve every member who could win
+    # (the final top 3 instead when `final`)
+    async def prepare(
+        self, bot, guild: discord.Guild, min_drops: int, final: bool = False
+    ):
+        start = time.perf_counter()
+        day_number = await current_day_cache.get(bot)
+
+        standings = []
+        if day_number is not None:
+            await drop_counters.reconcile_day(bot, day_number)
+            standings = await drop_counters.top_daily(bot, day_number)
+
+        if final:
+            finalists = await get_top_drops_in_range(bot, days=12)
+            candidates = {uid for uid, _ in finalists}
+        else:
+            candidates = {uid for uid, count in standings if count >= min_drops}
+        members = await self.resolve_members(guild, candidates)
+
+        self.snapshot = DayCloseSnapshot(day_number, members, time.monotonic())
+        iggly_log(
+            "ready",
+            f"Day {day_number} close prepared: {len(standings)} collectors, "
+            f"{len(members)}/{len(candidates)} candidates resolved in "
+            f"{(time.perf_counter() - start) * 1000:.0f}ms.",
+            label="DayClose",
+        )
+        return self.snapshot
+
+    # 👋 Members who left the server are left out; the announcement still mentions them
+    @staticmethod
+    async def resolve_members(
+        guild: discord.Guild, user_ids: Iterable[int]
+    ) -> Dict[int, discord.Member]:
+        resolved = await member_resolver.resolve_many(guild, user_ids)
+        return {
+            user_id: found.member
+            for user_id, found in resolved.items()
+            if found.member is not None
+        }
+
+    # 🕛 Noon: land the cutoff-edge drops that are still queued
+    async def finalize(self):
+        landed = await drop_writer.drain(DRAIN_TIMEOUT)
+        if landed:
+            iggly_log(
+                "db", f"Landed {landed} drops queued before noon.", label="DayClose"
+            )
+
+    # 🧭 Members prepared for `day_number`, if the snapshot is for that day
+    def members(self, day_number: Optional[int]) -> Dict[int, discord.Member]:
+        if self.snapshot is None or self.snapshot.day_number != day_number:
+            return {}
+        return self.snapshot.members
+
+
+day_close = DayClose()  # 🏷️ Singleton day-close pipeline
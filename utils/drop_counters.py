@@ -0,0 +1,216 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+
+from utils.current_day_cache import current_day_cache
+from utils.drop_window import RollingDropWindow
+from utils.storage.get_storage import get_storage
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 🧮 Drop Counters – In-memory per-user drop counts for the drop-track embeds
+# ————————————————————————————————
+# Warmed once from the drop store, then kept current by the DropWriter and
+# record_drop.py on every recorded/removed drop. DropCacheRefresher reconciles
+# against storage periodically to catch any drift (manual SQL edits, ...).
+# Each storage write and the count that follows it run inside writing(), and a
+# snapshot is only read while no write is between the two, so every drop is
+# either in the snapshot or counted after it, never both.
+# The same feed keeps a RollingDropWindow for the 12-day standings.
+
+
+class DropCounterStore:
+    def __init__(self):
+        self.totals: Dict[int, int] = defaultdict(int)  # user_id -> drops
+        self.daily: Dict[Tuple[int, int], int] = defaultdict(int)  # (user, day)
+        self.window = RollingDropWindow()
+        self.warmed = False
+        self.lock: Optional[asyncio.Lock] = None
+
+        # ✍️ Write gate: writes in flight, and whether a snapshot is being read
+        self.writes = 0
+        self.reading = False
+        self.changed: Optional[asyncio.Event] = None
+
+    def notify(self):
+        if self.changed is not None:
+            self.changed.set()
+            self.changed = None
+
+    async def wait_changed(self):
+        if self.changed is None:
+            self.changed = asyncio.Event()
+        await self.changed.wait()
+
+    # ✍️ Wrap a storage write together with the add()/remove() that counts it
+    @asynccontextmanager
+    async def writing(self):
+        while self.reading:
+            await self.wait_changed()
+        self.writes += 1
+        try:
+            yield
+        finally:
+            self.writes -= 1
+            self.notify()
+
+    async def load_snapshot(self, bot):
+        rows = await get_storage(bot).drop_counts()
+
+        totals: Dict[int, int] = defaultdict(int)
+        daily: Dict[Tuple[int, int], int] = defaultdict(int)
+        for user_id, day, drops in rows:
+            totals[user_id] += drops
+            daily[(user_id, day)] = drops
+        return totals, daily
+
+    # 🌸 Load counts from the DB once (concurrent callers share one load)
+    async def ensure_warm(self, bot):
+        if self.warmed:
+            return
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            if self.warmed:
+                return
+            await self.refresh(bot)
+            iggly_log(
+                "db",
+                f"Warmed drop counters for {len(self.totals)} members.",
+                label="DropCounters",
+            )
+
+    # 🔍 Re-read counts from the DB and report any drift
+    async def reconcile(self, bot) -> int:
+        if not self.warmed:
+            await self.ensure_warm(bot)
+            return 0
+
+        async with self.lock:
+            drifted = await self.refresh(bot)
+        if drifted:
+            iggly_log(
+                "warn",
+                f"Reconciled {drifted} drifted (user, day) drop counters.",
+                label="DropCounters",
+            )
+        return drifted
+
+    # 🚦 Hold new writes and wait out the ones in flight, so what storage
+    # returns inside the block matches what has been counted
+    @asynccontextmanager
+    async def quiesced(self):
+        self.reading = True
+        try:
+            while self.writes:
+                await self.wait_changed()
+            yield
+        finally:
+            self.reading = False
+            self.notify()
+
+    # 🔄 Swap in a fresh snapshot; returns how many (user, day) counts drifted
+    async def refresh(self, bot) -> int:
+        async with self.quiesced():
+            totals, daily = await self.load_snapshot(bot)
+            last_day = await current_day_cache.get(bot)
+
+            drifted = 0
+            if self.warmed:
+                drifted = sum(
+                    1
+                    for key in set(daily) | set(self.daily)
+                    if daily.get(key, 0) != self.daily.get(key, 0)
+                )
+            self.totals, self.daily = totals, daily
+            rows = ((user_id, day, drops) for (user_id, day), drops in daily.items())
+            self.window.load(rows, last_day)
+            self.warmed = True
+        return drifted
+
+    # 🌅 Reconcile only `day` against storage (one day's rows instead of the
+    # whole table); returns how many of that day's counts drifted
+    async def reconcile_day(self, bot, day: int) -> int:
+        if not self.warmed:
+            await self.ensure_warm(bot)
+            return 0
+
+        async with self.lock:
+            async with self.quiesced():
+                stored = dict(await get_storage(bot).top_daily_drops(day))
+                counted = dict(self.day_counts(day))
+                drifted = 0
+                for user_id in set(stored) | set(counted):
+                    diff = stored.get(user_id, 0) - counted.get(user_id, 0)
+                    if diff > 0:
+                        self.add(user_id, day, diff)
+                    elif diff < 0:
+                        self.remove(user_id, day, -diff)
+                    drifted += diff != 0
+        if drifted:
+            iggly_log(
+                "warn",
+                f"Reconciled {drifted} drifted drop counters for day {day}.",
+                label="DropCounters",
+            )
+        return drifted
+
+    def add(self, user_id: int, day: int, amount: int = 1):
+        if not self.warmed:
+            return  # the warm-up snapshot will include this drop
+        self.totals[user_id] += amount
+        self.daily[(user_id, day)] += amount
+        self.window.add(user_id, day, amount)
+
+    def remove(self, user_id: int, day: int, amount: int = 1):
+        if not self.warmed:
+            return
+        self.window.remove(user_id, day, min(amount, self.daily[(user_id, day)]))
+        self.totals[user_id] = max(self.totals[user_id] - amount, 0)
+        self.daily[(user_id, day)] = max(self.daily[(user_id, day)] - amount, 0)
+
+    # 🕛 Noon reset: roll the oldest day out of the window
+    def advance_day(self, day: Optional[int]):
+        if self.warmed and day is not None:
+            self.window.advance(day)
+
+    # 🌸 One day's standings, drops desc then user_id (like top_daily_drops)
+    async def top_daily(self, bot, day: int) -> List[Tuple[int, int]]:
+        await self.ensure_warm(bot)
+        counts = self.day_counts(day)
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+    def day_counts(self, day: int) -> Dict[int, int]:
+        if self.window.contains(day):
+            return self.window.per_day.get(day, {})
+        return {u: n for (u, d), n in self.daily.items() if d == day and n > 0}
+
+    # 🏆 Top `n` over the `days` ending at `last_day`; None if the window
+    # can't answer that range (caller falls back to storage)
+    async def top_in_window(
+        self, bot, last_day: int, days: int, n: int
+    ) -> Optional[List[Tuple[int, int]]]:
+        if days != self.window.days:
+            return None
+        await self.ensure_warm(bot)
+        self.window.advance(last_day)
+        if self.window.last_day != last_day:
+            return None
+        return self.window.top(n)
+
+    def get_total(self, user_id: int) -> int:
+        return self.totals.get(user_id, 0)
+
+    def get_daily(self, user_id: int, day: int) -> int:
+        return self.daily.get((user_id, day), 0)
+
+    # 🧹 Forget everything (after /reset-clan-promo wipes the drop table)
+    def clear(self):
+        self.totals = defaultdict(int)
+        self.daily = defaultdict(int)
+        self.window.clear()
+        self.warmed = True
+
+
+drop_counters = DropCounterStore()  # 🏷️ Singleton counter store
@@ -0,0 +1,83 @@
+import heapq
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# ————————————————————————————————
+# 🪟 Rolling Drop Window – Per-user drop totals over the last N day labels
+# ————————————————————————————————
+# Owned by DropCounterStore (utils/drop_counters.py), which feeds it every
+# drop it counts. The window ends at the newest day seen; when the noon reset
+# moves it forward, the days that fall out are subtracted from the totals.
+# Top-N is a heap pick over the totals, same order as the Postgres query
+# (drops desc, then user_id).
+
+WINDOW_DAYS = 12  # 📅 Length of the promo, and of the "All Time" leaderboard
+
+
+class RollingDropWindow:
+    def __init__(self, days: int = WINDOW_DAYS):
+        self.days = days
+        self.last_day: Optional[int] = None
+        self.per_day: Dict[int, Counter] = defaultdict(Counter)  # day -> user -> drops
+        self.totals: Counter = Counter()  # user_id -> drops inside the window
+
+    @property
+    def first_day(self) -> Optional[int]:
+        return None if self.last_day is None else self.last_day - self.days + 1
+
+    def contains(self, day: int) -> bool:
+        return self.last_day is not None and self.first_day <= day <= self.last_day
+
+    # 🌸 Rebuild from (user_id, day, drops) rows, ending the window at last_day
+    def load(self, rows: Iterable[Tuple[int, int, int]], last_day: Optional[int]):
+        self.last_day = last_day
+        self.per_day = defaultdict(Counter)
+        self.totals = Counter()
+        for user_id, day, drops in rows:
+            if drops > 0 and self.contains(day):
+                self.per_day[day][user_id] += drops
+                self.totals[user_id] += drops
+
+    # ⏩ Slide the window so it ends at `day`, rolling off the oldest days
+    def advance(self, day: int):
+        if self.last_day is None:
+            self.last_day = day
+            return
+        if day <= self.last_day:
+            return
+        self.last_day = day
+        for old_day in [d for d in self.per_day if d < self.first_day]:
+            self.totals.subtract(self.per_day.pop(old_day))
+        self.totals = +self.totals  # drop users who hit zero
+
+    def add(self, user_id: int, day: int, amount: int = 1):
+        if self.last_day is None or day > self.last_day:
+            self.advance(day)
+        if not self.contains(day):
+            return  # 🍂 Manual drop for a day already rolled off
+        self.per_day[day][user_id] += amount
+        self.totals[user_id] += amount
+
+    def remove(self, user_id: int, day: int, amount: int = 1):
+        if not self.contains(day):
+            return
+        counts = self.per_day[day]
+        amount = min(amount, counts[user_id])
+        if amount <= 0:
+            return
+        counts[user_id] -= amount
+        self.totals[user_id] -= amount
+        if counts[user_id] <= 0:
+            del counts[user_id]
+        if self.totals[user_id] <= 0:
+            del self.totals[user_id]
+
+    def clear(self):
+        self.per_day = defaultdict(Counter)
+        self.totals = Counter()
+
+    # 🏆 Top `n` users by drops in the window
+    def top(self, n: int) -> List[Tuple[int, int]]:
+        return heapq.nlargest(
+            n, self.totals.items(), key=lambda item: (item[1], -item[0])
+        )
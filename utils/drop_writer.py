@@ -0,0 +1,174 @@
+import asyncio
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
+
+from utils.drop_counters import drop_counters
+from utils.storage.get_storage import get_storage
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 🧺 Drop Writer – Group-commits plushie drops into one multi-row INSERT
+# ————————————————————————————————
+
+MAX_BATCH_SIZE = 200  # 📦 Most rows written by a single INSERT
+MAX_LATENCY = 0.25  # ⏱️ Seconds the oldest queued drop may wait before a flush
+
+PendingDrop = Tuple[int, str, datetime, int, Optional[int], asyncio.Future]
+
+
+class DropWriter:
+    def __init__(
+        self, max_batch_size: int = MAX_BATCH_SIZE, max_latency: float = MAX_LATENCY
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.bot = None
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+        self.pending: Set[asyncio.Future] = set()  # 🧺 Submitted, not yet landed
+
+    @property
+    def is_running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    # 🌸 Start the background flusher (safe to call more than once)
+    def start(self, bot):
+        self.bot = bot
+        if self.is_running:
+            return
+        self.queue = asyncio.Queue()
+        self.task = asyncio.get_running_loop().create_task(self.run())
+        iggly_log("ready", "Drop writer started.", label="DropWriter")
+
+    # 💌 Queue a drop and wait until its batch is committed (and counted).
+    # Resolves True if the row landed, False if its source message already had one.
+    async def submit(
+        self,
+        bot,
+        user_id: int,
+        method: str,
+        drop_time: datetime,
+        day: int,
+        source_message_id: Optional[int] = None,
+    ) -> bool:
+        future = asyncio.get_running_loop().create_future()
+        pending = (user_id, method, drop_time, day, source_message_id, future)
+        self.pending.add(future)
+        future.add_done_callback(self.pending.discard)
+
+        if not self.is_running:
+            if self.queue is not None:
+                # 🧸 Writer was closed (shutdown) — write straight through
+                self.bot = bot
+                await self.flush([pending])
+                return await future
+            self.start(bot)
+
+        self.queue.put_nowait(pending)
+        return await future
+
+    # 🔁 Collect drops until the batch is full or the oldest one hits max_latency
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        closing = False
+        batch: List[PendingDrop] = []
+        try:
+            while not closing:
+                first = await self.queue.get()
+                if first is None:
+                    break
+
+                batch = [first]
+                deadline = loop.time() + self.max_latency
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self.queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is None:
+                        closing = True
+                        break
+                    batch.append(item)
+
+                await self.flush(batch)
+                batch = []
+        except BaseException:
+            # 🧯 Cancelled or crashed: nothing will write what's in hand or queued
+            self.abandon(batch)
+            raise
+
+    # 🧯 Fail every drop the loop can no longer write, so no submitter waits forever
+    def abandon(self, batch: List[PendingDrop]):
+        while not self.queue.empty():
+            item = self.queue.get_nowait()
+            if item is not None:
+                batch.append(item)
+        error = RuntimeError("Drop writer stopped before this drop was written")
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(error)
+        if batch:
+            iggly_log(
+                "error",
+                f"Drop writer stopped with {len(batch)} drops unwritten.",
+                label="DropWriter",
+            )
+
+    # 🧮 Landed rows are counted in drop_counters inside the same write
+    async def flush(self, batch: List[PendingDrop]):
+        async with drop_counters.writing():
+            try:
+                inserted = await get_storage(self.bot).insert_drops(
+                    [pending[:5] for pending in batch]
+                )
+            except Exception as e:
+                iggly_log(
+                    "error",
+                    f"Failed to write batch of {len(batch)} drops: {e}",
+                    label="DropWriter",
+                )
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            for user_id, _, _, day, source_id, future in batch:
+                # Only the first row per source message in a batch counts as landed
+                landed = source_id is None or source_id in inserted
+                inserted.discard(source_id)
+                if landed:
+                    drop_counters.add(user_id, day)
+                if not future.done():
+                    future.set_result(landed)
+
+    # ⏳ Wait (up to `timeout`) for every drop submitted so far to land
+    async def drain(self, timeout: float) -> int:
+        waiting = list(self.pending)
+        if not waiting:
+            return 0
+        _, not_done = await asyncio.wait(waiting, timeout=timeout)
+        return len(waiting) - len(not_done)
+
+    # 🌙 Flush everything still queued and stop the background task
+    async def close(self):
+        if not self.is_running:
+            return
+        self.queue.put_nowait(None)
+        await self.task
+        self.task = None
+
+        # Anything queued behind the sentinel still gets written
+        leftovers = []
+        while not self.queue.empty():
+            item = self.queue.get_nowait()
+            if item is not None:
+                leftovers.append(item)
+        if leftovers:
+            await self.flush(leftovers)
+        iggly_log("ready", "Drop writer flushed and stopped.", label="DropWriter")
+
+
+drop_writer = DropWriter()  # 🏷️ Singleton writer instance
@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Set
+
+import discord
+
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 🎐 Edit Dispatcher – Coalesces repeated edits of the same message
+# ————————————————————————————————
+# PokéMeow edits the same catch message several times. Each message id gets
+# at most one pending dispatch; edits that land before it starts only replace
+# the payload, so the handler sees the newest version once. An edit that lands
+# while the handler is running for that message is run afterwards by the same
+# task (once, with the newest payload), so one message never has two handler
+# runs at the same time. Outgoing Discord calls are paced by send_scheduler,
+# not here.
+
+EditHandler = Callable[[discord.Message, Any], Awaitable[None]]
+
+
+class EditDispatcher:
+    def __init__(self, handler: EditHandler):
+        self.handler = handler
+        self.pending: Dict[int, tuple] = {}  # message_id -> (message, payload)
+        self.running: Set[int] = set()  # message_ids with a dispatch task
+        self.tasks: Set[asyncio.Task] = set()
+
+        # 📊 Counters
+        self.dispatched = 0
+        self.coalesced = 0
+
+    # 💌 Queue an edit; a newer edit of a still-pending message replaces it
+    def submit(self, message: discord.Message, payload: Any = None):
+        if message.id in self.pending:
+            self.pending[message.id] = (message, payload)
+            self.coalesced += 1
+            return
+
+        self.pending[message.id] = (message, payload)
+        if message.id in self.running:
+            return  # 🔁 Its running task picks this up when the handler returns
+        self.running.add(message.id)
+        task = asyncio.create_task(self.dispatch(message.id))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def dispatch(self, message_id: int):
+        try:
+            while message_id in self.pending:
+                message, payload = self.pending.pop(message_id)
+                self.dispatched += 1
+                try:
+                    await self.handler(message, payload)
+                except Exception as e:
+                    iggly_log(
+                        "error",
+                        f"Edit handler failed for message {message_id}: {e}",
+                        label="EditDispatcher",
+                    )
+        finally:
+            self.running.discard(message_id)
+
+    # 🌙 Let already-queued edits finish (used on cog unload)
+    async def close(self):
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
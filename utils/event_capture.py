@@ -0,0 +1,92 @@
+import json
+import os
+import time
+from typing import IO, Optional
+
+import discord
+
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 🎥 Event Capture – Records PokéMeow traffic from watched channels to JSONL
+# ————————————————————————————————
+# Turned on by setting IGGLY_CAPTURE_PATH. Each line holds only the fields the
+# ingestion path reads, so benchmarks/replay_event_watcher.py (and
+# benchmarks/bench_classifier.py) can replay it offline:
+#   {"kind": "message"|"edit", "ts", "channel_id", "message_id", "author_id",
+#    "content", "embed": {"description", "color"} | null,
+#    "reference_id", "reference_author_id"}
+
+CAPTURE_PATH_ENV = "IGGLY_CAPTURE_PATH"
+FLUSH_EVERY = 50  # 📦 Lines buffered before the file is flushed
+
+
+class EventCapture:
+    def __init__(self, path: Optional[str] = None):
+        self.explicit_path = path
+        self.file: Optional[IO[str]] = None
+        self.written = 0
+
+    # 🔍 Read lazily so load_dotenv() in main.py has already run
+    @property
+    def path(self) -> Optional[str]:
+        return self.explicit_path or os.getenv(CAPTURE_PATH_ENV)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def open(self):
+        if not self.enabled or self.file is not None:
+            return
+        self.file = open(self.path, "a", encoding="utf-8")
+        iggly_log("ready", f"Capturing PokéMeow events to {self.path}", label="Capture")
+
+    def record(
+        self,
+        kind: str,
+        message: discord.Message,
+        reference_author_id: Optional[int] = None,
+    ):
+        if not self.enabled:
+            return
+        if self.file is None:
+            self.open()
+
+        embed = None
+        if message.embeds:
+            first = message.embeds[0]
+            embed = {
+                "description": first.description,
+                "color": first.color.value if first.color else None,
+            }
+
+        reference = message.reference
+        if reference_author_id is None and reference is not None:
+            resolved = reference.resolved
+            if isinstance(resolved, discord.Message):
+                reference_author_id = resolved.author.id
+
+        row = {
+            "kind": kind,
+            "ts": time.time(),
+            "channel_id": message.channel.id,
+            "message_id": message.id,
+            "author_id": message.author.id,
+            "content": message.content,
+            "embed": embed,
+            "reference_id": reference.message_id if reference else None,
+            "reference_author_id": reference_author_id,
+        }
+        self.file.write(json.dumps(row, separators=(",", ":")) + "\n")
+        self.written += 1
+        if self.written % FLUSH_EVERY == 0:
+            self.file.flush()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+event_capture = EventCapture()  # 🏷️ Singleton capture
@@ -1,12 +1,71 @@
 import os
 import ssl
+from typing import Any, Dict
 
 import asyncpg
 
+from utils.instrumented_pool import InstrumentedPool
+from utils.storage.queries import PreparedConnection, queries
+
+# ————————————————————————————————
+# 🎛️ Pool settings – override any of these from the environment / .env
+# ————————————————————————————————
+POOL_DEFAULTS = {
+    "DB_POOL_MIN_SIZE": 2,  # 🌱 Connections opened (and warmed) at startup
+    "DB_POOL_MAX_SIZE": 10,  # 🧺 Ceiling during drop bursts
+    "DB_COMMAND_TIMEOUT": 30.0,  # ⏱️ Seconds before a single query is cancelled
+    "DB_MAX_IDLE_LIFETIME": 300.0,  # 💤 Seconds an idle connection is kept
+    "DB_STATEMENT_CACHE_SIZE": 100,  # 📇 asyncpg's per-connection implicit cache
+    "DB_ACQUIRE_TIMEOUT": None,  # 🚰 Seconds to wait for a free connection (unset: no limit)
+}
+
+
+def pool_settings() -> Dict[str, Any]:
+    settings = {}
+    for key, default in POOL_DEFAULTS.items():
+        raw = os.getenv(key)
+        cast = float if default is None else type(default)
+        try:
+            settings[key] = cast(raw) if raw else default
+        except ValueError:
+            print(f"[💔 DB WARN] Ignoring invalid {key}={raw!r}, using {default}")
+            settings[key] = default
+    return settings
+
+
+async def create_pool(dsn: str, ssl_context, settings: Dict[str, Any]):
+    pool = await asyncpg.create_pool(
+        dsn=dsn,
+        ssl=ssl_context,
+        min_size=settings["DB_POOL_MIN_SIZE"],
+        max_size=settings["DB_POOL_MAX_SIZE"],
+        command_timeout=settings["DB_COMMAND_TIMEOUT"],
+        max_inactive_connection_lifetime=settings["DB_MAX_IDLE_LIFETIME"],
+        statement_cache_size=settings["DB_STATEMENT_CACHE_SIZE"],
+        init=queries.prepare_all,
+        connection_class=PreparedConnection,
+    )
+    instrumented = InstrumentedPool(
+        pool, acquire_timeout=settings["DB_ACQUIRE_TIMEOUT"]
+    )
+    try:
+        await instrumented.warm()
+    except Exception:
+        await pool.close()
+        raise
+    return instrumented
+
 
 async def get_pg_pool():
     internal_url = os.getenv("DATABASE_URL")
     public_url = os.getenv("DATABASE_PUBLIC_URL")
+    settings = pool_settings()
+    acquire_timeout = settings["DB_ACQUIRE_TIMEOUT"]
+    print(
+        f"[🌸 DB INFO] Pool size {settings['DB_POOL_MIN_SIZE']}-{settings['DB_POOL_MAX_SIZE']}, "
+        f"command timeout {settings['DB_COMMAND_TIMEOUT']}s, "
+        f"acquire timeout {f'{acquire_timeout}s' if acquire_timeout else 'none'}"
+    )
 
     # 💖 Create SSL context that skips cert verification for snuggly secure vibes
     ssl_context = ssl.create_default_context()
@@ -18,7 +77,7 @@ async def get_pg_pool():
         print(
             f"[🌸 DB INFO] Trying internal URL with SSL verification disabled: {internal_url}"
         )
-        return await asyncpg.create_pool(dsn=internal_url, ssl=ssl_context)
+        return await create_pool(internal_url, ssl_context, settings)
     except Exception as e:
         print(f"[💔 DB WARN] Internal URL failed to connect:\n  → {e}")
 
@@ -27,7 +86,7 @@ async def get_pg_pool():
         print(
             f"[🧸 DB INFO] Trying public URL with SSL verification disabled: {public_url}"
         )
-        return await asyncpg.create_pool(dsn=public_url, ssl=ssl_context)
+        return await create_pool(public_url, ssl_context, settings)
     except Exception as e:
         print(f"[💔 DB WARN] Public URL failed to connect:\n  → {e}")
 
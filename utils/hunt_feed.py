@@ -0,0 +1,116 @@
+import asyncio
+import time
+from typing import Dict, List, Set
+
+import discord
+
+from config.straymons.constants import HUNT_FEED_BATCHING, HUNT_FEED_WINDOW
+from utils.send_scheduler import send_scheduler
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 🧺 Hunt Feed – Optional batching of drop-track embeds into multi-embed posts
+# ————————————————————————————————
+# Quiet period: the first embed posts right away. While posts keep coming
+# within HUNT_FEED_WINDOW, embeds are collected and sent together, up to
+# Discord's 10-embed limit per message. Nothing waits longer than the window.
+# Each embed keeps its own description, so its jump link still works.
+
+MAX_EMBEDS_PER_MESSAGE = 10
+
+
+class HuntFeedBatcher:
+    def __init__(
+        self,
+        enabled: bool = HUNT_FEED_BATCHING,
+        window: float = HUNT_FEED_WINDOW,
+        max_embeds: int = MAX_EMBEDS_PER_MESSAGE,
+    ):
+        self.enabled = enabled
+        self.window = window
+        self.max_embeds = max_embeds
+        self.pending: Dict[int, List[discord.Embed]] = {}  # channel_id -> embeds
+        self.channels: Dict[int, discord.abc.Messageable] = {}
+        self.last_post: Dict[int, float] = {}  # channel_id -> monotonic time
+        self.timers: Dict[int, asyncio.Task] = {}
+        self.tasks: Set[asyncio.Task] = set()
+
+        # 📊 Counters
+        self.embeds_posted = 0
+        self.messages_posted = 0
+
+    async def post(self, channel: discord.abc.Messageable, embed: discord.Embed):
+        if not self.enabled:
+            await self.send(channel, [embed])
+            return
+
+        channel_id = channel.id
+        now = time.monotonic()
+        pending = self.pending.setdefault(channel_id, [])
+        quiet = now - self.last_post.get(channel_id, 0.0) >= self.window
+
+        if quiet and not pending:
+            # 🌸 Leading edge: nothing recent, post immediately
+            self.last_post[channel_id] = now
+            await self.send(channel, [embed])
+            return
+
+        self.channels[channel_id] = channel
+        pending.append(embed)
+        if len(pending) >= self.max_embeds:
+            self.spawn(self.flush(channel_id))
+        elif channel_id not in self.timers:
+            self.timers[channel_id] = self.spawn(self.flush_later(channel_id))
+
+    def spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    async def flush_later(self, channel_id: int):
+        await asyncio.sleep(self.window)
+        await self.flush(channel_id)
+
+    async def flush(self, channel_id: int):
+        timer = self.timers.pop(channel_id, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+
+        pending = self.pending.get(channel_id)
+        if not pending:
+            return
+        batch = pending[: self.max_embeds]
+        del pending[: self.max_embeds]
+        self.last_post[channel_id] = time.monotonic()
+
+        if pending:
+            # Overflow keeps the same latency ceiling
+            self.timers[channel_id] = self.spawn(self.flush_later(channel_id))
+
+        try:
+            await self.send(self.channels[channel_id], batch)
+        except Exception as e:
+            iggly_log(
+                "error",
+                f"Failed to post {len(batch)} hunt-feed embeds: {e}",
+                label="HuntFeed",
+            )
+
+    async def send(self, channel: discord.abc.Messageable, embeds: List[discord.Embed]):
+        if len(embeds) == 1:
+            await send_scheduler.send(channel, embed=embeds[0])
+        else:
+            await send_scheduler.send(channel, embeds=embeds)
+        self.messages_posted += 1
+        self.embeds_posted += len(embeds)
+
+    # 🌙 Post whatever is still collected (used on cog unload)
+    async def close(self):
+        for channel_id in list(self.pending):
+            await self.flush(channel_id)
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+
+
+hunt_feed = HuntFeedBatcher()  # 🏷️ Singleton feed instance
@@ -0,0 +1,167 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Optional
+
+import asyncpg
+
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 🚰 Instrumented Pool – asyncpg pool wrapper that measures every acquire
+# ————————————————————————————————
+# Tracks acquire wait time, in-use vs idle connections and acquire timeouts.
+# When an acquire has to wait longer than `slow_acquire` the pool is counted
+# as exhausted, and a warning is logged (at most once per `warn_interval`),
+# so a burst of drops shows up here before it shows up as handler latency.
+
+SLOW_ACQUIRE = 0.05  # ⏱️ Seconds of waiting for a connection that counts as exhausted
+WARN_INTERVAL = 60.0  # 🔕 Seconds between exhaustion warnings
+RECENT_WAITS = 1024  # 📊 Acquire waits kept for percentiles
+
+
+class InstrumentedPool:
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        acquire_timeout: Optional[float] = None,
+        slow_acquire: float = SLOW_ACQUIRE,
+        warn_interval: float = WARN_INTERVAL,
+    ):
+        self.pool = pool
+        self.acquire_timeout = acquire_timeout
+        self.slow_acquire = slow_acquire
+        self.warn_interval = warn_interval
+        self.last_warning = 0.0
+
+        # 📊 Metrics
+        self.acquires = 0
+        self.timeouts = 0
+        self.exhausted = 0
+        self.in_use = 0
+        self.waiting = 0
+        self.peak_in_use = 0
+        self.peak_waiting = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.recent_waits: Deque[float] = deque(maxlen=RECENT_WAITS)
+
+    # 🧺 Everything else (close, get_size, execute, ...) goes to the real pool
+    def __getattr__(self, name):
+        return getattr(self.pool, name)
+
+    @asynccontextmanager
+    async def acquire(self, timeout: Optional[float] = None):
+        start = time.perf_counter()
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+        try:
+            conn = await self.pool.acquire(timeout=timeout or self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self.warn(
+                f"Timed out waiting {time.perf_counter() - start:.2f}s for a connection",
+                always=True,
+            )
+            raise
+        finally:
+            self.waiting -= 1
+
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        self.record_wait(time.perf_counter() - start)
+        try:
+            yield conn
+        finally:
+            self.in_use -= 1
+            await self.pool.release(conn)
+
+    def record_wait(self, waited: float):
+        self.acquires += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+        self.recent_waits.append(waited)
+        if waited >= self.slow_acquire:
+            self.exhausted += 1
+            self.warn(f"Waited {waited * 1000:.0f}ms for a connection")
+
+    # 🩹 Throttled to one per warn_interval, except for timeouts
+    def warn(self, message: str, always: bool = False):
+        now = time.monotonic()
+        if not always and now - self.last_warning < self.warn_interval:
+            return
+        self.last_warning = now
+        stats = self.stats()
+        iggly_log(
+            "warn",
+            f"{message} (in use {stats['in_use']}/{stats['size']}, "
+            f"waiting {stats['waiting']}, timeouts {stats['timeouts']}, "
+            f"p95 wait {stats['p95_wait_ms']:.1f}ms)",
+            label="DBPool",
+        )
+
+    # 🔥 Open and ping min_size connections so the first drops don't pay for it.
+    # They are all held at once, so the pool can't hand the same one out twice.
+    async def warm(self) -> float:
+        start = time.perf_counter()
+        count = self.pool.get_min_size()
+
+        acquired = await asyncio.gather(
+            *(self.pool.acquire() for _ in range(count)), return_exceptions=True
+        )
+        conns = [conn for conn in acquired if not isinstance(conn, BaseException)]
+        try:
+            await asyncio.gather(*(conn.fetchval("SELECT 1") for conn in conns))
+        finally:
+            await asyncio.gather(*(self.pool.release(conn) for conn in conns))
+        errors = [error for error in acquired if isinstance(error, BaseException)]
+        if errors:
+            raise errors[0]
+        elapsed = time.perf_counter() - start
+        iggly_log(
+            "ready",
+            f"Warmed {count} connections in {elapsed * 1000:.0f}ms.",
+            label="DBPool",
+        )
+        return elapsed
+
+    def percentile_wait(self, pct: float) -> float:
+        if not self.recent_waits:
+            return 0.0
+        ordered = sorted(self.recent_waits)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+    def stats(self) -> Dict[str, float]:
+        size = self.pool.get_size()
+        return {
+            "size": size,
+            "min_size": self.pool.get_min_size(),
+            "max_size": self.pool.get_max_size(),
+            "idle": self.pool.get_idle_size(),
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "peak_in_use": self.peak_in_use,
+            "peak_waiting": self.peak_waiting,
+            "acquires": self.acquires,
+            "timeouts": self.timeouts,
+            "exhausted": self.exhausted,
+            "avg_wait_ms": (
+                (self.wait_total / self.acquires * 1000) if self.acquires else 0.0
+            ),
+            "p95_wait_ms": self.percentile_wait(95) * 1000,
+            "max_wait_ms": self.wait_max * 1000,
+        }
+
+    def summary(self):
+        stats = self.stats()
+        iggly_log(
+            "db",
+            f"Pool {stats['in_use']} in use / {stats['idle']} idle "
+            f"(size {stats['size']}, max {stats['max_size']}, "
+            f"peak {stats['peak_in_use']}), {stats['acquires']} acquires, "
+            f"avg wait {stats['avg_wait_ms']:.2f}ms, p95 {stats['p95_wait_ms']:.2f}ms, "
+            f"max {stats['max_wait_ms']:.2f}ms, {stats['exhausted']} exhausted, "
+            f"{stats['timeouts']} timeouts",
+            label="DBPool",
+        )
@@ -0,0 +1,178 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import discord
+
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 🧭 Member Resolver – user_id -> member / display name for embeds and rewards
+# ————————————————————————————————
+# Shared by the winner list, the leaderboard and the noon announcement. Guild
+# cache hits are free; everything else is kept in a TTL-LRU. Misses for a whole
+# call go out as one gateway member query (up to 100 ids each), and ids that
+# are not members (left the server) fall back to the user lookup. Concurrent
+# lookups for the same id share one request.
+
+DEFAULT_MAX_SIZE = 2048  # 🧂 Resolved ids remembered
+DEFAULT_TTL = 600.0  # ⏱️ Seconds a resolved name is trusted
+QUERY_CHUNK = 100  # 📦 Discord's limit on user_ids per member query
+FETCH_CONCURRENCY = 5  # 🚰 Per-id fallbacks in flight at once
+
+
+class ResolvedMember(NamedTuple):
+    user_id: int
+    display_name: Optional[str]  # None if neither member nor user was found
+    member: Optional[discord.Member]  # None if they are not in the guild
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.user_id}>"
+
+
+class MemberResolver:
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: "OrderedDict[int, Tuple[float, ResolvedMember]]" = OrderedDict()
+        self.inflight: Dict[int, asyncio.Future] = {}
+
+        # 📊 Counters
+        self.hits = 0
+        self.misses = 0
+        self.queries = 0
+        self.fetches = 0
+        self.deduped = 0
+
+    def remember(self, resolved: ResolvedMember):
+        self.entries[resolved.user_id] = (time.monotonic(), resolved)
+        self.entries.move_to_end(resolved.user_id)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def get(self, user_id: int) -> Optional[ResolvedMember]:
+        entry = self.entries.get(user_id)
+        if entry is None:
+            return None
+        stored_at, resolved = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self.entries[user_id]
+            return None
+        return resolved
+
+    def forget(self, user_id: int):
+        self.entries.pop(user_id, None)
+
+    async def resolve(
+        self, guild: discord.Guild, user_id: int, bot=None
+    ) -> ResolvedMember:
+        return (await self.resolve_many(guild, [user_id], bot))[user_id]
+
+    # 🔍 Resolve every id; pass `bot` to also look up users who left the guild
+    async def resolve_many(
+        self, guild: discord.Guild, user_ids: Iterable[int], bot=None
+    ) -> Dict[int, ResolvedMember]:
+        resolved: Dict[int, ResolvedMember] = {}
+        waiting: Dict[int, asyncio.Future] = {}
+        missing: List[int] = []
+
+        for user_id in dict.fromkeys(user_ids):
+            member = guild.get_member(user_id)
+            if member is not None:
+                # 🌸 Guild cache is always fresher than ours
+                resolved[user_id] = ResolvedMember(user_id, member.display_name, member)
+                self.remember(resolved[user_id])
+                continue
+            cached = self.get(user_id)
+            # A remembered "not found" is retried when the caller can look up users
+            if cached is not None and (cached.display_name or bot is None):
+                self.hits += 1
+                resolved[user_id] = cached
+                continue
+            self.misses += 1
+            if user_id in self.inflight:
+                self.deduped += 1
+                waiting[user_id] = self.inflight[user_id]
+            else:
+                missing.append(user_id)
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            futures = {user_id: loop.create_future() for user_id in missing}
+            self.inflight.update(futures)
+            fetched: Dict[int, ResolvedMember] = {}
+            try:
+                fetched = await self.fetch(guild, missing, bot)
+            finally:
+                for user_id, future in futures.items():
+                    self.inflight.pop(user_id, None)
+                    future.set_result(
+                        fetched.get(user_id) or ResolvedMember(user_id, None, None)
+                    )
+            for user_id in missing:
+                resolved[user_id] = futures[user_id].result()
+                self.remember(resolved[user_id])
+
+        for user_id, future in waiting.items():
+            resolved[user_id] = await asyncio.shield(future)
+        return resolved
+
+    # 🌐 One member query per 100 ids, then per-id user lookups for the rest
+    async def fetch(
+        self, guild: discord.Guild, user_ids: List[int], bot=None
+    ) -> Dict[int, ResolvedMember]:
+        found: Dict[int, ResolvedMember] = {}
+        for i in range(0, len(user_ids), QUERY_CHUNK):
+            chunk = user_ids[i : i + QUERY_CHUNK]
+            self.queries += 1
+            try:
+                members = await guild.query_members(
+                    user_ids=chunk, limit=len(chunk), cache=True
+                )
+            except (asyncio.TimeoutError, discord.ClientException) as e:
+                iggly_log(
+                    "warn",
+                    f"Member query for {len(chunk)} ids failed ({e}); fetching one by one.",
+                    label="MemberResolver",
+                )
+                members = await self.fetch_members(guild, chunk)
+            for member in members:
+                found[member.id] = ResolvedMember(
+                    member.id, member.display_name, member
+                )
+
+        if bot is not None:
+            departed = [user_id for user_id in user_ids if user_id not in found]
+            for user in await self.fetch_users(bot, departed):
+                found[user.id] = ResolvedMember(user.id, user.name, None)
+        return found
+
+    async def fetch_members(
+        self, guild: discord.Guild, user_ids: List[int]
+    ) -> List[discord.Member]:
+        return await self.gather_limited(guild.fetch_member, user_ids)
+
+    async def fetch_users(self, bot, user_ids: List[int]) -> List[discord.User]:
+        cached = [bot.get_user(user_id) for user_id in user_ids]
+        users = [user for user in cached if user is not None]
+        unknown = [user_id for user_id, user in zip(user_ids, cached) if user is None]
+        return users + await self.gather_limited(bot.fetch_user, unknown)
+
+    async def gather_limited(self, fetch, user_ids: List[int]) -> list:
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        async def one(user_id: int):
+            async with semaphore:
+                self.fetches += 1
+                try:
+                    return await fetch(user_id)
+                except discord.HTTPException:
+                    return None  # 👋 Unknown member / user
+
+        results = await asyncio.gather(*(one(user_id) for user_id in user_ids))
+        return [result for result in results if result is not None]
+
+
+member_resolver = MemberResolver()  # 🏷️ Singleton resolver
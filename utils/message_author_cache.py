@@ -0,0 +1,82 @@
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import discord
+
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 💬 Message Author Cache – message_id -> author_id for recent watched messages
+# ————————————————————————————————
+# Filled from on_message in personal channels, so the command a PokéMeow reply
+# points at is usually already known. Misses fall back to fetch_message, with
+# concurrent lookups for the same message id sharing one REST call.
+
+DEFAULT_MAX_SIZE = 4096  # 🧂 Recent messages remembered across all channels
+
+
+class MessageAuthorCache:
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.authors: "OrderedDict[int, int]" = OrderedDict()
+        self.inflight: Dict[int, asyncio.Future] = {}
+
+        # 📊 Counters
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self.deduped = 0
+
+    def remember(self, message_id: int, author_id: int):
+        self.authors[message_id] = author_id
+        self.authors.move_to_end(message_id)
+        if len(self.authors) > self.max_size:
+            self.authors.popitem(last=False)
+
+    def get(self, message_id: int) -> Optional[int]:
+        return self.authors.get(message_id)
+
+    # 🔍 Author of message_id in channel; None if it cannot be fetched
+    async def resolve(
+        self, channel: discord.abc.Messageable, message_id: int
+    ) -> Optional[int]:
+        author_id = self.authors.get(message_id)
+        if author_id is not None:
+            self.hits += 1
+            return author_id
+        self.misses += 1
+
+        inflight = self.inflight.get(message_id)
+        if inflight is not None:
+            self.deduped += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[message_id] = future
+        self.fetches += 1
+        try:
+            message = await channel.fetch_message(message_id)
+            author_id = message.author.id
+            self.remember(message_id, author_id)
+        except discord.HTTPException as e:
+            if e.status == 429:
+                print(
+                    "⏳ [WAIT] [HERSHEY] Rate limited when fetching reply! Falling back... (429)"
+                )
+            else:
+                print(f"❌ [ERROR] [HERSHEY] Failed to fetch referenced message: {e}")
+            author_id = None
+        except Exception as e:
+            iggly_log(
+                "error",
+                f"Unexpected error fetching message {message_id}: {e}",
+                label="AuthorCache",
+            )
+            author_id = None
+        finally:
+            # 🛟 Waiters are released even if this fetch is cancelled
+            self.inflight.pop(message_id, None)
+            if not future.done():
+                future.set_result(author_id)
+        return author_id
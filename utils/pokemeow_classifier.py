@@ -0,0 +1,102 @@
+import re
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+import discord
+
+from config.straymons.constants import FISH_COLOR
+
+# ————————————————————————————————
+# 🎀 PokéMeow Classifier – Parses each PokéMeow message/embed exactly once
+# ————————————————————————————————
+
+# 🌸 Precompiled patterns (compiled once at import, reused for every message)
+BATTLE_WIN_RE = re.compile(r":\S+:\s\*\*(.+?)\*\*\swon the battle")
+POKECOIN_RE = re.compile(r"([\d,]+) PokeCoins")
+CAUGHT_RE = re.compile(r"you caught an? [^*]*\*\*([^*]+)\*\*")
+
+# 🍓 Cheap substring markers checked before any regex runs
+BATTLE_MARKER = "won the battle"
+CATCH_MARKER = "you caught a"
+
+
+class PokeMeowEventKind(Enum):
+    NONE = "none"
+    BATTLE_WIN = "battle"
+    CATCH = "catch"
+    FISH = "fish"
+
+
+@dataclass(frozen=True, slots=True)
+class PokeMeowEvent:
+    """🧸 Typed result of classifying a single PokéMeow message or embed."""
+
+    kind: PokeMeowEventKind
+    username: Optional[str] = None  # lowercased battle winner
+    pokemon: Optional[str] = None  # lowercased caught Pokémon
+    pokecoins: Optional[int] = None  # PokeCoins won, if mentioned
+    is_mew: bool = False
+
+    @property
+    def is_drop_candidate(self) -> bool:
+        return self.kind is not PokeMeowEventKind.NONE
+
+
+NO_EVENT = PokeMeowEvent(PokeMeowEventKind.NONE)
+
+
+# 💖 Classify plain message content (NPC battle results)
+def classify_content(content: Optional[str]) -> PokeMeowEvent:
+    if not content or BATTLE_MARKER not in content:
+        return NO_EVENT
+
+    username_match = BATTLE_WIN_RE.search(content)
+    if not username_match:
+        return NO_EVENT
+
+    pokecoin_match = POKECOIN_RE.search(content)
+    pokecoins = (
+        int(pokecoin_match.group(1).replace(",", "")) if pokecoin_match else None
+    )
+
+    return PokeMeowEvent(
+        PokeMeowEventKind.BATTLE_WIN,
+        username=username_match.group(1).lower(),
+        pokecoins=pokecoins,
+    )
+
+
+# 💖 Classify an embed description + color (catch / fish results)
+def classify_embed_parts(
+    description: Optional[str], color_value: Optional[int]
+) -> PokeMeowEvent:
+    if not description:
+        return NO_EVENT
+
+    description = description.lower()
+    if CATCH_MARKER not in description:
+        return NO_EVENT
+
+    pokemon_match = CAUGHT_RE.search(description)
+    pokemon = pokemon_match.group(1).strip() if pokemon_match else None
+    is_mew = "**mew**" in description or "**shiny mew**" in description
+    kind = (
+        PokeMeowEventKind.FISH if color_value == FISH_COLOR else PokeMeowEventKind.CATCH
+    )
+    return PokeMeowEvent(kind, pokemon=pokemon, is_mew=is_mew)
+
+
+def classify_embed(embed: discord.Embed) -> PokeMeowEvent:
+    return classify_embed_parts(
+        embed.description, embed.color.value if embed.color else None
+    )
+
+
+# 🎯 Single entry point used by EventWatcher for both new and edited messages
+def classify_message(message: discord.Message) -> PokeMeowEvent:
+    if message.embeds:
+        event = classify_embed(message.embeds[0])
+        if event.is_drop_candidate:
+            return event
+    return classify_content(message.content)
@@ -0,0 +1,42 @@
+from collections import OrderedDict
+from typing import Optional
+
+# ————————————————————————————————
+# 🔁 Processed Messages – Bounded set of source message ids already rolled
+# ————————————————————————————————
+# First line of the idempotency layer: a PokéMeow message id is claimed before
+# its roll, so repeated edits of the same catch never roll twice. The
+# processed_drop_messages table backs this up across restarts.
+
+DEFAULT_MAX_SIZE = 8192  # 🧂 Well beyond the edits PokéMeow makes per message
+
+
+class ProcessedMessageSet:
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.ids: "OrderedDict[int, None]" = OrderedDict()
+        self.duplicates = 0
+
+    # 👀 True if the id was already claimed (checked before side effects such
+    # as cooldown stamps, so a repeated event costs nothing)
+    def seen(self, message_id: int) -> bool:
+        if message_id in self.ids:
+            self.duplicates += 1
+            return True
+        return False
+
+    # ✅ True the first time a message id is seen, False afterwards
+    def claim(self, message_id: int) -> bool:
+        if message_id in self.ids:
+            self.duplicates += 1
+            return False
+        self.ids[message_id] = None
+        if len(self.ids) > self.max_size:
+            self.ids.popitem(last=False)
+        return True
+
+    def __contains__(self, message_id: Optional[int]) -> bool:
+        return message_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
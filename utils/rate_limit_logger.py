@@ -1,5 +1,7 @@
 import logging
 
+from utils.send_scheduler import SendPriority, send_scheduler
+
 # 🛡️ Your private log channel ID here
 LOG_CHANNEL_ID = 1400998689018875904  # Bot Logs  # <-- change this
 
@@ -27,13 +29,17 @@ class RateLimitLogger(logging.Handler):
         await self.bot.wait_until_ready()
         channel = self.bot.get_channel(LOG_CHANNEL_ID)
         if channel:
-            await channel.send(message)
+            # 📜 Log traffic queues behind drop announcements
+            await send_scheduler.send(channel, message, priority=SendPriority.LOG)
 
     def emit(self, record):
         message = record.getMessage()
         if "429" not in message and "rate limited" not in message.lower():
             return
 
+        # ⛔ Let the send scheduler back off the affected route right away
+        send_scheduler.note_rate_limit(message)
+
         # Try to find route
         route_info = None
         label = None
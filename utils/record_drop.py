@@ -1,6 +1,11 @@
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
+from utils.current_day_cache import current_day_cache
+from utils.drop_counters import drop_counters
+from utils.drop_writer import drop_writer
+from utils.storage.get_storage import get_storage
+
 ASIA_MANILA = ZoneInfo("Asia/Manila")
 
 
@@ -9,25 +14,19 @@ async def record_item_drop(
     user_id: int,
     method: str,
     drop_time: datetime = None,
-):
+    source_message_id: int = None,
+) -> bool:
+    """
+    💖 Record a drop; returns False if `source_message_id` already has a drop.
+    """
     drop_time = drop_time or datetime.now(tz=ASIA_MANILA)
+    current_day = await current_day_cache.get(bot) or 1  # fallback default
 
-    async with bot.pg_pool.acquire() as conn:
-        # 🔍 Get the current day from the DB
-        row = await conn.fetchrow("SELECT day_number FROM current_day LIMIT 1;")
-        current_day = row["day_number"] if row else 1  # fallback default
-
-        # 📥 Record the drop with day label
-        await conn.execute(
-            """
-            INSERT INTO member_item_drops (user_id, method, drop_time, day)
-            VALUES ($1, $2, $3, $4)
-            """,
-            user_id,
-            method,
-            drop_time,
-            current_day,
-        )
+    # 🧺 Queue into the group-commit writer; returns once the batch has landed
+    # (the writer also counts it in drop_counters)
+    return await drop_writer.submit(
+        bot, user_id, method, drop_time, current_day, source_message_id
+    )
 
 from datetime import datetime
 
@@ -39,28 +38,14 @@ async def remove_item_drops(
     drop_time: datetime = None,
 ):
     drop_time = drop_time or datetime.now(tz=ASIA_MANILA)
+    current_day = await current_day_cache.get(bot) or 1  # fallback default
 
-    async with bot.pg_pool.acquire() as conn:
-        # Get current day from DB
-        row = await conn.fetchrow("SELECT day_number FROM current_day LIMIT 1;")
-        current_day = row["day_number"] if row else 1  # fallback default
-
-        # Delete the specified number of rows for that user and day
-        await conn.execute(
-            """
-            DELETE FROM member_item_drops
-            WHERE ctid IN (
-                SELECT ctid
-                FROM member_item_drops
-                WHERE user_id = $1 AND day = $2
-                ORDER BY drop_time DESC
-                LIMIT $3
-            )
-            """,
-            user_id,
-            current_day,
-            amount,
+    # 🧮 Keep the in-memory counters in step
+    async with drop_counters.writing():
+        deleted = await get_storage(bot).delete_latest_drops(
+            user_id, current_day, amount
         )
+        drop_counters.remove(user_id, current_day, deleted)
 
 
 async def record_manual_item_drop(
@@ -75,49 +60,26 @@ async def record_manual_item_drop(
     """
     drop_time = drop_time or datetime.now(tz=ASIA_MANILA)
 
-    async with bot.pg_pool.acquire() as conn:
-        await conn.execute(
-            """
-            INSERT INTO member_item_drops (user_id, method, drop_time, day)
-            VALUES ($1, $2, $3, $4)
-            """,
-            user_id,
-            method,
-            drop_time,
-            day,
-        )
+    async with drop_counters.writing():
+        await get_storage(bot).insert_drops([(user_id, method, drop_time, day, None)])
+        drop_counters.add(user_id, day)
 
 
-# 💖 Get total number of item drops for a user
+# 💖 Get total number of item drops for a user (served from in-memory counters)
 async def get_total_drops(bot, user_id: int) -> int:
-    async with bot.pg_pool.acquire() as conn:
-        result = await conn.fetchval(
-            """
-            SELECT COUNT(*) FROM member_item_drops
-            WHERE user_id = $1
-            """,
-            user_id,
-        )
-        return result or 0
+    await drop_counters.ensure_warm(bot)
+    return drop_counters.get_total(user_id)
 
 
 # 💕 Get number of item drops for today (based on current day label)
 async def get_daily_drops(bot, user_id: int) -> int:
-    async with bot.pg_pool.acquire() as conn:
-        # 🌸 Get current day from current_day table
-        current_day = await conn.fetchval("SELECT day_number FROM current_day LIMIT 1")
-
-        if current_day is None:
-            print("[WARN] current_day table has no value.")
-            return 0
-
-        # 🍃 Count how many drops the user has on the current day
-        result = await conn.fetchval(
-            """
-            SELECT COUNT(*) FROM member_item_drops
-            WHERE user_id = $1 AND day = $2
-            """,
-            user_id,
-            current_day,
-        )
-        return result or 0
+    # 🌸 Get current day from the cached current_day value
+    current_day = await current_day_cache.get(bot)
+
+    if current_day is None:
+        print("[WARN] current_day table has no value.")
+        return 0
+
+    # 🍃 Count how many drops the user has on the current day
+    await drop_counters.ensure_warm(bot)
+    return drop_counters.get_daily(user_id, current_day)
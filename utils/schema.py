@@ -0,0 +1,513 @@
+import time
+from typing import List, NamedTuple
+
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 🧱 Schema – Versioned migrations, applied at startup from setup_hook
+# ————————————————————————————————
+# Each migration runs once, in its own transaction, and is recorded in
+# schema_migrations. Append new migrations with the next version number;
+# never edit one that has shipped. Versions 1 and 2 were idempotent DDL
+# applied on every start before this runner existed, so they are safe to
+# run once more on databases that already have them.
+
+MIGRATIONS_LOCK_ID = 0x1661B0FF  # 🔒 pg_advisory_xact_lock key: one runner at a time
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    statements: List[str]
+
+
+MIGRATIONS = [
+    # 🔁 One drop per PokéMeow source message (NULL for manual drops)
+    Migration(
+        1,
+        "member_item_drops.source_message_id",
+        [
+            """
+            ALTER TABLE member_item_drops
+            ADD COLUMN IF NOT EXISTS source_message_id BIGINT
+            """,
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS member_item_drops_source_message_id_key
+            ON member_item_drops (source_message_id)
+            """,
+        ],
+    ),
+    # 📊 Per-day leaderboard counts, kept in step with member_item_drops by
+    # statement-level triggers (one grouped upsert per INSERT batch)
+    Migration(
+        2,
+        "member_item_daily_counts",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS member_item_daily_counts (
+                day INT NOT NULL,
+                user_id BIGINT NOT NULL,
+                drops INT NOT NULL,
+                PRIMARY KEY (day, user_id)
+            )
+            """,
+            """
+            CREATE OR REPLACE FUNCTION member_item_daily_counts_sync() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                    UPDATE member_item_daily_counts c
+                    SET drops = c.drops - o.drops
+                    FROM (
+                        SELECT day, user_id, COUNT(*) AS drops
+                        FROM old_rows
+                        GROUP BY day, user_id
+                    ) o
+                    WHERE c.day = o.day AND c.user_id = o.user_id;
+
+                    DELETE FROM member_item_daily_counts c
+                    USING (SELECT DISTINCT day, user_id FROM old_rows) o
+                    WHERE c.day = o.day AND c.user_id = o.user_id AND c.drops <= 0;
+                END IF;
+
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    INSERT INTO member_item_daily_counts (day, user_id, drops)
+                    SELECT day, user_id, COUNT(*)
+                    FROM new_rows
+                    GROUP BY day, user_id
+                    ORDER BY day, user_id
+                    ON CONFLICT (day, user_id) DO UPDATE
+                    SET drops = member_item_daily_counts.drops + EXCLUDED.drops;
+                END IF;
+
+                RETURN NULL;
+            END
+            $$
+            """,
+            """
+            CREATE OR REPLACE FUNCTION member_item_daily_counts_truncate() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                TRUNCATE member_item_daily_counts;
+                RETURN NULL;
+            END
+            $$
+            """,
+            "DROP TRIGGER IF EXISTS member_item_drops_counts_insert ON member_item_drops",
+            """
+            CREATE TRIGGER member_item_drops_counts_insert
+            AFTER INSERT ON member_item_drops
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION member_item_daily_counts_sync()
+            """,
+            "DROP TRIGGER IF EXISTS member_item_drops_counts_delete ON member_item_drops",
+            """
+            CREATE TRIGGER member_item_drops_counts_delete
+            AFTER DELETE ON member_item_drops
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION member_item_daily_counts_sync()
+            """,
+            "DROP TRIGGER IF EXISTS member_item_drops_counts_update ON member_item_drops",
+            """
+            CREATE TRIGGER member_item_drops_counts_update
+            AFTER UPDATE ON member_item_drops
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION member_item_daily_counts_sync()
+            """,
+            "DROP TRIGGER IF EXISTS member_item_drops_counts_truncate ON member_item_drops",
+            """
+            CREATE TRIGGER member_item_drops_counts_truncate
+            AFTER TRUNCATE ON member_item_drops
+            FOR EACH STATEMENT EXECUTE FUNCTION member_item_daily_counts_truncate()
+            """,
+            # 🌱 First run on an existing database: seed the counts from the drops
+            """
+            INSERT INTO member_item_daily_counts (day, user_id, drops)
+            SELECT day, user_id, COUNT(*)
+            FROM member_item_drops
+            WHERE NOT EXISTS (SELECT 1 FROM member_item_daily_counts)
+            GROUP BY day, user_id
+            """,
+        ],
+    ),
+    # 🗂️ Indexes for the remaining hot lookups. Day and drop_time filters on
+    # member_item_drops moved to member_item_daily_counts (version 2), whose
+    # (day, user_id) primary key already serves the 12-day range.
+    Migration(
+        3,
+        "drop and winner indexes",
+        [
+            # remove_item_drops: WHERE user_id AND day ORDER BY drop_time DESC;
+            # its (user_id) prefix also serves per-user lookups
+            """
+            CREATE INDEX IF NOT EXISTS member_item_drops_user_day_time_idx
+            ON member_item_drops (user_id, day, drop_time DESC)
+            """,
+            # get_top_daily_drops: WHERE day ORDER BY drops DESC, user_id
+            """
+            CREATE INDEX IF NOT EXISTS member_item_daily_counts_day_rank_idx
+            ON member_item_daily_counts (day, drops DESC, user_id)
+            """,
+            # get_daily_winner / check_daily_winner_exists_for_day (the ON CONFLICT
+            # key may lead with user_id, so winner_date gets its own index)
+            """
+            CREATE INDEX IF NOT EXISTS daily_item_winners_winner_date_idx
+            ON daily_item_winners (winner_date)
+            """,
+            # get_daily_winner_count
+            """
+            CREATE INDEX IF NOT EXISTS daily_item_winners_user_id_idx
+            ON daily_item_winners (user_id)
+            """,
+        ],
+    ),
+    # 🗂️ member_item_drops becomes LIST-partitioned by day: per-day queries
+    # touch one partition, and /reset-clan-promo drops partitions instead of
+    # deleting row by row. Existing rows are copied into per-day partitions;
+    # member_item_daily_counts is already correct, so the triggers are only
+    # re-created on the new parent after the copy.
+    Migration(
+        4,
+        "partition member_item_drops by day",
+        [
+            "ALTER TABLE member_item_drops RENAME TO member_item_drops_legacy",
+            """
+            CREATE TABLE member_item_drops (
+                LIKE member_item_drops_legacy INCLUDING DEFAULTS INCLUDING IDENTITY
+            ) PARTITION BY LIST (day)
+            """,
+            # 🔢 serial columns: hand the sequence to the new table so dropping
+            # the legacy one keeps it; identity columns: continue the numbering
+            """
+            DO $$
+            DECLARE
+                col RECORD;
+                seq TEXT;
+            BEGIN
+                FOR col IN
+                    SELECT attname, attidentity
+                    FROM pg_attribute
+                    WHERE attrelid = 'member_item_drops_legacy'::regclass
+                      AND attnum > 0 AND NOT attisdropped
+                LOOP
+                    seq := pg_get_serial_sequence('member_item_drops_legacy', col.attname);
+                    CONTINUE WHEN seq IS NULL;
+                    IF col.attidentity = '' THEN
+                        EXECUTE format(
+                            'ALTER SEQUENCE %s OWNED BY member_item_drops.%I',
+                            seq, col.attname
+                        );
+                    ELSE
+                        EXECUTE format(
+                            'SELECT setval(pg_get_serial_sequence(%L, %L), '
+                            'COALESCE((SELECT MAX(%I) FROM member_item_drops_legacy), 0) + 1, false)',
+                            'member_item_drops', col.attname, col.attname
+                        );
+                    END IF;
+                END LOOP;
+            END
+            $$
+            """,
+            # 🧺 Catch-all for a day whose partition doesn't exist yet
+            """
+            CREATE TABLE member_item_drops_default
+            PARTITION OF member_item_drops DEFAULT
+            """,
+            # 📅 Create (once) the partition for day `d`, moving over any of its
+            # rows that already landed in the default partition
+            """
+            CREATE OR REPLACE FUNCTION ensure_member_item_drops_partition(d INT)
+            RETURNS BOOLEAN
+            LANGUAGE plpgsql AS $$
+            DECLARE
+                part TEXT := 'member_item_drops_day_' || d;
+            BEGIN
+                PERFORM pg_advisory_xact_lock(hashtext(part));
+                IF to_regclass(part) IS NOT NULL THEN
+                    RETURN FALSE;
+                END IF;
+
+                EXECUTE format(
+                    'CREATE TABLE %I (LIKE member_item_drops INCLUDING DEFAULTS)', part
+                );
+                EXECUTE format(
+                    'WITH moved AS ('
+                    'DELETE FROM member_item_drops_default WHERE day = %s RETURNING *'
+                    ') INSERT INTO %I SELECT * FROM moved',
+                    d, part
+                );
+                EXECUTE format(
+                    'ALTER TABLE member_item_drops ATTACH PARTITION %I FOR VALUES IN (%s)',
+                    part, d
+                );
+                RETURN TRUE;
+            END
+            $$
+            """,
+            # 🧹 /reset-clan-promo: drop every day partition and empty the rest.
+            # Dropping partitions fires no triggers, so the counts are cleared here.
+            """
+            CREATE OR REPLACE FUNCTION reset_member_item_drops() RETURNS INT
+            LANGUAGE plpgsql AS $$
+            DECLARE
+                part RECORD;
+                dropped INT := 0;
+            BEGIN
+                FOR part IN
+                    SELECT c.relname
+                    FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = 'member_item_drops'::regclass
+                      AND c.relname <> 'member_item_drops_default'
+                LOOP
+                    EXECUTE format('DROP TABLE %I', part.relname);
+                    dropped := dropped + 1;
+                END LOOP;
+
+                TRUNCATE member_item_drops_default;
+                TRUNCATE member_item_daily_counts;
+                RETURN dropped;
+            END
+            $$
+            """,
+            """
+            SELECT ensure_member_item_drops_partition(day)
+            FROM (
+                SELECT DISTINCT day FROM member_item_drops_legacy WHERE day IS NOT NULL
+                UNION
+                SELECT day_number FROM current_day
+                UNION
+                SELECT day_number + 1 FROM current_day
+            ) days
+            WHERE day IS NOT NULL
+            """,
+            """
+            INSERT INTO member_item_drops OVERRIDING SYSTEM VALUE
+            SELECT * FROM member_item_drops_legacy
+            """,
+            # Takes its indexes and triggers with it; the names are reused below
+            "DROP TABLE member_item_drops_legacy",
+            # 🔁 Unique indexes on a partitioned table must include the partition key
+            """
+            CREATE UNIQUE INDEX member_item_drops_source_message_id_key
+            ON member_item_drops (source_message_id, day)
+            """,
+            """
+            CREATE INDEX member_item_drops_user_day_time_idx
+            ON member_item_drops (user_id, day, drop_time DESC)
+            """,
+            # 📊 Statement triggers on the parent see rows routed to every partition
+            """
+            CREATE TRIGGER member_item_drops_counts_insert
+            AFTER INSERT ON member_item_drops
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION member_item_daily_counts_sync()
+            """,
+            """
+            CREATE TRIGGER member_item_drops_counts_delete
+            AFTER DELETE ON member_item_drops
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION member_item_daily_counts_sync()
+            """,
+            """
+            CREATE TRIGGER member_item_drops_counts_update
+            AFTER UPDATE ON member_item_drops
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION member_item_daily_counts_sync()
+            """,
+            """
+            CREATE TRIGGER member_item_drops_counts_truncate
+            AFTER TRUNCATE ON member_item_drops
+            FOR EACH STATEMENT EXECUTE FUNCTION member_item_daily_counts_truncate()
+            """,
+        ],
+    ),
+    # 📬 Progress of bulk role/DM runs (utils/bulk_dispatcher.py), so a run that
+    # is interrupted resumes where it stopped
+    Migration(
+        5,
+        "bulk_dispatch_items",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS bulk_dispatch_items (
+                job TEXT NOT NULL,
+                user_id BIGINT NOT NULL,
+                action TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INT NOT NULL DEFAULT 0,
+                last_error TEXT,
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                PRIMARY KEY (job, user_id, action)
+            )
+            """,
+        ],
+    ),
+    # 🔁 Follow-up to 4, which may already have run and so isn't edited:
+    # - unique indexes on a partitioned table must include the partition key,
+    #   so 4's (source_message_id, day) index only deduped within a day. The
+    #   unpartitioned processed_drop_messages makes it global again; insert_drops
+    #   claims ids there.
+    # - new day partitions copy the parent's constraints.
+    # - (id, day) is made unique if the table has an id column. It is a unique
+    #   index, not a primary key, so day stays nullable: rows without a day
+    #   keep living in the default partition.
+    # CHECK constraints the pre-partition table may have had were not copied by
+    # 4 and aren't known to this repo, so none are restored here.
+    Migration(
+        6,
+        "global drop dedupe and partition constraints",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS processed_drop_messages (
+                source_message_id BIGINT PRIMARY KEY
+            )
+            """,
+            """
+            INSERT INTO processed_drop_messages (source_message_id)
+            SELECT DISTINCT source_message_id FROM member_item_drops
+            WHERE source_message_id IS NOT NULL
+            ON CONFLICT DO NOTHING
+            """,
+            "DROP INDEX IF EXISTS member_item_drops_source_message_id_key",
+            """
+            CREATE OR REPLACE FUNCTION ensure_member_item_drops_partition(d INT)
+            RETURNS BOOLEAN
+            LANGUAGE plpgsql AS $$
+            DECLARE
+                part TEXT := 'member_item_drops_day_' || d;
+            BEGIN
+                PERFORM pg_advisory_xact_lock(hashtext(part));
+                IF to_regclass(part) IS NOT NULL THEN
+                    RETURN FALSE;
+                END IF;
+
+                EXECUTE format(
+                    'CREATE TABLE %I (LIKE member_item_drops '
+                    'INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                    part
+                );
+                EXECUTE format(
+                    'WITH moved AS ('
+                    'DELETE FROM member_item_drops_default WHERE day = %s RETURNING *'
+                    ') INSERT INTO %I SELECT * FROM moved',
+                    d, part
+                );
+                EXECUTE format(
+                    'ALTER TABLE member_item_drops ATTACH PARTITION %I FOR VALUES IN (%s)',
+                    part, d
+                );
+                RETURN TRUE;
+            END
+            $$
+            """,
+            """
+            CREATE OR REPLACE FUNCTION reset_member_item_drops() RETURNS INT
+            LANGUAGE plpgsql AS $$
+            DECLARE
+                part RECORD;
+                dropped INT := 0;
+            BEGIN
+                FOR part IN
+                    SELECT c.relname
+                    FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = 'member_item_drops'::regclass
+                      AND c.relname <> 'member_item_drops_default'
+                LOOP
+                    EXECUTE format('DROP TABLE %I', part.relname);
+                    dropped := dropped + 1;
+                END LOOP;
+
+                TRUNCATE member_item_drops_default;
+                TRUNCATE member_item_daily_counts;
+                TRUNCATE processed_drop_messages;
+                RETURN dropped;
+            END
+            $$
+            """,
+            """
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM pg_attribute
+                    WHERE attrelid = 'member_item_drops'::regclass
+                      AND attname = 'id' AND NOT attisdropped
+                ) THEN
+                    CREATE UNIQUE INDEX IF NOT EXISTS member_item_drops_id_day_key
+                    ON member_item_drops (id, day);
+                END IF;
+            END
+            $$
+            """,
+        ],
+    ),
+    # 🕛 What each noon settled, so an announcement that failed to go out can
+    # be sent again from the stored result (utils/announce_daily_winner.py)
+    Migration(
+        7,
+        "settled_days",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS settled_days (
+                winner_date DATE PRIMARY KEY,
+                day_number INT NOT NULL,
+                new_day INT NOT NULL,
+                user_ids BIGINT[] NOT NULL,
+                drops INT[] NOT NULL,
+                previous_wins INT[] NOT NULL,
+                settled_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                announced_at TIMESTAMPTZ
+            )
+            """,
+        ],
+    ),
+]
+
+CREATE_MIGRATIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+"""
+
+
+# 🚀 Apply every migration newer than the database; returns versions applied
+async def ensure_schema(bot) -> List[int]:
+    applied = []
+    async with bot.pg_pool.acquire() as conn:
+        await conn.execute(CREATE_MIGRATIONS_TABLE)
+        for migration in MIGRATIONS:
+            async with conn.transaction():
+                await conn.execute(
+                    "SELECT pg_advisory_xact_lock($1)", MIGRATIONS_LOCK_ID
+                )
+                done = await conn.fetchval(
+                    "SELECT EXISTS (SELECT 1 FROM schema_migrations WHERE version = $1)",
+                    migration.version,
+                )
+                if done:
+                    continue
+
+                start = time.perf_counter()
+                for statement in migration.statements:
+                    await conn.execute(statement)
+                await conn.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES ($1, $2)",
+                    migration.version,
+                    migration.name,
+                )
+            applied.append(migration.version)
+            iggly_log(
+                "db",
+                f"Applied migration {migration.version} ({migration.name}) "
+                f"in {(time.perf_counter() - start) * 1000:.0f}ms.",
+                label="Schema",
+            )
+
+    if applied:
+        # 📇 Prepared statements on open connections may predate the new schema
+        await bot.pg_pool.expire_connections()
+    version = MIGRATIONS[-1].version
+    iggly_log("db", f"Schema is up to date (version {version}).", label="Schema")
+    return applied
@@ -0,0 +1,202 @@
+import asyncio
+import heapq
+import itertools
+import re
+import time
+from enum import IntEnum
+from typing import Dict, List, Optional
+
+import discord
+
+from utils.token_bucket import TokenBucket
+
+# ————————————————————————————————
+# 📮 Send Scheduler – Paced, prioritized outbound messages per channel
+# ————————————————————————————————
+# Every channel gets its own queue and its own bucket for
+# POST /channels/{id}/messages (5 per 5s). All channels also share a global
+# bucket (50/s). Drop announcements jump ahead of log traffic in their channel
+# queue, and log traffic always leaves GLOBAL_LOG_RESERVE global tokens for
+# drops. Under a burst, messages wait in the queue instead of tripping 429s.
+
+CHANNEL_RATE = 1.0  # 🪣 Messages per second per channel (Discord: 5 / 5s)
+CHANNEL_BURST = 5
+GLOBAL_RATE = 50.0  # 🌐 Discord's global limit per bot
+GLOBAL_BURST = 50
+GLOBAL_LOG_RESERVE = 10  # 🎀 Global tokens log traffic may not touch
+
+MAX_ATTEMPTS = 3  # 🔁 Send attempts before a 429'd message is given up
+
+# "We are being rate limited. POST https://discord.com/api/v10/channels/123/messages
+#  responded with 429. Retrying in 1.23 seconds."
+CHANNEL_ROUTE_RE = re.compile(r"/channels/(\d+)/messages")
+RETRY_AFTER_RE = re.compile(r"[Rr]etrying in ([\d.]+) seconds")
+
+
+class SendPriority(IntEnum):
+    DROP = 0  # 💖 User-facing drop messages and hunt-channel embeds
+    LOG = 1  # 📜 Staff logs, rate-limit warnings, critical traces
+
+
+class SendJob:
+    __slots__ = (
+        "priority",
+        "seq",
+        "channel",
+        "kwargs",
+        "future",
+        "enqueued_at",
+        "attempts",
+    )
+
+    def __init__(self, priority, seq, channel, kwargs, future):
+        self.priority = priority
+        self.seq = seq
+        self.channel = channel
+        self.kwargs = kwargs
+        self.future = future
+        self.enqueued_at = time.monotonic()
+        self.attempts = 0
+
+    def __lt__(self, other: "SendJob") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class SendScheduler:
+    def __init__(self):
+        self.queues: Dict[int, List[SendJob]] = {}  # channel_id -> heap of jobs
+        self.workers: Dict[int, asyncio.Task] = {}
+        self.buckets: Dict[int, TokenBucket] = {}  # channel_id -> route bucket
+        self.global_bucket = TokenBucket(GLOBAL_RATE, GLOBAL_BURST)
+        self.seq = itertools.count()
+
+        # 📊 Metrics
+        self.sent = 0
+        self.failed = 0
+        self.rate_limited = 0
+        self.wait_total: Dict[SendPriority, float] = {p: 0.0 for p in SendPriority}
+        self.wait_max: Dict[SendPriority, float] = {p: 0.0 for p in SendPriority}
+        self.wait_count: Dict[SendPriority, int] = {p: 0 for p in SendPriority}
+
+    def bucket_for(self, channel_id: int) -> TokenBucket:
+        bucket = self.buckets.get(channel_id)
+        if bucket is None:
+            bucket = self.buckets[channel_id] = TokenBucket(CHANNEL_RATE, CHANNEL_BURST)
+        return bucket
+
+    # 💌 Queue a message; resolves to the sent discord.Message
+    async def send(
+        self,
+        channel: discord.abc.Messageable,
+        content: Optional[str] = None,
+        *,
+        priority: SendPriority = SendPriority.DROP,
+        **kwargs,
+    ) -> discord.Message:
+        if content is not None:
+            kwargs["content"] = content
+        future = asyncio.get_running_loop().create_future()
+        self.enqueue(SendJob(priority, next(self.seq), channel, kwargs, future))
+        return await future
+
+    # 📜 Fire-and-forget variant for log traffic (callable from sync code on the loop)
+    def send_nowait(
+        self,
+        channel: discord.abc.Messageable,
+        content: Optional[str] = None,
+        *,
+        priority: SendPriority = SendPriority.LOG,
+        **kwargs,
+    ):
+        if content is not None:
+            kwargs["content"] = content
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self.enqueue(SendJob(priority, next(self.seq), channel, kwargs, future))
+
+    def enqueue(self, job: SendJob):
+        channel_id = job.channel.id
+        heapq.heappush(self.queues.setdefault(channel_id, []), job)
+        worker = self.workers.get(channel_id)
+        if worker is None or worker.done():
+            self.workers[channel_id] = asyncio.create_task(self.drain(channel_id))
+
+    async def drain(self, channel_id: int):
+        queue = self.queues[channel_id]
+        bucket = self.bucket_for(channel_id)
+        while queue:
+            await bucket.acquire()
+            # Re-check the head after waiting: a drop may have jumped the queue
+            reserve = GLOBAL_LOG_RESERVE if queue[0].priority > SendPriority.DROP else 0
+            await self.global_bucket.acquire(reserve=reserve)
+
+            job = heapq.heappop(queue)
+            if job.future.done():
+                continue
+            job.attempts += 1
+            try:
+                message = await job.channel.send(**job.kwargs)
+            except discord.HTTPException as e:
+                if e.status == 429 and job.attempts < MAX_ATTEMPTS:
+                    # discord.py gave up retrying; back off this route and requeue
+                    self.rate_limited += 1
+                    bucket.pause(getattr(e, "retry_after", None) or 1.0)
+                    heapq.heappush(queue, job)
+                    continue
+                self.failed += 1
+                job.future.set_exception(e)
+                continue
+            except Exception as e:
+                self.failed += 1
+                job.future.set_exception(e)
+                continue
+
+            self.record_wait(job)
+            self.sent += 1
+            job.future.set_result(message)
+
+        self.queues.pop(channel_id, None)
+        self.workers.pop(channel_id, None)
+
+    def record_wait(self, job: SendJob):
+        waited = time.monotonic() - job.enqueued_at
+        self.wait_total[job.priority] += waited
+        self.wait_count[job.priority] += 1
+        self.wait_max[job.priority] = max(self.wait_max[job.priority], waited)
+
+    # ⛔ Called by RateLimitLogger when discord.py reports a 429 for a route
+    def note_rate_limit(self, log_message: str):
+        self.rate_limited += 1
+        channel_match = CHANNEL_ROUTE_RE.search(log_message)
+        retry_match = RETRY_AFTER_RE.search(log_message)
+        retry_after = float(retry_match.group(1)) if retry_match else 1.0
+        if channel_match:
+            self.bucket_for(int(channel_match.group(1))).pause(retry_after)
+        elif "global" in log_message.lower():
+            self.global_bucket.pause(retry_after)
+
+    def queue_depth(self, channel_id: Optional[int] = None) -> int:
+        if channel_id is not None:
+            return len(self.queues.get(channel_id, ()))
+        return sum(len(queue) for queue in self.queues.values())
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "queue_depth": self.queue_depth(),
+            "busy_channels": len(self.queues),
+            "sent": self.sent,
+            "failed": self.failed,
+            "rate_limited": self.rate_limited,
+            "avg_wait": {
+                p.name: (
+                    (self.wait_total[p] / self.wait_count[p])
+                    if self.wait_count[p]
+                    else 0.0
+                )
+                for p in SendPriority
+            },
+            "max_wait": {p.name: self.wait_max[p] for p in SendPriority},
+        }
+
+
+send_scheduler = SendScheduler()  # 🏷️ Singleton scheduler instance
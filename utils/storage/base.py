@@ -0,0 +1,164 @@
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# ————————————————————————————————
+# 🗄️ Storage Backend – Everything the promo lifecycle reads or writes
+# ————————————————————————————————
+# record_drop.py, daily_winner_db.py, set_promo_db.py and the caches they feed
+# go through one of these instead of bot.pg_pool. PostgresStorage is the live
+# one; MemoryStorage gives the same answers without a database, for
+# benchmarks and offline runs. Pick one with utils/storage/get_storage.py.
+
+# (user_id, method, drop_time, day, source_message_id)
+DropRow = Tuple[int, str, datetime, int, Optional[int]]
+
+# 🌸 Columns a promo can be saved/updated with
+PROMO_FIELDS = (
+    "emoji",
+    "prize",
+    "image_url",
+    "catch_rate",
+    "battle_rate",
+    "fish_rate",
+    "whitelist_role_id",
+    "number_before_claim",
+    "emoji_name",
+)
+
+
+class StorageBackend:
+    name = "base"
+
+    # ——— 🧺 Drops ———
+    async def insert_drops(self, rows: List[DropRow]) -> Set[int]:
+        """Insert drops, skipping source ids that already have one.
+        Returns the source_message_ids that landed."""
+        raise NotImplementedError
+
+    async def delete_latest_drops(self, user_id: int, day: int, amount: int) -> int:
+        """Delete a user's `amount` most recent drops for `day`; returns rows removed."""
+        raise NotImplementedError
+
+    async def drop_counts(self) -> Iterable[Tuple[int, int, int]]:
+        """(user_id, day, drops) for every user/day with drops."""
+        raise NotImplementedError
+
+    async def top_daily_drops(self, day: int) -> List[Tuple[int, int]]:
+        raise NotImplementedError
+
+    async def top_drops_in_days(
+        self, first_day: int, last_day: int, limit: int
+    ) -> List[Tuple[int, int]]:
+        """Top `limit` users by drops summed over days first_day..last_day."""
+        raise NotImplementedError
+
+    async def rebuild_daily_counts(self) -> int:
+        """Recount the per-day leaderboard counts from the drops; returns rows."""
+        raise NotImplementedError
+
+    # ——— 🏆 Daily winners ———
+    async def set_daily_winner(self, winner_date: date, user_id: int, total_drops: int):
+        raise NotImplementedError
+
+    async def get_daily_winner(self, winner_date: date) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def get_all_winners(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def winner_days(
+        self, after_day_number: int, limit: int
+    ) -> List[Dict[str, Any]]:
+        """Up to `limit` winner days numbered after `after_day_number` (oldest
+        first; 0 = from the start). Each is {"winner_date", "day_number",
+        "winners", "tied"}, where day_number is the date's day counted from the
+        first winner date (so days without winners keep their number), winners
+        is [(user_id, total_drops)] by drops desc, and tied is True if every
+        winner ranks first."""
+        raise NotImplementedError
+
+    async def clear_daily_winners(self):
+        raise NotImplementedError
+
+    async def daily_winner_count(self, user_id: int) -> int:
+        raise NotImplementedError
+
+    async def daily_winner_exists(self, winner_date: date) -> bool:
+        raise NotImplementedError
+
+    async def settle_day(
+        self, day: int, winner_date: date, winners: List[Tuple[int, int]]
+    ) -> Tuple[Dict[int, int], Optional[int]]:
+        """Noon settlement, all or nothing: count each of `winners`' previous
+        wins, record them as winner_date's winners and advance the day from
+        `day`. The current day is re-read (and locked) inside the transaction;
+        if it isn't `day`, nothing is written and the new day is None. The
+        result is kept for get_settled_day."""
+        raise NotImplementedError
+
+    async def get_settled_day(self, winner_date: date) -> Optional[Dict[str, Any]]:
+        """What settle_day recorded for winner_date: {"winner_date",
+        "day_number", "new_day", "winners" [(user_id, total_drops)],
+        "previous_wins" {user_id: wins}, "announced"}; None if not settled."""
+        raise NotImplementedError
+
+    async def mark_announced(self, winner_date: date):
+        raise NotImplementedError
+
+    # ——— 📅 Current day ———
+    async def get_current_day(self) -> Optional[int]:
+        raise NotImplementedError
+
+    async def increment_day(self) -> Optional[int]:
+        """Advance the day; also prepares storage for it (see prepare_day)."""
+        raise NotImplementedError
+
+    async def prepare_day(self, day: int):
+        """Make sure drops for `day` and the day after have somewhere to go."""
+        raise NotImplementedError
+
+    # ——— 📬 Bulk dispatch progress ———
+    async def plan_dispatch(
+        self, job: str, items: List[Tuple[int, str]]
+    ) -> Set[Tuple[int, str]]:
+        """Record (user_id, action) items for `job` as pending unless already
+        known; returns the items that already finished in an earlier run."""
+        raise NotImplementedError
+
+    async def mark_dispatch(
+        self,
+        job: str,
+        user_id: int,
+        action: str,
+        status: str,
+        attempts: int,
+        error: Optional[str] = None,
+    ):
+        """Set an item's status ('done' or 'failed') after `attempts` more tries."""
+        raise NotImplementedError
+
+    # ——— 🎀 Promos ———
+    async def get_promo(self) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def upsert_promo(self, name: str, fields: Dict[str, Any]):
+        """Insert the promo or overwrite `fields` on the existing one."""
+        raise NotImplementedError
+
+    async def update_promo(self, name: str, fields: Dict[str, Any]):
+        """Update only `fields` on an existing promo (no-op if it doesn't exist)."""
+        raise NotImplementedError
+
+    async def delete_promo(self, name: str):
+        raise NotImplementedError
+
+    # 🧹 /reset-clan-promo: promos, drops, winners, settled days and bulk
+    # dispatch progress
+    async def reset_promo_data(self):
+        raise NotImplementedError
+
+
+def check_promo_fields(fields: Dict[str, Any]):
+    unknown = set(fields) - set(PROMO_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown promo fields: {', '.join(sorted(unknown))}")
@@ -0,0 +1,10 @@
+from utils.storage.base import StorageBackend
+from utils.storage.postgres import PostgresStorage
+
+
+# 🗄️ The bot's storage backend; defaults to Postgres over bot.pg_pool
+def get_storage(bot) -> StorageBackend:
+    storage = getattr(bot, "storage", None)
+    if storage is None:
+        storage = bot.storage = PostgresStorage(bot.pg_pool)
+    return storage
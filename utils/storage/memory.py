@@ -0,0 +1,267 @@
+import heapq
+from collections import Counter, defaultdict
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from utils.storage.base import (
+    PROMO_FIELDS,
+    DropRow,
+    StorageBackend,
+    check_promo_fields,
+)
+
+# ————————————————————————————————
+# 🧸 Memory Storage – Dict-backed twin of PostgresStorage
+# ————————————————————————————————
+# Same answers as the Postgres queries, including the tie order on the
+# leaderboards (drops desc, then user_id). Nothing is persisted; meant for
+# benchmarks/bench_storage.py, the EventWatcher replayer and offline runs.
+
+
+def utcnow() -> datetime:
+    return datetime.now(tz=timezone.utc)
+
+
+class MemoryStorage(StorageBackend):
+    name = "memory"
+
+    def __init__(self, day_number: Optional[int] = 1):
+        self.drops: List[DropRow] = []
+        self.source_ids: Set[int] = set()
+        # 📊 day -> user_id -> drops, kept in step like the Postgres trigger
+        self.daily_counts: Dict[int, Counter] = defaultdict(Counter)
+        self.winners: Dict[Tuple[date, int], Dict[str, Any]] = {}
+        self.day_number = day_number
+        self.promos: Dict[str, Dict[str, Any]] = {}
+        # 📬 (job, user_id, action) -> {"status", "attempts", "last_error"}
+        self.dispatch: Dict[Tuple[str, int, str], Dict[str, Any]] = {}
+        # 🕛 winner_date -> what settle_day stored for it
+        self.settled: Dict[date, Dict[str, Any]] = {}
+
+    # ——— 🧺 Drops ———
+    async def insert_drops(self, rows: List[DropRow]) -> Set[int]:
+        inserted = set()
+        for row in rows:
+            source_id = row[4]
+            if source_id is not None:
+                if source_id in self.source_ids:
+                    continue
+                self.source_ids.add(source_id)
+                inserted.add(source_id)
+            self.drops.append(row)
+            self.daily_counts[row[3]][row[0]] += 1
+        return inserted
+
+    async def delete_latest_drops(self, user_id: int, day: int, amount: int) -> int:
+        matching = [
+            i
+            for i, (uid, _, _, drop_day, _) in enumerate(self.drops)
+            if uid == user_id and drop_day == day
+        ]
+        # ORDER BY drop_time DESC LIMIT amount
+        doomed = set(
+            heapq.nlargest(amount, matching, key=lambda i: (self.drops[i][2], i))
+        )
+        if not doomed:
+            return 0
+        for i in doomed:
+            source_id = self.drops[i][4]
+            if source_id is not None:
+                self.source_ids.discard(source_id)
+        counts = self.daily_counts[day]
+        counts[user_id] -= len(doomed)
+        if counts[user_id] <= 0:
+            del counts[user_id]
+        self.drops = [row for i, row in enumerate(self.drops) if i not in doomed]
+        return len(doomed)
+
+    async def drop_counts(self) -> List[Tuple[int, int, int]]:
+        return [
+            (user_id, day, drops)
+            for day, counts in self.daily_counts.items()
+            for user_id, drops in counts.items()
+        ]
+
+    @staticmethod
+    def ranked(counts: Counter) -> List[Tuple[int, int]]:
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+    async def top_daily_drops(self, day: int) -> List[Tuple[int, int]]:
+        return self.ranked(self.daily_counts.get(day, Counter()))
+
+    async def top_drops_in_days(
+        self, first_day: int, last_day: int, limit: int
+    ) -> List[Tuple[int, int]]:
+        totals = Counter()
+        for day, counts in self.daily_counts.items():
+            if first_day <= day <= last_day:
+                totals.update(counts)
+        return self.ranked(totals)[:limit]
+
+    async def rebuild_daily_counts(self) -> int:
+        self.daily_counts = defaultdict(Counter)
+        for user_id, _, _, day, _ in self.drops:
+            self.daily_counts[day][user_id] += 1
+        return sum(len(counts) for counts in self.daily_counts.values())
+
+    # ——— 🏆 Daily winners ———
+    async def set_daily_winner(self, winner_date: date, user_id: int, total_drops: int):
+        self.winners[(winner_date, user_id)] = {
+            "winner_date": winner_date,
+            "user_id": user_id,
+            "total_drops": total_drops,
+            "recorded_at": utcnow(),
+        }
+
+    async def get_daily_winner(self, winner_date: date) -> Optional[Dict[str, Any]]:
+        for (row_date, _), row in self.winners.items():
+            if row_date == winner_date:
+                return dict(row)
+        return None
+
+    async def get_all_winners(self) -> List[Dict[str, Any]]:
+        rows = sorted(
+            self.winners.values(), key=lambda row: row["winner_date"], reverse=True
+        )
+        return [dict(row) for row in rows]
+
+    async def winner_days(
+        self, after_day_number: int, limit: int
+    ) -> List[Dict[str, Any]]:
+        by_day: Dict[date, List[Tuple[int, int]]] = defaultdict(list)
+        for (winner_date, user_id), row in self.winners.items():
+            by_day[winner_date].append((user_id, row["total_drops"]))
+        if not by_day:
+            return []
+        first_date = min(by_day)
+
+        days = []
+        for winner_date in sorted(by_day):
+            day_number = (winner_date - first_date).days + 1
+            if day_number <= after_day_number:
+                continue
+            winners = sorted(by_day[winner_date], key=lambda w: (-w[1], w[0]))
+            days.append(
+                {
+                    "winner_date": winner_date,
+                    "day_number": day_number,
+                    "winners": winners,
+                    "tied": all(drops == winners[0][1] for _, drops in winners),
+                }
+            )
+            if len(days) == limit:
+                break
+        return days
+
+    async def clear_daily_winners(self):
+        self.winners.clear()
+
+    async def daily_winner_count(self, user_id: int) -> int:
+        return sum(1 for _, uid in self.winners if uid == user_id)
+
+    async def daily_winner_exists(self, winner_date: date) -> bool:
+        return any(row_date == winner_date for row_date, _ in self.winners)
+
+    async def settle_day(
+        self, day: int, winner_date: date, winners: List[Tuple[int, int]]
+    ) -> Tuple[Dict[int, int], Optional[int]]:
+        user_ids = {user_id for user_id, _ in winners}
+        wins = Counter(uid for _, uid in self.winners if uid in user_ids)
+        if self.day_number is None or self.day_number != day:
+            return dict(wins), None
+        for user_id, total_drops in winners:
+            await self.set_daily_winner(winner_date, user_id, total_drops)
+        self.day_number += 1
+        self.settled[winner_date] = {
+            "winner_date": winner_date,
+            "day_number": day,
+            "new_day": self.day_number,
+            "winners": list(winners),
+            "previous_wins": {user_id: wins[user_id] for user_id in user_ids},
+            "announced": False,
+        }
+        return dict(wins), self.day_number
+
+    async def get_settled_day(self, winner_date: date) -> Optional[Dict[str, Any]]:
+        settled = self.settled.get(winner_date)
+        return dict(settled) if settled is not None else None
+
+    async def mark_announced(self, winner_date: date):
+        if winner_date in self.settled:
+            self.settled[winner_date]["announced"] = True
+
+    # ——— 📅 Current day ———
+    async def get_current_day(self) -> Optional[int]:
+        return self.day_number
+
+    async def increment_day(self) -> Optional[int]:
+        if self.day_number is not None:
+            self.day_number += 1
+        return self.day_number
+
+    async def prepare_day(self, day: int):
+        pass  # 🗂️ No partitions to create
+
+    # ——— 📬 Bulk dispatch progress ———
+    async def plan_dispatch(
+        self, job: str, items: List[Tuple[int, str]]
+    ) -> Set[Tuple[int, str]]:
+        for user_id, action in items:
+            self.dispatch.setdefault(
+                (job, user_id, action),
+                {"status": "pending", "attempts": 0, "last_error": None},
+            )
+        return {
+            (user_id, action)
+            for (row_job, user_id, action), row in self.dispatch.items()
+            if row_job == job and row["status"] == "done"
+        }
+
+    async def mark_dispatch(
+        self,
+        job: str,
+        user_id: int,
+        action: str,
+        status: str,
+        attempts: int,
+        error: Optional[str] = None,
+    ):
+        row = self.dispatch.get((job, user_id, action))
+        if row is not None:
+            row.update(status=status, last_error=error)
+            row["attempts"] += attempts
+
+    # ——— 🎀 Promos ———
+    async def get_promo(self) -> Optional[Dict[str, Any]]:
+        for promo in self.promos.values():
+            return dict(promo)
+        return None
+
+    async def upsert_promo(self, name: str, fields: Dict[str, Any]):
+        check_promo_fields(fields)
+        promo = self.promos.get(name)
+        if promo is None:
+            promo = {"name": name, **dict.fromkeys(PROMO_FIELDS)}
+            promo["number_before_claim"] = 0
+            self.promos[name] = promo
+        promo.update(fields)
+        promo["updated_at"] = utcnow()
+
+    async def update_promo(self, name: str, fields: Dict[str, Any]):
+        check_promo_fields(fields)
+        promo = self.promos.get(name)
+        if promo is not None:
+            promo.update(fields)
+            promo["updated_at"] = utcnow()
+
+    async def delete_promo(self, name: str):
+        self.promos.pop(name, None)
+
+    async def reset_promo_data(self):
+        self.promos.clear()
+        self.drops.clear()
+        self.source_ids.clear()
+        self.daily_counts.clear()
+        self.winners.clear()
+        self.dispatch.clear()
+        self.settled.clear()
@@ -0,0 +1,263 @@
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from utils.storage.base import DropRow, StorageBackend, check_promo_fields
+from utils.storage.queries import queries
+
+# ————————————————————————————————
+# 🐘 Postgres Storage – The live backend, one pool acquire per call
+# ————————————————————————————————
+# All SQL lives in utils/storage/queries.py and runs as prepared statements.
+
+
+class PostgresStorage(StorageBackend):
+    name = "postgres"
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    # ——— 🧺 Drops ———
+    async def insert_drops(self, rows: List[DropRow]) -> Set[int]:
+        async with self.pool.acquire() as conn:
+            inserted = await queries.fetch(
+                conn,
+                "insert_drops",
+                [user_id for user_id, *_ in rows],
+                [method for _, method, *_ in rows],
+                [drop_time for _, _, drop_time, *_ in rows],
+                [day for _, _, _, day, _ in rows],
+                [source_id for *_, source_id in rows],
+            )
+        return {row["source_message_id"] for row in inserted}
+
+    async def delete_latest_drops(self, user_id: int, day: int, amount: int) -> int:
+        async with self.pool.acquire() as conn:
+            return await queries.fetchval(
+                conn, "delete_latest_drops", user_id, day, amount
+            )
+
+    async def drop_counts(self) -> List[Tuple[int, int, int]]:
+        async with self.pool.acquire() as conn:
+            rows = await queries.fetch(conn, "drop_counts")
+        return [(r["user_id"], r["day"], r["drops"]) for r in rows]
+
+    async def top_daily_drops(self, day: int) -> List[Tuple[int, int]]:
+        async with self.pool.acquire() as conn:
+            rows = await queries.fetch(conn, "top_daily_drops", day)
+        return [(r["user_id"], r["drops_count"]) for r in rows]
+
+    async def top_drops_in_days(
+        self, first_day: int, last_day: int, limit: int
+    ) -> List[Tuple[int, int]]:
+        async with self.pool.acquire() as conn:
+            rows = await queries.fetch(
+                conn, "top_drops_in_days", first_day, last_day, limit
+            )
+        return [(r["user_id"], r["total_drops"]) for r in rows]
+
+    # 🧱 Recount member_item_daily_counts from scratch; writes wait meanwhile
+    async def rebuild_daily_counts(self) -> int:
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await queries.execute(conn, "lock_drops")
+                await queries.execute(conn, "clear_daily_counts")
+                status = await queries.execute(conn, "rebuild_daily_counts")
+        # 🧮 "INSERT 0 <n>"
+        return int(status.split()[-1])
+
+    # ——— 🏆 Daily winners ———
+    async def set_daily_winner(self, winner_date: date, user_id: int, total_drops: int):
+        async with self.pool.acquire() as conn:
+            await queries.execute(
+                conn, "set_daily_winner", winner_date, user_id, total_drops
+            )
+
+    async def get_daily_winner(self, winner_date: date) -> Optional[Dict[str, Any]]:
+        async with self.pool.acquire() as conn:
+            row = await queries.fetchrow(conn, "get_daily_winner", winner_date)
+        return dict(row) if row else None
+
+    async def get_all_winners(self) -> List[Dict[str, Any]]:
+        async with self.pool.acquire() as conn:
+            rows = await queries.fetch(conn, "get_all_winners")
+        return [dict(row) for row in rows]
+
+    async def winner_days(
+        self, after_day_number: int, limit: int
+    ) -> List[Dict[str, Any]]:
+        async with self.pool.acquire() as conn:
+            rows = await queries.fetch(conn, "winner_days", after_day_number, limit)
+        return [
+            {
+                "winner_date": r["winner_date"],
+                "day_number": r["day_number"],
+                "winners": list(zip(r["user_ids"], r["drops"])),
+                "tied": r["tied"],
+            }
+            for r in rows
+        ]
+
+    async def clear_daily_winners(self):
+        async with self.pool.acquire() as conn:
+            await queries.execute(conn, "clear_daily_winners")
+
+    async def daily_winner_count(self, user_id: int) -> int:
+        async with self.pool.acquire() as conn:
+            count = await queries.fetchval(conn, "daily_winner_count", user_id)
+        return count or 0
+
+    async def daily_winner_exists(self, winner_date: date) -> bool:
+        async with self.pool.acquire() as conn:
+            return await queries.fetchval(conn, "daily_winner_exists", winner_date)
+
+    # 🕛 One connection, one transaction: win counts, winner upsert, day advance
+    async def settle_day(
+        self, day: int, winner_date: date, winners: List[Tuple[int, int]]
+    ) -> Tuple[Dict[int, int], Optional[int]]:
+        user_ids = [user_id for user_id, _ in winners]
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                # 🔒 The day the standings were computed for must still be current
+                current = await queries.fetchval(conn, "lock_current_day")
+                rows = await queries.fetch(conn, "daily_winner_counts", user_ids)
+                wins = {r["user_id"]: r["wins"] for r in rows}
+                if current is None or current != day:
+                    return wins, None
+                new_day = await queries.fetchval(conn, "advance_day", day)
+                drops = [total_drops for _, total_drops in winners]
+                await queries.execute(
+                    conn, "set_daily_winners", winner_date, user_ids, drops
+                )
+                await queries.execute(
+                    conn,
+                    "record_settled_day",
+                    winner_date,
+                    day,
+                    new_day,
+                    user_ids,
+                    drops,
+                    [wins.get(user_id, 0) for user_id in user_ids],
+                )
+        # 🗂️ No partition DDL here: the new day's partition was created ahead of
+        # time by the current_day poll (prepare_day makes today's and tomorrow's)
+        return wins, new_day
+
+    async def get_settled_day(self, winner_date: date) -> Optional[Dict[str, Any]]:
+        async with self.pool.acquire() as conn:
+            row = await queries.fetchrow(conn, "get_settled_day", winner_date)
+        if row is None:
+            return None
+        return {
+            "winner_date": row["winner_date"],
+            "day_number": row["day_number"],
+            "new_day": row["new_day"],
+            "winners": list(zip(row["user_ids"], row["drops"])),
+            "previous_wins": dict(zip(row["user_ids"], row["previous_wins"])),
+            "announced": row["announced"],
+        }
+
+    async def mark_announced(self, winner_date: date):
+        async with self.pool.acquire() as conn:
+            await queries.execute(conn, "mark_announced", winner_date)
+
+    # ——— 📅 Current day ———
+    async def get_current_day(self) -> Optional[int]:
+        async with self.pool.acquire() as conn:
+            return await queries.fetchval(conn, "get_current_day")
+
+    async def increment_day(self) -> Optional[int]:
+        async with self.pool.acquire() as conn:
+            day_number = await queries.fetchval(conn, "increment_day")
+            if day_number is not None:
+                await queries.execute(conn, "prepare_day_partitions", day_number)
+        return day_number
+
+    async def prepare_day(self, day: int):
+        async with self.pool.acquire() as conn:
+            await queries.execute(conn, "prepare_day_partitions", day)
+
+    # ——— 📬 Bulk dispatch progress ———
+    async def plan_dispatch(
+        self, job: str, items: List[Tuple[int, str]]
+    ) -> Set[Tuple[int, str]]:
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await queries.execute(
+                    conn,
+                    "plan_dispatch",
+                    job,
+                    [user_id for user_id, _ in items],
+                    [action for _, action in items],
+                )
+                rows = await queries.fetch(conn, "done_dispatch", job)
+        return {(r["user_id"], r["action"]) for r in rows}
+
+    async def mark_dispatch(
+        self,
+        job: str,
+        user_id: int,
+        action: str,
+        status: str,
+        attempts: int,
+        error: Optional[str] = None,
+    ):
+        async with self.pool.acquire() as conn:
+            await queries.execute(
+                conn, "mark_dispatch", job, user_id, action, status, attempts, error
+            )
+
+    # ——— 🎀 Promos ———
+    async def get_promo(self) -> Optional[Dict[str, Any]]:
+        async with self.pool.acquire() as conn:
+            row = await queries.fetchrow(conn, "get_promo")
+        return dict(row) if row else None
+
+    # 🧩 Promo writes touch a caller-chosen set of columns, so each distinct
+    # column set is registered (and prepared) under its own name on first use
+    async def upsert_promo(self, name: str, fields: Dict[str, Any]):
+        check_promo_fields(fields)
+        columns = ["name", *fields]
+        placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+        updates = "".join(f"{column} = EXCLUDED.{column}, " for column in fields)
+        query = queries.register(
+            f"upsert_promo[{','.join(fields)}]",
+            f"""
+            INSERT INTO clan_promo_events ({', '.join(columns)})
+            VALUES ({placeholders})
+            ON CONFLICT (name) DO UPDATE SET
+                {updates}updated_at = NOW()
+            """,
+        )
+        async with self.pool.acquire() as conn:
+            await queries.execute(conn, query, name, *fields.values())
+
+    async def update_promo(self, name: str, fields: Dict[str, Any]):
+        check_promo_fields(fields)
+        set_clauses = [f"{field} = ${i}" for i, field in enumerate(fields, start=1)]
+        # Always update updated_at timestamp
+        set_clauses.append("updated_at = NOW()")
+        query = queries.register(
+            f"update_promo[{','.join(fields)}]",
+            f"""
+            UPDATE clan_promo_events SET
+                {', '.join(set_clauses)}
+            WHERE name = ${len(fields) + 1}
+            """,
+        )
+        async with self.pool.acquire() as conn:
+            await queries.execute(conn, query, *fields.values(), name)
+
+    async def delete_promo(self, name: str):
+        async with self.pool.acquire() as conn:
+            await queries.execute(conn, "delete_promo", name)
+
+    # 🗂️ Drops go by partition, then today's and tomorrow's are re-created
+    async def reset_promo_data(self):
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await queries.execute(conn, "clear_promos")
+                await queries.execute(conn, "reset_drops")
+                await queries.execute(conn, "clear_daily_winners")
+                await queries.execute(conn, "clear_dispatch")
+                await queries.execute(conn, "clear_settled_days")
+                await queries.execute(conn, "prepare_current_day_partitions")
@@ -0,0 +1,478 @@
+import time
+from typing import Any, Dict, List, Optional
+
+import asyncpg
+
+from utils.visuals.iggly_log_helpers import iggly_log
+
+# ————————————————————————————————
+# 📇 Query Registry – Named SQL, prepared once on every pool connection
+# ————————————————————————————————
+# Every statement the bot runs against Postgres is registered here by name.
+# The pool's `init` hook (prepare_all) prepares them on each new connection,
+# so the drop path never re-parses SQL. Each name keeps its own call count,
+# error count and latency, and summary() logs them.
+
+
+# 🌱 Raised while preparing against a schema that migrations haven't caught up to
+UNDEFINED_OBJECT_ERRORS = (
+    asyncpg.UndefinedTableError,
+    asyncpg.UndefinedColumnError,
+    asyncpg.UndefinedFunctionError,
+    asyncpg.UndefinedObjectError,
+)
+
+
+class PreparedConnection(asyncpg.Connection):
+    """Pool connection that holds its prepared statements (name -> statement)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: Dict[str, asyncpg.prepared_stmt.PreparedStatement] = {}
+
+
+class QueryStats:
+    __slots__ = ("calls", "errors", "total", "max")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed: float):
+        self.calls += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+
+class QueryRegistry:
+    def __init__(self):
+        self.sql: Dict[str, str] = {}
+        self.stats_by_name: Dict[str, QueryStats] = {}
+
+    # 📝 Register `sql` under `name`; registering the same pair again is a no-op
+    def register(self, name: str, sql: str) -> str:
+        existing = self.sql.get(name)
+        if existing is not None and existing != sql:
+            raise ValueError(f"Query {name!r} is already registered with other SQL")
+        self.sql[name] = sql
+        self.stats_by_name.setdefault(name, QueryStats())
+        return name
+
+    # 🌱 Pool `init` hook: prepare every registered query on a new connection.
+    # The pool opens before ensure_schema runs, so on a fresh or older database
+    # some tables/functions don't exist yet; those are quietly prepared on first use.
+    async def prepare_all(self, conn: asyncpg.Connection):
+        prepared = getattr(conn, "prepared", None)
+        if prepared is None:
+            return
+        for name, sql in self.sql.items():
+            try:
+                prepared[name] = await conn.prepare(sql)
+            except UNDEFINED_OBJECT_ERRORS:
+                continue
+            except asyncpg.PostgresError as e:
+                iggly_log("warn", f"Could not prepare {name}: {e}", label="Queries")
+
+    async def statement(self, conn, name: str):
+        prepared = getattr(conn, "prepared", None)
+        if prepared is None:
+            return None  # not a PreparedConnection; use the implicit cache
+        stmt = prepared.get(name)
+        if stmt is None:
+            stmt = prepared[name] = await conn.prepare(self.sql[name])
+        return stmt
+
+    async def run(self, conn, name: str, method: str, *args):
+        stats = self.stats_by_name[name]
+        start = time.perf_counter()
+        try:
+            try:
+                result = await self.call(conn, name, method, args)
+            except asyncpg.InvalidCachedStatementError:
+                # Schema changed under the prepared plan; re-prepare once
+                getattr(conn, "prepared", {}).pop(name, None)
+                result = await self.call(conn, name, method, args)
+        except Exception:
+            stats.errors += 1
+            raise
+        stats.record(time.perf_counter() - start)
+        return result
+
+    async def call(self, conn, name: str, method: str, args):
+        stmt = await self.statement(conn, name)
+        if stmt is None:
+            return await getattr(conn, method)(self.sql[name], *args)
+        if method == "execute":
+            await stmt.fetch(*args)
+            return stmt.get_statusmsg()
+        return await getattr(stmt, method)(*args)
+
+    async def fetch(self, conn, name: str, *args) -> List[asyncpg.Record]:
+        return await self.run(conn, name, "fetch", *args)
+
+    async def fetchrow(self, conn, name: str, *args) -> Optional[asyncpg.Record]:
+        return await self.run(conn, name, "fetchrow", *args)
+
+    async def fetchval(self, conn, name: str, *args) -> Any:
+        return await self.run(conn, name, "fetchval", *args)
+
+    async def execute(self, conn, name: str, *args) -> str:
+        """Run a statement; returns its status (e.g. "DELETE 3")."""
+        return await self.run(conn, name, "execute", *args)
+
+    async def executemany(self, conn, name: str, args) -> None:
+        stats = self.stats_by_name[name]
+        start = time.perf_counter()
+        try:
+            stmt = await self.statement(conn, name)
+            if stmt is None:
+                await conn.executemany(self.sql[name], args)
+            else:
+                await stmt.executemany(args)
+        except Exception:
+            stats.errors += 1
+            raise
+        stats.record(time.perf_counter() - start)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {
+                "calls": s.calls,
+                "errors": s.errors,
+                "avg_ms": (s.total / s.calls * 1000) if s.calls else 0.0,
+                "max_ms": s.max * 1000,
+                "total_s": s.total,
+            }
+            for name, s in self.stats_by_name.items()
+        }
+
+    # 📊 Log the busiest queries by total time
+    def summary(self, limit: int = 8):
+        busiest = sorted(
+            (item for item in self.stats().items() if item[1]["calls"]),
+            key=lambda item: item[1]["total_s"],
+            reverse=True,
+        )[:limit]
+        if not busiest:
+            return
+        lines = [
+            f"{name}: {s['calls']} calls, avg {s['avg_ms']:.2f}ms, "
+            f"max {s['max_ms']:.2f}ms, {s['errors']} errors"
+            for name, s in busiest
+        ]
+        iggly_log("db", "Query stats:\n" + "\n".join(lines), label="Queries")
+
+
+queries = QueryRegistry()  # 🏷️ Singleton registry
+
+
+# ————————————————————————————————
+# 🧺 Drops
+# ————————————————————————————————
+# 🔁 Each source message id is claimed in processed_drop_messages first; only
+# rows whose id was claimed (or that have none) are inserted, the first one per
+# id in a batch. Unique indexes on the partitions can only be per day.
+queries.register(
+    "insert_drops",
+    """
+    WITH batch AS (
+        SELECT *
+        FROM unnest(
+            $1::bigint[], $2::text[], $3::timestamptz[], $4::int[], $5::bigint[]
+        ) WITH ORDINALITY AS b (user_id, method, drop_time, day, source_message_id, n)
+    ),
+    claimed AS (
+        INSERT INTO processed_drop_messages (source_message_id)
+        SELECT DISTINCT source_message_id FROM batch
+        WHERE source_message_id IS NOT NULL
+        ON CONFLICT DO NOTHING
+        RETURNING source_message_id
+    )
+    INSERT INTO member_item_drops (user_id, method, drop_time, day, source_message_id)
+    SELECT user_id, method, drop_time, day, source_message_id
+    FROM batch
+    WHERE source_message_id IS NULL
+       OR n = (
+           SELECT MIN(b.n)
+           FROM batch b
+           JOIN claimed c ON c.source_message_id = b.source_message_id
+           WHERE b.source_message_id = batch.source_message_id
+       )
+    RETURNING source_message_id
+    """,
+)
+# 🔓 Deleted drops release their source message id, like the old unique index
+queries.register(
+    "delete_latest_drops",
+    """
+    WITH gone AS (
+        DELETE FROM member_item_drops
+        WHERE (tableoid, ctid) IN (
+            SELECT tableoid, ctid
+            FROM member_item_drops
+            WHERE user_id = $1 AND day = $2
+            ORDER BY drop_time DESC
+            LIMIT $3
+        )
+        RETURNING source_message_id
+    ),
+    released AS (
+        DELETE FROM processed_drop_messages
+        WHERE source_message_id IN (SELECT source_message_id FROM gone)
+    )
+    SELECT COUNT(*) FROM gone
+    """,
+)
+# 📊 Leaderboards read member_item_daily_counts (kept by trigger, see
+# utils/schema.py), so they scale with participants rather than drops
+queries.register(
+    "drop_counts",
+    """
+    SELECT user_id, day, drops
+    FROM member_item_daily_counts
+    WHERE drops > 0
+    """,
+)
+queries.register(
+    "top_daily_drops",
+    """
+    SELECT user_id, drops AS drops_count
+    FROM member_item_daily_counts
+    WHERE day = $1 AND drops > 0
+    ORDER BY drops DESC, user_id
+    """,
+)
+queries.register(
+    "top_drops_in_days",
+    """
+    SELECT user_id, SUM(drops)::int AS total_drops
+    FROM member_item_daily_counts
+    WHERE day BETWEEN $1 AND $2
+    GROUP BY user_id
+    HAVING SUM(drops) > 0
+    ORDER BY total_drops DESC, user_id
+    LIMIT $3
+    """,
+)
+queries.register("lock_drops", "LOCK TABLE member_item_drops IN SHARE MODE")
+queries.register("clear_daily_counts", "DELETE FROM member_item_daily_counts")
+queries.register(
+    "rebuild_daily_counts",
+    """
+    INSERT INTO member_item_daily_counts (day, user_id, drops)
+    SELECT day, user_id, COUNT(*)
+    FROM member_item_drops
+    GROUP BY day, user_id
+    """,
+)
+
+# ————————————————————————————————
+# 🏆 Daily winners
+# ————————————————————————————————
+queries.register(
+    "set_daily_winner",
+    """
+    INSERT INTO daily_item_winners (winner_date, user_id, total_drops, recorded_at)
+    VALUES ($1, $2, $3, NOW())
+    ON CONFLICT (winner_date, user_id) DO UPDATE SET
+        total_drops = EXCLUDED.total_drops,
+        recorded_at = NOW()
+    """,
+)
+queries.register(
+    "set_daily_winners",
+    """
+    INSERT INTO daily_item_winners (winner_date, user_id, total_drops, recorded_at)
+    SELECT $1, user_id, total_drops, NOW()
+    FROM unnest($2::bigint[], $3::int[]) AS w (user_id, total_drops)
+    ON CONFLICT (winner_date, user_id) DO UPDATE SET
+        total_drops = EXCLUDED.total_drops,
+        recorded_at = NOW()
+    """,
+)
+queries.register(
+    "get_daily_winner", "SELECT * FROM daily_item_winners WHERE winner_date = $1"
+)
+queries.register(
+    "record_settled_day",
+    """
+    INSERT INTO settled_days
+        (winner_date, day_number, new_day, user_ids, drops, previous_wins)
+    VALUES ($1, $2, $3, $4, $5, $6)
+    """,
+)
+queries.register(
+    "get_settled_day",
+    """
+    SELECT winner_date, day_number, new_day, user_ids, drops, previous_wins,
+           announced_at IS NOT NULL AS announced
+    FROM settled_days
+    WHERE winner_date = $1
+    """,
+)
+queries.register(
+    "mark_announced",
+    "UPDATE settled_days SET announced_at = NOW() WHERE winner_date = $1",
+)
+queries.register("clear_settled_days", "DELETE FROM settled_days")
+queries.register(
+    "get_all_winners", "SELECT * FROM daily_item_winners ORDER BY winner_date DESC"
+)
+# 📄 One keyset page of /list-daily-winners, grouped per day in SQL
+queries.register(
+    "winner_days",
+    """
+    WITH start AS (
+        SELECT MIN(winner_date) AS first_date FROM daily_item_winners
+    ),
+    page AS (
+        SELECT DISTINCT winner_date
+        FROM daily_item_winners
+        WHERE winner_date >= (SELECT first_date FROM start) + $1::int
+        ORDER BY winner_date
+        LIMIT $2
+    ),
+    ranked AS (
+        SELECT
+            winner_date,
+            user_id,
+            total_drops,
+            RANK() OVER (
+                PARTITION BY winner_date ORDER BY total_drops DESC
+            ) AS place
+        FROM daily_item_winners
+        WHERE winner_date IN (SELECT winner_date FROM page)
+    )
+    SELECT
+        winner_date,
+        (winner_date - (SELECT first_date FROM start) + 1)::int AS day_number,
+        array_agg(user_id ORDER BY total_drops DESC, user_id) AS user_ids,
+        array_agg(total_drops ORDER BY total_drops DESC, user_id) AS drops,
+        bool_and(place = 1) AS tied
+    FROM ranked
+    GROUP BY winner_date
+    ORDER BY winner_date
+    """,
+)
+queries.register("clear_daily_winners", "DELETE FROM daily_item_winners")
+queries.register(
+    "daily_winner_count", "SELECT COUNT(*) FROM daily_item_winners WHERE user_id = $1"
+)
+queries.register(
+    "daily_winner_counts",
+    """
+    SELECT user_id, COUNT(*)::int AS wins
+    FROM daily_item_winners
+    WHERE user_id = ANY($1::bigint[])
+    GROUP BY user_id
+    """,
+)
+queries.register(
+    "daily_winner_exists",
+    """
+    SELECT EXISTS (
+        SELECT 1 FROM daily_item_winners WHERE winner_date = $1
+    )
+    """,
+)
+
+# ————————————————————————————————
+# 📅 Current day
+# ————————————————————————————————
+queries.register("get_current_day", "SELECT day_number FROM current_day LIMIT 1")
+queries.register(
+    "increment_day",
+    """
+    UPDATE current_day SET day_number = day_number + 1, last_updated = now()
+    RETURNING day_number
+    """,
+)
+# 🕛 Only advances from the expected day, so a repeated noon run is a no-op
+queries.register(
+    "lock_current_day", "SELECT day_number FROM current_day LIMIT 1 FOR UPDATE"
+)
+queries.register(
+    "advance_day",
+    """
+    UPDATE current_day SET day_number = day_number + 1, last_updated = now()
+    WHERE day_number = $1
+    RETURNING day_number
+    """,
+)
+# 🗂️ member_item_drops partitions for a day and the one after it (utils/schema.py)
+queries.register(
+    "prepare_day_partitions",
+    """
+    SELECT ensure_member_item_drops_partition($1),
+           ensure_member_item_drops_partition($1 + 1)
+    """,
+)
+queries.register(
+    "prepare_current_day_partitions",
+    """
+    SELECT ensure_member_item_drops_partition(day_number),
+           ensure_member_item_drops_partition(day_number + 1)
+    FROM current_day
+    """,
+)
+
+# ————————————————————————————————
+# 🎀 Promos
+# ————————————————————————————————
+queries.register("get_promo", "SELECT * FROM clan_promo_events LIMIT 1")
+queries.register("delete_promo", "DELETE FROM clan_promo_events WHERE name = $1")
+queries.register("clear_promos", "DELETE FROM clan_promo_events")
+# 🧹 Drops every member_item_drops partition and empties member_item_daily_counts
+queries.register("reset_drops", "SELECT reset_member_item_drops()")
+
+# ————————————————————————————————
+# 📬 Bulk dispatch progress
+# ————————————————————————————————
+# 🧹 /reset-clan-promo: a rerun promo with the same name starts from nothing
+queries.register("clear_dispatch", "DELETE FROM bulk_dispatch_items")
+queries.register(
+    "plan_dispatch",
+    """
+    INSERT INTO bulk_dispatch_items (job, user_id, action)
+    SELECT $1, user_id, action
+    FROM unnest($2::bigint[], $3::text[]) AS i (user_id, action)
+    ON CONFLICT (job, user_id, action) DO NOTHING
+    """,
+)
+queries.register(
+    "done_dispatch",
+    """
+    SELECT user_id, action
+    FROM bulk_dispatch_items
+    WHERE job = $1 AND status = 'done'
+    """,
+)
+queries.register(
+    "mark_dispatch",
+    """
+    UPDATE bulk_dispatch_items SET
+        status = $4,
+        attempts = attempts + $5,
+        last_error = $6,
+        updated_at = NOW()
+    WHERE job = $1 AND user_id = $2 AND action = $3
+    """,
+)
+
+# ————————————————————————————————
+# 🧭 Members / channels
+# ————————————————————————————————
+queries.register("member_channels", "SELECT user_id, channel_id FROM straymons_members")
+queries.register(
+    "straymons_channels", "SELECT user_id, channel_id FROM straymons_channels"
+)
+queries.register(
+    "upsert_member_channel",
+    """
+    INSERT INTO straymons_members (user_id, channel_id)
+    VALUES ($1, $2)
+    ON CONFLICT (user_id) DO UPDATE SET channel_id = EXCLUDED.channel_id
+    """,
+)
@@ -0,0 +1,58 @@
+import asyncio
+import time
+from typing import Optional
+
+# ————————————————————————————————
+# 🪣 Token Bucket – Paces calls to `rate` per second with bursts up to `capacity`
+# ————————————————————————————————
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0  # ⛔ Set by pause() after a 429
+
+    def refill(self, now: float):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    # ⏱️ Take a token if one is free; otherwise return how long to wait for one.
+    # `reserve` tokens are left untouched for higher-priority callers.
+    def try_acquire(self, now: Optional[float] = None, reserve: float = 0) -> float:
+        now = time.monotonic() if now is None else now
+        if now < self.blocked_until:
+            return self.blocked_until - now
+
+        self.refill(now)
+        needed = 1 + reserve
+        if self.tokens >= needed:
+            self.tokens -= 1
+            return 0.0
+        return (needed - self.tokens) / self.rate
+
+    async def acquire(self, reserve: float = 0) -> float:
+        """Wait for a token; returns the total time spent waiting."""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(reserve=reserve)
+            if delay <= 0:
+                return waited
+            waited += delay
+            await asyncio.sleep(delay)
+
+    # 💤 Stop handing out tokens for `seconds` (e.g. Retry-After from Discord)
+    def pause(self, seconds: float):
+        now = time.monotonic()
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = 0
+        self.updated = now
+
+    @property
+    def available(self) -> float:
+        self.refill(time.monotonic())
+        return self.tokens
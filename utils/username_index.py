@@ -0,0 +1,69 @@
+from typing import Dict, Optional, Set
+
+# ————————————————————————————————
+# 🔤 Username Index – Bidirectional user_id <-> username map with O(1) updates
+# ————————————————————————————————
+# Names are casefolded on the way in and on lookup. Two members can end up with
+# the same folded name; such names are tracked but never resolved, so a battle
+# win is not credited to the wrong member.
+
+
+class UsernameIndex:
+    def __init__(self):
+        self.names: Dict[int, str] = {}  # user_id -> folded username
+        self.owners: Dict[str, Set[int]] = {}  # folded username -> user_ids
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return name.casefold()
+
+    # ✏️ Add or rename a member (no-op if the name did not change)
+    def set(self, user_id: int, name: str) -> bool:
+        folded = self.normalize(name)
+        old = self.names.get(user_id)
+        if old == folded:
+            return False
+        if old is not None:
+            self._unlink(user_id, old)
+        self.names[user_id] = folded
+        self.owners.setdefault(folded, set()).add(user_id)
+        return True
+
+    # 🗑️ Remove a member from the index
+    def discard(self, user_id: int) -> bool:
+        old = self.names.pop(user_id, None)
+        if old is None:
+            return False
+        self._unlink(user_id, old)
+        return True
+
+    def _unlink(self, user_id: int, folded: str):
+        ids = self.owners.get(folded)
+        if ids is None:
+            return
+        ids.discard(user_id)
+        if not ids:
+            del self.owners[folded]
+
+    # 🔍 Resolve a username to a user_id; None if unknown or ambiguous
+    def lookup(self, name: str) -> Optional[int]:
+        ids = self.owners.get(self.normalize(name))
+        if not ids or len(ids) > 1:
+            return None
+        return next(iter(ids))
+
+    def is_ambiguous(self, name: str) -> bool:
+        return len(self.owners.get(self.normalize(name), ())) > 1
+
+    def get_name(self, user_id: int) -> Optional[str]:
+        return self.names.get(user_id)
+
+    def clear(self):
+        self.names.clear()
+        self.owners.clear()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.names
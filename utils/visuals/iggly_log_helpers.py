@@ -6,6 +6,8 @@ from enum import Enum
 import discord
 from discord.ext import commands
 
+from utils.send_scheduler import send_scheduler
+
 
 # 🩰 Iggly server context
 class IgglyContext(Enum):
@@ -68,7 +70,7 @@ def iggly_log(
                     full_message += f"\n```py\n{traceback.format_exc()}```"
                 if len(full_message) > 2000:
                     full_message = full_message[:1997] + "..."
-                bot.loop.create_task(channel.send(full_message))
+                send_scheduler.send_nowait(channel, full_message)
         except Exception:
             print("[💢 ERROR] Failed to send critical log to Discord:")
             traceback.print_exc()